@@ -0,0 +1,243 @@
+"""Render many resumes in one run, with a report line per input.
+
+`batch` takes glob patterns and a manifest of input files, and renders each
+input in every format it is given. With more than one job, the inputs are
+shared out to a pool of worker processes, which import the renderers once and
+render many inputs each. A failed input is recorded in the report, and the
+rest of the batch carries on.
+
+"""
+
+import glob
+import json
+import logging
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from pathlib import Path
+from typing import TextIO
+
+from resume_writer.rendering import (
+    OUTPUT_SUFFIXES,
+    output_paths,
+    parse_text_resume,
+    render_formats,
+)
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+from resume_writer.utils.resume_cache import ParsedResumeCache
+
+log = logging.getLogger(__name__)
+
+
+def batch_inputs(patterns: tuple[str, ...], manifest: Path | None) -> list[Path]:
+    """Return the input files of a batch, from glob patterns and a manifest.
+
+    Args:
+        patterns (tuple[str, ...]): Glob patterns of input files. "**" matches
+            any number of directories.
+        manifest (Path | None): A file listing one input file per line, or None.
+
+    Returns:
+        list[Path]: The input files, in order, without duplicates.
+
+    Notes:
+        1. Each pattern's matches are added in sorted order. A pattern which
+           matches nothing is logged.
+        2. Manifest lines are stripped. Blank lines and lines starting with "#"
+           are skipped, and relative paths are relative to the manifest.
+        3. Disk access: Lists the directories in patterns, and reads manifest.
+
+    """
+    _inputs = []
+    for _pattern in patterns:
+        _matches = sorted(glob.glob(_pattern, recursive=True))
+        if not _matches:
+            _msg = f"No input files match {_pattern}"
+            log.warning(_msg)
+        _inputs.extend(Path(_match) for _match in _matches)
+
+    if manifest is not None:
+        _lines = manifest.read_text(encoding="utf-8").splitlines()
+        _entries = [_line.strip() for _line in _lines]
+        _inputs.extend(
+            manifest.parent / _entry
+            for _entry in _entries
+            if _entry and not _entry.startswith("#")
+        )
+
+    return list(dict.fromkeys(_inputs))
+
+
+class BatchJob:
+    """What to render for every input file of a batch.
+
+    Attributes:
+        settings (ResumeRenderSettings): The rendering settings for every input.
+        resume_types (list[str]): The formats to render each input in.
+        output_dir (Path): The directory for the outputs, named after each input.
+        cache_dir (Path | None): The parsed resume cache directory, or None to
+            always parse.
+
+    """
+
+    def __init__(
+        self,
+        settings: ResumeRenderSettings,
+        resume_types: list[str],
+        output_dir: Path,
+        cache_dir: Path | None,
+    ):
+        """Initialize the job.
+
+        Args:
+            settings (ResumeRenderSettings): The rendering settings for every input.
+            resume_types (list[str]): The formats to render each input in.
+            output_dir (Path): The directory for the outputs.
+            cache_dir (Path | None): The parsed resume cache directory, or None.
+
+        Returns:
+            None
+
+        Notes:
+            1. Validate the settings and resume types, and store the arguments.
+
+        """
+        assert isinstance(settings, ResumeRenderSettings)
+        assert all(_type in OUTPUT_SUFFIXES for _type in resume_types)
+
+        self.settings = settings
+        self.resume_types = list(dict.fromkeys(resume_types))
+        self.output_dir = output_dir
+        self.cache_dir = cache_dir
+
+
+def render_batch_file(input_file: Path, job: BatchJob) -> dict:
+    """Parse one input file of a batch and render it in every format.
+
+    Args:
+        input_file (Path): The text resume to render.
+        job (BatchJob): What to render, and where.
+
+    Returns:
+        dict: A report record, with the input file, a status of "ok" or
+            "error", the output files or the error, and the seconds taken.
+
+    Notes:
+        1. The input is parsed, through the parsed resume cache if there is one.
+           Blocks the settings don't render are left until they are used.
+        2. It is rendered in each of the job's formats, one after another, to
+           the files given by output_paths.
+        3. Any exception is caught and recorded, so one bad file doesn't stop
+           the batch.
+        4. Disk access: Reads input_file and the cache, and writes the outputs.
+
+    """
+    _start = time.perf_counter()
+    _record = {"input": str(input_file)}
+    try:
+        _cache = None if job.cache_dir is None else ParsedResumeCache(job.cache_dir)
+        _resume = parse_text_resume(
+            str(input_file),
+            cache=_cache,
+            needed=job.settings.parse_plan(),
+        )
+        _outputs = output_paths(str(input_file), job.resume_types, job.output_dir)
+        _files = render_formats(_resume, job.settings, _outputs)
+    except Exception as _e:  # noqa: BLE001 - any bad input is reported, not raised
+        _msg = f"Failed to render {input_file}: {_e}"
+        log.warning(_msg)
+        _record.update(status="error", error=f"{type(_e).__name__}: {_e}")
+    else:
+        _record.update(status="ok", outputs=[str(_file) for _file in _files])
+
+    _record["seconds"] = round(time.perf_counter() - _start, 3)
+    return _record
+
+
+def _init_batch_worker(log_level: int) -> None:
+    """Set the log level of a batch worker process to the batch's."""
+    logging.getLogger().setLevel(log_level)
+
+
+def _batch_records(
+    inputs: list[Path],
+    job: BatchJob,
+    jobs: int,
+) -> Iterator[dict]:
+    """Render each input in turn, or in a process pool, yielding records as they finish."""
+    if jobs == 1:
+        for _input in inputs:
+            yield render_batch_file(_input, job)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_batch_worker,
+        initargs=(logging.getLogger().level,),
+    ) as _pool:
+        _futures = {
+            _pool.submit(render_batch_file, _input, job): _input for _input in inputs
+        }
+        for _future in as_completed(_futures):
+            try:
+                yield _future.result()
+            except BrokenProcessPool as _e:  # a worker process died
+                yield {
+                    "input": str(_futures[_future]),
+                    "status": "error",
+                    "error": f"{type(_e).__name__}: {_e}",
+                    "seconds": None,
+                }
+
+
+def run_batch(
+    inputs: list[Path],
+    job: BatchJob,
+    jobs: int,
+    report: TextIO,
+) -> int:
+    """Render every input of a batch, writing a JSON line per input to report.
+
+    Args:
+        inputs (list[Path]): The input files.
+        job (BatchJob): What to render for each input, and where.
+        jobs (int): The number of worker processes. 1 renders in this process.
+        report (TextIO): Where to write the report records, one JSON object per line.
+
+    Returns:
+        int: The number of inputs which failed.
+
+    Notes:
+        1. Inputs whose outputs would have the same names as an earlier input's
+           are not rendered, and are reported as errors.
+        2. The other inputs are rendered with render_batch_file. With more than
+           one job, each worker process imports the renderers once and renders
+           many inputs.
+        3. Each record is written and flushed as soon as its input finishes,
+           in the order they finish.
+        4. Disk access: Reads the inputs, writes the outputs.
+
+    """
+    assert jobs >= 1, "jobs must be at least 1"
+
+    _records: list[dict] = []
+    _stems: dict[str, Path] = {}
+    _to_render = []
+    for _input in inputs:
+        _first = _stems.setdefault(_input.stem, _input)
+        if _first == _input:
+            _to_render.append(_input)
+            continue
+        _error = f"Its outputs would overwrite those of {_first}"
+        _records.append(
+            {"input": str(_input), "status": "error", "error": _error, "seconds": 0.0},
+        )
+
+    _failed = 0
+    for _record in chain(_records, _batch_records(_to_render, job, jobs)):
+        report.write(json.dumps(_record) + "\n")
+        report.flush()
+        _failed += _record["status"] != "ok"
+    return _failed
@@ -1,26 +1,30 @@
+import asyncio
 import logging
+import os
+import sys
 from pathlib import Path
 
 import click
-import docx
 import rich
-import tomli
 
-from resume_writer.models.parsers import ParseContext
+from resume_writer import server, watch
+from resume_writer.batch import BatchJob, batch_inputs, run_batch
 from resume_writer.models.personal import Personal
 from resume_writer.models.resume import Resume
-from resume_writer.renderers.html_renderer import RenderResumeHtml
-from resume_writer.renderers.markdown_renderer import RenderResumeMarkdown
-from resume_writer.resume_render.ats.resume_main import (
-    RenderResume as AtsRenderResume,
-)
-from resume_writer.resume_render.basic.resume_main import (
-    RenderResume as BasicRenderResume,
-)
-from resume_writer.resume_render.plain.resume_main import (
-    RenderResume as PlainRenderResume,
+from resume_writer.rendering import (
+    DEFAULT_HTML_FILE,
+    DEFAULT_MARKDOWN_FILE,
+    DOCX_RENDERERS,
+    OUTPUT_SUFFIXES,
+    load_render_settings,
+    output_paths,
+    parse_text_resume,
+    render_formats,
+    render_to_stream,
 )
 from resume_writer.resume_render.render_settings import ResumeRenderSettings
+from resume_writer.utils.output_cache import DEFAULT_MAX_SIZE, RenderedOutputCache
+from resume_writer.utils.resume_cache import ParsedResumeCache, default_cache_dir
 from resume_writer.utils.resume_stats import DateStats
 
 logging.basicConfig(level=logging.DEBUG)
@@ -90,284 +94,545 @@ def dump_resume(resume: Resume) -> None:
     career_years_of_experience(resume)
 
 
-def load_settings(settings_file: str) -> dict:
-    """Load resume rendering settings from a TOML file.
+def render_outputs(
+    input_file: str,
+    output_file: str,
+    output_dir: Path | None,
+    resume_types: list[str],
+) -> dict[str, Path]:
+    """Return the output file for each resume type given to the render command.
 
     Args:
-        settings_file (str): Path to the TOML settings file.
+        input_file (str): Path to the input resume.
+        output_file (str): The --output-file option.
+        output_dir (Path | None): The --output-dir option.
+        resume_types (list[str]): The resume types to render, without duplicates.
 
     Returns:
-        dict: A dictionary containing the parsed settings.
+        dict[str, Path]: The output file for each resume type.
 
     Notes:
-        1. Converts the settings_file path to a Path object.
-        2. Opens the TOML file in binary mode.
-        3. Parses the TOML content using tomli.load.
-        4. Prints the parsed settings using rich.
-        5. Returns the settings dictionary.
-        6. Disk access: Reads from the settings_file path.
+        1. A single resume type without --output-dir is written where it always
+           has been: docx formats to output_file, HTML and Markdown to their
+           default files.
+        2. Otherwise every output is written under output_dir, or the directory
+           of output_file, which is created if needed.
+
     """
-    _settings_file = Path(settings_file)
+    resume_types = list(dict.fromkeys(resume_types))
 
-    with _settings_file.open("rb") as _f:
-        _toml = tomli.load(_f)
-        rich.print(_toml)
-    return _toml
+    if output_dir is None and len(resume_types) == 1:
+        _resume_type = resume_types[0]
+        if _resume_type in DOCX_RENDERERS:
+            return {_resume_type: Path(output_file)}
+        _default_outputs = {
+            "html": DEFAULT_HTML_FILE,
+            "markdown": DEFAULT_MARKDOWN_FILE,
+        }
+        return {_resume_type: _default_outputs[_resume_type]}
 
+    if output_dir is None:
+        output_dir = Path(output_file).parent
 
-def basic_render(
-    docx_doc: docx.document.Document,
-    resume: Resume,
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_paths(input_file, resume_types, output_dir)
+
+
+def fetch_cached_outputs(
+    input_file: str,
     settings: ResumeRenderSettings,
-) -> None:
-    """Render the resume using the basic rendering style.
+    outputs: dict[str, Path],
+    output_cache: RenderedOutputCache,
+) -> dict[str, str]:
+    """Put the cached outputs in place, and return the cache keys of the rest.
 
     Args:
-        docx_doc (docx.document.Document): The Word document object to render into.
-        resume (Resume): The resume object containing the content to render.
-        settings (ResumeRenderSettings): The rendering settings for the output.
+        input_file (str): Path to the input resume.
+        settings (ResumeRenderSettings): The rendering settings for the outputs.
+        outputs (dict[str, Path]): The output file for each resume type.
+        output_cache (RenderedOutputCache): The rendered output cache.
 
     Returns:
-        None
+        dict[str, str]: The cache key of each resume type that was not cached,
+            in the order of outputs.
 
     Notes:
-        1. Validates that all inputs are of the correct type.
-        2. Logs the start of the rendering process.
-        3. Creates a BasicRenderResume instance with the provided document, resume, and settings.
-        4. Calls the render method on the renderer to generate the document.
-        5. Logs the completion of the rendering process.
-        6. Disk access: Saves the rendered document to the output file path.
+        1. The input file is read, and a cache key is made for each resume type.
+        2. Each cached output is copied or hardlinked to its output file.
+        3. Disk access: Reads from the input_file path and the cache directory,
+           and writes the output files.
+
     """
-    assert isinstance(docx_doc, docx.document.Document)
-    assert isinstance(resume, Resume)
-    assert isinstance(settings, ResumeRenderSettings)
+    _resume_text = Path(input_file).read_text(encoding="utf-8")
 
-    log.info("Rendering simple resume")
-    _renderer = BasicRenderResume(document=docx_doc, resume=resume, settings=settings)
-    _renderer.render()
-    log.info("Render of basic resume complete")
+    _missing = {}
+    for _resume_type, _output_file in outputs.items():
+        _key = output_cache.key(_resume_text, settings, _resume_type)
+        if output_cache.fetch(_key, _output_file):
+            _msg = f"Copied cached {_resume_type} resume to {_output_file}"
+            log.info(_msg)
+        else:
+            _missing[_resume_type] = _key
+    return _missing
 
 
-def ats_render(
-    docx_doc: docx.document.Document,
-    resume: Resume,
-    settings: ResumeRenderSettings,
-) -> None:
-    """Render the resume using the ATS (Applicant Tracking System) rendering style.
+class DefaultCommandGroup(click.Group):
+    """Click group which runs a default command when no command is named.
 
-    Args:
-        docx_doc (docx.document.Document): The Word document object to render into.
-        resume (Resume): The resume object containing the content to render.
-        settings (ResumeRenderSettings): The rendering settings for the output.
+    This keeps `main.py INPUT_FILE [OPTIONS]` working alongside subcommands.
 
-    Returns:
-        None
+    Attributes:
+        default_command (str): The name of the command to run by default.
 
-    Notes:
-        1. Validates that all inputs are of the correct type.
-        2. Logs the start of the rendering process.
-        3. Creates an AtsRenderResume instance with the provided document, resume, and settings.
-        4. Calls the render method on the renderer to generate the document.
-        5. Logs the completion of the rendering process.
-        6. Disk access: Saves the rendered document to the output file path.
     """
-    assert isinstance(docx_doc, docx.document.Document)
-    assert isinstance(resume, Resume)
-    assert isinstance(settings, ResumeRenderSettings)
 
-    log.info("Rendering simple resume")
-    _renderer = AtsRenderResume(document=docx_doc, resume=resume, settings=settings)
-    _renderer.render()
-    log.info("Render of simple resume complete")
+    default_command = "render"
 
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Insert the default command name when the first argument is not a command.
 
-def plain_render(
-    docx_doc: docx.document.Document,
-    resume: Resume,
-    settings: ResumeRenderSettings,
-) -> None:
-    """Render the resume using the plain (minimalist) rendering style.
+        Args:
+            ctx (click.Context): The click context.
+            args (list[str]): The command line arguments.
 
-    Args:
-        docx_doc (docx.document.Document): The Word document object to render into.
-        resume (Resume): The resume object containing the content to render.
-        settings (ResumeRenderSettings): The rendering settings for the output.
+        Returns:
+            list[str]: The remaining arguments, as returned by click.Group.parse_args.
 
-    Returns:
-        None
+        Notes:
+            1. If the first argument is neither a command nor a help option,
+               the default command name is inserted before it.
+            2. The arguments are parsed by click.Group.
 
-    Notes:
-        1. Validates that all inputs are of the correct type.
-        2. Logs the start of the rendering process.
-        3. Creates a PlainRenderResume instance with the provided document, resume, and settings.
-        4. Calls the render method on the renderer to generate the document.
-        5. Logs the completion of the rendering process.
-        6. Disk access: Saves the rendered document to the output file path.
-    """
-    assert isinstance(docx_doc, docx.document.Document)
-    assert isinstance(resume, Resume)
-    assert isinstance(settings, ResumeRenderSettings)
+        """
+        if (
+            args
+            and args[0] not in self.commands
+            and args[0] not in ctx.help_option_names
+        ):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
 
-    log.info("Rendering plain resume")
-
-    _renderer = PlainRenderResume(
-        document=docx_doc,
-        resume=resume,
-        settings=settings,
-    )
-    _renderer.render()
 
-    log.info("Render of plain resume complete")
-
-
-def html_render(
-    resume: Resume,
-    settings: ResumeRenderSettings,
+def check_resume_types(
+    resume_types: tuple[str, ...],
+    output_dir: Path | None,
+    *,
+    to_stdout: bool,
 ) -> None:
-    """Render the resume as an HTML file.
+    """Check the --resume-type options given to the render command.
 
     Args:
-        resume (Resume): The resume object containing the content to render.
-        settings (ResumeRenderSettings): The rendering settings for the output.
+        resume_types (tuple[str, ...]): The --resume-type options.
+        output_dir (Path | None): The --output-dir option.
+        to_stdout (bool): Whether --output-file is "-".
 
     Returns:
         None
 
     Notes:
-        1. Validates that all inputs are of the correct type.
-        2. Logs the start of the HTML rendering process.
-        3. Creates a RenderResumeHtml instance with the resume and settings.
-        4. Calls the render method to generate the HTML content.
-        5. Saves the rendered HTML to a file at "data/html_resume.html".
-        6. Logs the completion of the rendering process.
-        7. Disk access: Writes to the file "data/html_resume.html".
-    """
-    assert isinstance(resume, Resume)
-    assert isinstance(settings, ResumeRenderSettings)
+        1. At least one resume type is required.
+        2. Writing to stdout takes exactly one resume type, and no --output-dir.
+        3. Raises click.UsageError if either check fails.
 
-    log.info("Rendering HTML resume")
+    """
+    if not resume_types:
+        raise click.UsageError("At least one --resume-type is required.")
+    if to_stdout and (len(set(resume_types)) > 1 or output_dir is not None):
+        raise click.UsageError(
+            "--output-file - takes a single --resume-type and no --output-dir.",
+        )
 
-    _html_renderer = RenderResumeHtml(
-        resume=resume,
-        settings=settings,
-    )
-    _html_renderer.render()
-    _html_renderer.save(Path("data/html_resume.html"))
 
-    log.info("Render of HTML resume complete.")
+@click.group(cls=DefaultCommandGroup)
+def main() -> None:
+    """Convert text resumes to .docx, HTML and Markdown files."""
 
 
-def markdown_render(
-    resume: Resume,
-    settings: ResumeRenderSettings,
+@main.command()
+@click.argument("input_file", type=click.Path(exists=True))
+@click.option(
+    "--output-file",
+    type=click.Path(allow_dash=True),
+    default="data/resume.docx",
+    help="The file for a single .docx --resume-type. "
+    "Use - to write a single --resume-type to stdout.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory for the outputs, named after the input file and resume type. "
+    "Used when more than one --resume-type is given. "
+    "Defaults to the directory of --output-file.",
+)
+@click.option(
+    "--settings-file",
+    type=click.Path(exists=True),
+)
+@click.option(
+    "--resume-type",
+    "resume_types",
+    type=click.Choice(list(OUTPUT_SUFFIXES)),
+    multiple=True,
+    help="The format to render. May be given more than once.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of formats to render at once.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_cache_dir,
+    help="Directory for cached parsed resumes and rendered outputs.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always parse and render the input file, and do not update the caches.",
+)
+@click.option(
+    "--output-cache-size",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MAX_SIZE // (1024 * 1024),
+    help="Megabytes of rendered outputs to cache. The least recently used are "
+    "removed first. 0 turns the output cache off.",
+)
+@click.option(
+    "--hardlink",
+    is_flag=True,
+    help="Hardlink cached outputs into place instead of copying them. "
+    "Hardlinked outputs are read-only.",
+)
+@click.option(
+    "--coalesce-runs",
+    is_flag=True,
+    help="Merge adjacent .docx runs with the same formatting. "
+    "Overrides the coalesce_runs setting.",
+)
+@click.option(
+    "--deterministic",
+    is_flag=True,
+    help="Save .docx files with pinned timestamps, so the same input and settings "
+    "always give the same bytes. Overrides the deterministic_docx setting.",
+)
+@click.option(
+    "--fast-docx",
+    is_flag=True,
+    help="Write .docx runs directly as XML. The output is the same, only faster. "
+    "Overrides the fast_docx setting.",
+)
+@click.option(
+    "--lazy-parse",
+    is_flag=True,
+    help="Parse the blocks of each role and project only when they are rendered. "
+    "Overrides the lazy_parse setting.",
+)
+def render(  # noqa: PLR0913
+    input_file: str,
+    output_file: str,
+    output_dir: Path | None,
+    settings_file: str,
+    resume_types: tuple[str, ...],
+    jobs: int,
+    cache_dir: Path,
+    output_cache_size: int,
+    *,
+    no_cache: bool,
+    hardlink: bool,
+    coalesce_runs: bool,
+    deterministic: bool,
+    fast_docx: bool,
+    lazy_parse: bool,
 ) -> None:
-    """Render the resume as a Markdown file.
-
-    Args:
-        resume (Resume): The resume object containing the content to render.
-        settings (ResumeRenderSettings): The rendering settings for the output.
+    """Convert a text resume to .docx, HTML or Markdown files.
 
-    Returns:
-        None
-
-    Notes:
-        1. Validates that all inputs are of the correct type.
-        2. Logs the start of the Markdown rendering process.
-        3. Creates a RenderResumeMarkdown instance with the resume and settings.
-        4. Calls the render method to generate the Markdown content.
-        5. Saves the rendered Markdown to a file at "data/markdown_resume.md".
-        6. Logs the completion of the rendering process.
-        7. Disk access: Writes to the file "data/markdown_resume.md".
+    The resume is parsed once, and rendered in every --resume-type given.
+    Outputs rendered before from the same input and settings are copied from
+    the cache instead.
     """
-    assert isinstance(resume, Resume)
-    assert isinstance(settings, ResumeRenderSettings)
+    _to_stdout = output_file == "-"
+    check_resume_types(resume_types, output_dir, to_stdout=_to_stdout)
+
+    _render_settings = load_render_settings(settings_file, echo=not _to_stdout)
+    _render_settings.fast_docx = fast_docx or _render_settings.fast_docx
+    _render_settings.lazy_parse = lazy_parse or _render_settings.lazy_parse
+    _render_settings.coalesce_runs = coalesce_runs or _render_settings.coalesce_runs
+    _render_settings.deterministic_docx = (
+        deterministic or _render_settings.deterministic_docx
+    )
 
-    log.info("Rendering Markdown resume")
+    _cache = None if no_cache else ParsedResumeCache(cache_dir=cache_dir)
+
+    if _to_stdout:
+        _resume = parse_text_resume(
+            input_file,
+            cache=_cache,
+            needed=_render_settings.parse_plan(),
+        )
+        render_to_stream(resume_types[0], _resume, _render_settings, sys.stdout.buffer)
+        return
+
+    _output_cache = RenderedOutputCache(
+        cache_dir,
+        max_size=0 if no_cache else output_cache_size * 1024 * 1024,
+        hardlink=hardlink,
+    )
+    _outputs = render_outputs(input_file, output_file, output_dir, list(resume_types))
+    _missing = fetch_cached_outputs(
+        input_file,
+        _render_settings,
+        _outputs,
+        _output_cache,
+    )
+    if not _missing:
+        return
 
-    _markdown_renderer = RenderResumeMarkdown(
-        resume=resume,
-        settings=settings,
+    _resume = parse_text_resume(
+        input_file,
+        cache=_cache,
+        needed=_render_settings.parse_plan(),
     )
-    _markdown_renderer.render()
-    _markdown_renderer.save(Path("data/markdown_resume.md"))
+    _missing_outputs = {_type: _outputs[_type] for _type in _missing}
+    _files = render_formats(_resume, _render_settings, _missing_outputs, jobs=jobs)
+    for _resume_type, _output_file in zip(_missing, _files, strict=True):
+        _output_cache.store(_missing[_resume_type], _output_file)
+        _msg = f"Saved resume to {_output_file}"
+        log.info(_msg)
 
-    log.info("Render of Markdown resume complete.")
+    rich.print(_resume)
 
 
-def parse_text_resume(input_file: str) -> Resume:
-    """Parse a text-based resume file and convert it into a Resume object.
+@main.command("clear-cache")
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_cache_dir,
+    help="Directory for cached parsed resumes and rendered outputs.",
+)
+def clear_cache(cache_dir: Path) -> None:
+    """Remove all cached parsed resumes and rendered outputs."""
+    _count = ParsedResumeCache(cache_dir=cache_dir).clear()
+    _outputs = RenderedOutputCache(cache_dir).clear()
+    rich.print(
+        f"Removed {_count} cached resumes and {_outputs} cached outputs from {cache_dir}",
+    )
 
-    Args:
-        input_file (str): Path to the text file containing the resume content.
 
-    Returns:
-        Resume: The parsed Resume object.
+@main.command()
+@click.argument("patterns", nargs=-1)
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="A file listing one input file per line.",
+)
+@click.option(
+    "--settings-file",
+    type=click.Path(exists=True),
+    required=True,
+)
+@click.option(
+    "--resume-type",
+    "resume_types",
+    type=click.Choice(list(OUTPUT_SUFFIXES)),
+    multiple=True,
+    required=True,
+    help="The format to render. May be given more than once.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    required=True,
+    help="Directory for the outputs, named after each input file and resume type.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=lambda: os.cpu_count() or 1,
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--report",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="JSONL file for a record of each input. "
+    "Defaults to batch_report.jsonl in --output-dir.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_cache_dir,
+    help="Directory for cached parsed resumes.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always parse the input files, and do not update the cache.",
+)
+def batch(  # noqa: PLR0913
+    patterns: tuple[str, ...],
+    manifest: Path | None,
+    settings_file: str,
+    resume_types: tuple[str, ...],
+    output_dir: Path,
+    jobs: int,
+    report: Path | None,
+    cache_dir: Path,
+    *,
+    no_cache: bool,
+) -> None:
+    """Render many text resumes, given as glob PATTERNS or a --manifest.
 
-    Notes:
-        1. Opens the input file and reads its content.
-        2. Splits the content into lines while preserving line endings.
-        3. Creates a ParseContext object with the lines and initial line number.
-        4. Parses the resume content using the Resume.parse method.
-        5. Returns the resulting Resume object.
-        6. Disk access: Reads from the input_file path.
+    Every input is rendered in every --resume-type. A failed input is recorded
+    in the report, and the rest of the batch carries on.
     """
-    with open(input_file) as _f:
-        _resume_text = _f.read()
-        _resume_lines = _resume_text.splitlines(keepends=True)
+    _inputs = batch_inputs(patterns, manifest)
+    if not _inputs:
+        raise click.UsageError("No input files were given.")
+
+    _job = BatchJob(
+        load_render_settings(settings_file, echo=False),
+        list(resume_types),
+        output_dir,
+        None if no_cache else cache_dir,
+    )
+    output_dir.mkdir(parents=True, exist_ok=True)
+    _report = report or output_dir / "batch_report.jsonl"
+    with _report.open("w", encoding="utf-8") as _f:
+        _failed = run_batch(_inputs, _job, jobs, _f)
+
+    rich.print(
+        f"Rendered {len(_inputs) - _failed} of {len(_inputs)} resumes, "
+        f"{_failed} failed. Report: {_report}",
+    )
+    if _failed:
+        sys.exit(1)
 
-    _parse_context = ParseContext(lines=_resume_lines, doc_line_num=0)
 
-    _resume = Resume.parse(_parse_context)
-    return _resume
+@main.command()
+@click.option("--host", default="127.0.0.1", help="Address to listen on.")
+@click.option(
+    "--port",
+    type=click.IntRange(min=0),
+    default=8765,
+    help="Port to listen on.",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Listen on this Unix socket instead of --host and --port.",
+)
+@click.option(
+    "--settings-file",
+    "settings_files",
+    multiple=True,
+    help="A settings profile, as NAME=PATH, or PATH to name it after the file. "
+    "May be given more than once.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=lambda: os.cpu_count() or 1,
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_cache_dir,
+    help="Directory for cached parsed resumes.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Parse every new resume, and do not update the cache.",
+)
+def serve(  # noqa: PLR0913
+    host: str,
+    port: int,
+    socket_path: Path | None,
+    settings_files: tuple[str, ...],
+    jobs: int,
+    cache_dir: Path,
+    *,
+    no_cache: bool,
+) -> None:
+    """Serve render requests over local HTTP, keeping caches warm between them.
+
+    POST a JSON object with "resume", "resume_type", and optionally "profile"
+    and "settings" to /render, and the rendered document is returned.
+    """
+    _server = server.RenderServer(
+        server.load_profiles(settings_files),
+        None if no_cache else cache_dir,
+        jobs,
+    )
+    try:
+        asyncio.run(server.serve_forever(_server, host, port, socket_path))
+    except KeyboardInterrupt:
+        rich.print("Stopped serving.")
 
 
-@click.command()
-@click.argument("input_file", type=click.Path(exists=True))
-@click.option("--output-file", type=click.Path(), default="data/resume.docx")
+@main.command("watch")
+@click.argument(
+    "input_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
 @click.option(
     "--settings-file",
-    type=click.Path(exists=True),
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    required=True,
 )
 @click.option(
     "--resume-type",
-    type=click.Choice(["ats", "basic", "plain", "html", "markdown"]),
-    default="simple",
+    "resume_types",
+    type=click.Choice(list(OUTPUT_SUFFIXES)),
+    multiple=True,
+    default=["plain"],
+    help="The format to render. May be given more than once.",
 )
-def main(
-    input_file: str,
+@click.option(
+    "--output-file",
+    default="data/resume.docx",
+    help="The file for a single .docx --resume-type.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory for the outputs, named after the input file and resume type.",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.01),
+    default=0.25,
+    help="Seconds between checks of the input and settings files.",
+)
+def watch_command(  # noqa: PLR0913
+    input_file: Path,
+    settings_file: Path,
+    resume_types: tuple[str, ...],
     output_file: str,
-    settings_file: str,
-    resume_type: str,
+    output_dir: Path | None,
+    interval: float,
 ) -> None:
-    """Convert a text resume to a .docx file with specified rendering style."""
-    _settings = load_settings(settings_file)
-    _render_settings = ResumeRenderSettings()
-    _render_settings.update_from_dict(_settings["resume"]["render"])
-
-    _resume = parse_text_resume(input_file)
-
-    if resume_type == "basic":
-        _docx_doc = docx.Document()
-        basic_render(_docx_doc, _resume, _render_settings)
-        _docx_doc.save(output_file)
-    elif resume_type == "plain":
-        _docx_doc = docx.Document()
-        plain_render(_docx_doc, _resume, _render_settings)
-        _docx_doc.save(output_file)
-    elif resume_type == "ats":
-        _docx_doc = docx.Document()
-        ats_render(_docx_doc, _resume, _render_settings)
-        _docx_doc.save(output_file)
-    elif resume_type == "html":
-        html_render(_resume, _render_settings)
-    elif resume_type == "markdown":
-        markdown_render(resume=_resume, settings=_render_settings)
-    else:
-        raise ValueError(f"Unknown resume type: {resume_type}")
-
-    log.info(f"Saved resume to {output_file}")
+    """Re-render INPUT_FILE whenever it or the settings file is saved.
 
-    rich.print(_resume)
+    Only the sections of the resume which changed are parsed again, and the
+    outputs are only re-rendered if the settings render those sections.
+    Stop with Ctrl-C.
+    """
+    _outputs = render_outputs(
+        str(input_file),
+        output_file,
+        output_dir,
+        list(resume_types),
+    )
+    _watcher = watch.ResumeWatcher(input_file, settings_file, _outputs)
+    rich.print(f"Watching {input_file} and {settings_file}, Ctrl-C to stop.")
+    try:
+        watch.watch(_watcher, interval)
+    except KeyboardInterrupt:
+        rich.print("Stopped watching.")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,12 @@
 import logging
 from datetime import datetime
 
-import dateparser
-
 from resume_writer.models.parsers import (
     LabelBlockParse,
     MultiBlockParse,
     ParseContext,
 )
+from resume_writer.utils.date_parser import parse_date
 
 log = logging.getLogger(__name__)
 
@@ -52,8 +51,8 @@ class Certification(LabelBlockParse):
 
         Notes:
             1. Validate that all inputs are of the correct type.
-            2. If `issued` is a string, parse it into a datetime object using dateparser with PREFER_DAY_OF_MONTH set to "first".
-            3. If `expires` is a string, parse it into a datetime object using dateparser with PREFER_DAY_OF_MONTH set to "first".
+            2. If `issued` is a string, parse it into a datetime object using parse_date.
+            3. If `expires` is a string, parse it into a datetime object using parse_date.
             4. Assign the parsed or original values to instance attributes.
 
         """
@@ -66,20 +65,10 @@ class Certification(LabelBlockParse):
 
         # If the issued date is a string, convert it to a datetime object
         if isinstance(issued, str):
-            issued = dateparser.parse(
-                issued,
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",
-                },
-            )
+            issued = parse_date(issued)
 
         if isinstance(expires, str):
-            expires = dateparser.parse(
-                expires,
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",
-                },
-            )
+            expires = parse_date(expires)
 
         self.issuer: str | None = issuer
         self.name: str = name
@@ -1,8 +1,6 @@
 import logging
 from datetime import datetime
 
-import dateparser
-
 from resume_writer.models.parsers import (
     BasicBlockParse,
     LabelBlockParse,
@@ -10,6 +8,7 @@ from resume_writer.models.parsers import (
     ParseContext,
     ParseError,
 )
+from resume_writer.utils.date_parser import parse_date
 
 log = logging.getLogger(__name__)
 
@@ -44,7 +43,7 @@ class Degree(LabelBlockParse):
         3. Validate that degree, major, and gpa are either strings or None.
         4. Validate that start_date and end_date are either strings, datetime objects, or None.
         5. If end_date is provided but start_date is not, raise a ParseError.
-        6. Parse start_date and end_date from strings into datetime objects using dateparser.
+        6. Parse start_date and end_date from strings into datetime objects using parse_date.
         7. If both start_date and end_date are provided, ensure start_date is not after end_date.
         8. Store the parsed values in the object's attributes.
 
@@ -83,19 +82,9 @@ class Degree(LabelBlockParse):
         self.school = school
         self.degree = degree
         if isinstance(start_date, str):
-            start_date = dateparser.parse(
-                start_date,
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",
-                },
-            )
+            start_date = parse_date(start_date)
         if isinstance(end_date, str):
-            end_date = dateparser.parse(
-                end_date,
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",
-                },
-            )
+            end_date = parse_date(end_date)
 
         if start_date and end_date and start_date > end_date:
             raise ParseError(
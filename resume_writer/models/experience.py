@@ -1,7 +1,6 @@
 import logging
 from datetime import datetime
 
-import dateparser
 import pytz
 
 from resume_writer.models.parsers import (
@@ -13,6 +12,7 @@ from resume_writer.models.parsers import (
     ParseError,
     TextBlockParse,
 )
+from resume_writer.utils.date_parser import parse_date
 
 log = logging.getLogger(__name__)
 
@@ -205,7 +205,7 @@ class RoleBasics(LabelBlockParse):
             3. Validate that start_date is either a string or datetime.
             4. Validate that end_date is a string, datetime, or None.
             5. Validate that all other fields are appropriate types.
-            6. Parse start_date and end_date using dateparser with UTC timezone.
+            6. Parse start_date and end_date using parse_date, converted to UTC.
             7. Store all fields as instance attributes.
 
         """
@@ -237,21 +237,9 @@ class RoleBasics(LabelBlockParse):
 
         self.company = company
         if isinstance(start_date, str):
-            start_date = dateparser.parse(
-                start_date,
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",
-                    "TIMEZONE": "UTC",
-                },
-            ).astimezone(pytz.utc)
+            start_date = parse_date(start_date).astimezone(pytz.utc)
         if isinstance(end_date, str):
-            end_date = dateparser.parse(
-                end_date,
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",
-                    "TIMEZONE": "UTC",
-                },
-            ).astimezone(pytz.utc)
+            end_date = parse_date(end_date).astimezone(pytz.utc)
 
         self.start_date = start_date
         self.end_date = end_date
@@ -566,7 +554,7 @@ class ProjectOverview(LabelBlockParse):
             2. Validate that url and url_description are strings or None.
             3. Validate that start_date and end_date are strings, datetimes, or None.
             4. Validate that parse_context is a ParseContext object.
-            5. Parse start_date and end_date using dateparser with UTC timezone.
+            5. Parse start_date and end_date using parse_date, converted to UTC.
             6. Store all fields as instance attributes.
 
         """
@@ -593,19 +581,9 @@ class ProjectOverview(LabelBlockParse):
         self.url = url
         self.url_description = url_description
         if isinstance(start_date, str):
-            start_date = dateparser.parse(
-                start_date,
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",
-                },
-            ).astimezone(pytz.utc)
+            start_date = parse_date(start_date).astimezone(pytz.utc)
         if isinstance(end_date, str):
-            end_date = dateparser.parse(
-                end_date,
-                settings={
-                    "PREFER_DAY_OF_MONTH": "first",
-                },
-            ).astimezone(pytz.utc)
+            end_date = parse_date(end_date).astimezone(pytz.utc)
         self.start_date = start_date
         self.end_date = end_date
 
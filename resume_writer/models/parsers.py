@@ -1,10 +1,14 @@
 import logging
+from collections.abc import Iterator
 from typing import TypeVar
 
 T = TypeVar("T")
 
 log = logging.getLogger(__name__)
 
+# bump when parsing or the model classes change, so cached models are discarded
+PARSER_VERSION = "1"
+
 
 class ParseError(Exception):
     """Exception raised when parsing fails.
@@ -24,17 +28,54 @@ class ParseError(Exception):
     """
 
 
+def _view_line(line: str, depth: int) -> str | None:
+    """Normalize a raw buffer line for a view nested `depth` sections deep.
+
+    Args:
+        line (str): The raw line from the shared line buffer.
+        depth (int): The number of section levels between the view and the buffer.
+
+    Returns:
+        str | None: The line as the view presents it, or None if the view skips it.
+
+    Notes:
+        1. For each nesting level, surrounding spaces are stripped.
+        2. If the stripped line is empty, the line is not part of the view.
+        3. A leading "#" is removed, so subheaders move up one level.
+        4. The normalized line is returned.
+
+    """
+    for _ in range(depth):
+        line = line.strip(" ")
+        if not line:
+            return None
+        if line.startswith("#"):
+            # this is a subheader, we want the line, but not the extra level
+            line = line[1:]
+    return line
+
+
 class ParseContext:
     """Tracking context while parsing.
 
+    A ParseContext is a view over a shared line buffer. Child sections are
+    created with `view`, which records offsets into the same buffer instead
+    of copying lines.
+
     Attributes:
-        lines (list[str]): The list of lines to be parsed.
+        lines (list[str]): The lines in the view, as presented to parsers.
         line_num (int): The current line number in the parsing process (1-indexed).
         doc_line_num (int): The current line number in the original document.
+        start (int): The offset of the first buffer line in the view.
+        stop (int): The offset after the last buffer line in the view.
+        depth (int): The number of section levels between the view and the buffer.
 
     Args:
         lines: A list of strings representing the lines to be parsed.
         doc_line_num: The current line number in the document (used for tracking).
+        start: The offset of the first line in `lines` to include.
+        stop: The offset after the last line in `lines` to include, or None for the end.
+        depth: The number of section levels between the view and `lines`.
 
     Returns:
         An initialized ParseContext object.
@@ -45,19 +86,36 @@ class ParseContext:
         3. The doc_line_num is initialized to the provided value.
         4. The ParseContext supports iteration using __iter__ and __next__.
         5. The __next__ method returns one line at a time, advancing line_num and doc_line_num.
-        6. The __len__ method returns the number of lines in the context.
-        7. The append method adds a string to the lines list.
-        8. The clear method empties the lines list and resets line_num.
+        6. Lines are normalized on read for the view's depth; blank nested lines are skipped.
+        7. The __len__ method returns the number of lines in the view.
+        8. The view method returns a child context over part of the same buffer.
 
     """
 
-    def __init__(self, lines: list[str], doc_line_num: int):
+    def __init__(
+        self,
+        lines: list[str],
+        doc_line_num: int,
+        start: int = 0,
+        stop: int | None = None,
+        depth: int = 0,
+    ):
         """Initialize ParseContext class instance."""
         assert isinstance(lines, list), "lines should be a list"
 
-        self.lines = lines
+        if stop is None:
+            stop = len(lines)
+
+        assert 0 <= start <= stop <= len(lines), "start and stop should be in range"
+        assert depth >= 0, "depth should not be negative"
+
+        self._buffer = lines
+        self.start = start
+        self.stop = stop
+        self.depth = depth
         self.line_num = 1
         self.doc_line_num = doc_line_num
+        self._length: int | None = None
 
     def __iter__(self):
         """Return iterator."""
@@ -65,28 +123,64 @@ class ParseContext:
 
     def __next__(self) -> str:
         """Return next line."""
-        if self.line_num >= len(self.lines) + 1:
-            raise StopIteration
+        while self.offset < self.stop:
+            _line = _view_line(self._buffer[self.offset], self.depth)
+            self.line_num += 1
+            self.doc_line_num += 1
+            if _line is not None:
+                return _line
 
-        # humans start at line 1, but python starts at line 0
-        _line = self.lines[self.line_num - 1]
-        self.line_num += 1
-        self.doc_line_num += 1
-        return _line
+        raise StopIteration
 
     def __len__(self) -> int:
         """Return number of lines in the context."""
-        return len(self.lines)
+        if self._length is None:
+            self._length = sum(1 for _ in self._lines())
+        return self._length
 
-    def append(self, line: str) -> None:
-        """Add a line to the list of lines."""
-        assert isinstance(line, str), "line should be a string"
-        self.lines.append(line)
+    @property
+    def offset(self) -> int:
+        """Return the buffer offset of the next line to be read."""
+        # humans start at line 1, but python starts at line 0
+        return self.start + self.line_num - 1
 
-    def clear(self) -> None:
-        """Clear the list of lines."""
-        self.lines.clear()
-        self.line_num = 1
+    @property
+    def lines(self) -> list[str]:
+        """Return the lines in the view, as presented to parsers."""
+        return list(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        """Yield the lines in the view without advancing the context."""
+        for _offset in range(self.start, self.stop):
+            _line = _view_line(self._buffer[_offset], self.depth)
+            if _line is not None:
+                yield _line
+
+    def view(self, start: int, stop: int, doc_line_num: int) -> "ParseContext":
+        """Return a child context for a section of this context.
+
+        Args:
+            start (int): The buffer offset of the first line of the section.
+            stop (int): The buffer offset after the last line of the section.
+            doc_line_num (int): The document line number of the section.
+
+        Returns:
+            ParseContext: A context sharing this context's buffer, one level deeper.
+
+        Notes:
+            1. The offsets are validated to be within this context.
+            2. A new ParseContext is created over the same buffer; no lines are copied.
+
+        """
+        assert self.start <= start <= stop <= self.stop, "view should be in range"
+
+        return ParseContext(
+            lines=self._buffer,
+            doc_line_num=doc_line_num,
+            start=start,
+            stop=stop,
+            depth=self.depth + 1,
+        )
 
 
 class ListBlockParse:
@@ -268,6 +362,29 @@ class LabelBlockParse:
         return cls(**_init_kwargs)
 
 
+class DeferredBlock:
+    """A block kept as its ParseContext, to be parsed the first time it is used.
+
+    Attributes:
+        block_class (type): The class to parse the block with.
+        parse_context (ParseContext): The view of the block's lines.
+
+    """
+
+    def __init__(self, block_class: type, parse_context: ParseContext):
+        """Initialize the deferred block."""
+        assert isinstance(parse_context, ParseContext), (
+            "parse_context must be a ParseContext"
+        )
+        self.block_class = block_class
+        self.parse_context = parse_context
+
+    def parse(self) -> object:
+        """Parse the block with its class."""
+        log.debug(f"Parsing deferred {self.block_class.__name__} block")
+        return self.block_class.parse(self.parse_context)
+
+
 class BasicBlockParse:
     """Mixin for blocks containing a mix of top level blocks.
 
@@ -309,16 +426,20 @@ class BasicBlockParse:
         4. Each line in the parse_context is processed:
             a. If the line starts with "# ", it is a section header, and _section_header is set.
             b. If there is no section header yet, the line is logged as unexpected.
-            c. If the line does not start with "#", it is added to the current section.
-        5. The section header is used to store the block context.
+            c. Otherwise, the line belongs to the current section.
+        5. Each section is stored as a view of the parse_context, from its header
+           to the next header. No lines are copied.
         6. After processing, the block contexts are converted to blocks using parse_blocks.
         7. The kwargs_parse method is called to process the blocks.
         8. The class is instantiated with the parsed kwargs.
+        9. If a `needed` plan is given, blocks which aren't in it are not
+           parsed. Each is kept as a DeferredBlock, and parsed the first time
+           its attribute is read.
 
     """
 
     @classmethod
-    def parse_blocks(cls: T, parse_context: ParseContext) -> dict[str, str]:
+    def parse_blocks(cls: T, parse_context: ParseContext) -> dict[str, ParseContext]:
         """Parse the block of lines into a dictionary of blocks."""
         assert isinstance(
             parse_context,
@@ -328,6 +449,8 @@ class BasicBlockParse:
         _blocks: dict = {}
 
         _section_header = None
+        _section_start = parse_context.offset
+        _section_doc_line_num = parse_context.doc_line_num
 
         # iterate over the lines in the block
         for _block_line in parse_context:
@@ -337,6 +460,14 @@ class BasicBlockParse:
 
             # if the line starts with "# ", it's a section header
             if _block_line.startswith("# "):
+                if _section_header is not None:
+                    # the previous section ends at this header
+                    _blocks[_section_header] = parse_context.view(
+                        start=_section_start,
+                        stop=parse_context.offset - 1,
+                        doc_line_num=_section_doc_line_num,
+                    )
+
                 _section_header = _block_line[1:].strip().lower()
                 assert isinstance(
                     _section_header,
@@ -345,25 +476,22 @@ class BasicBlockParse:
                 assert _section_header != "", "_section_header should not be empty"
 
                 log.debug(f"Found section header: {_section_header}")
-                _blocks[_section_header] = ParseContext(
-                    lines=[],
-                    doc_line_num=parse_context.doc_line_num,
-                )
+                _section_start = parse_context.offset
+                _section_doc_line_num = parse_context.doc_line_num
                 continue
 
             if _section_header is None:
                 # we haven't found a section header yet
                 # this shouldn't happen, but we'll ignore it for now
                 log.info(f"Found line without section header: {_block_line}")
-                continue
 
-            # if the line doesn't start with "#", it's a line of text
-            if _block_line and not _block_line.startswith("# "):
-                if _block_line.startswith("#"):
-                    # this is a subheader, add it without the hash
-                    _block_line = _block_line[1:]
-                    log.debug(f"Found subheader: {_block_line.strip()}")
-                _blocks[_section_header].append(_block_line)
+        # the last section ends with the block
+        if _section_header is not None:
+            _blocks[_section_header] = parse_context.view(
+                start=_section_start,
+                stop=parse_context.offset,
+                doc_line_num=_section_doc_line_num,
+            )
 
         # check up on the values we've got so far
         assert isinstance(_blocks, dict), "_blocks should be a dictionary"
@@ -377,10 +505,15 @@ class BasicBlockParse:
         return _blocks
 
     @classmethod
-    def kwargs_parse(cls: T, parse_context: ParseContext) -> dict[str, str]:
+    def kwargs_parse(
+        cls: T,
+        parse_context: ParseContext,
+        needed: dict | None = None,
+    ) -> dict[str, str]:
         """Parse the block of lines into an dict.
 
-        Use this when more processing has to be done.
+        Use this when more processing has to be done. Blocks which aren't in
+        `needed` are returned as DeferredBlocks, see `parse`.
         """
         assert isinstance(
             parse_context,
@@ -389,15 +522,20 @@ class BasicBlockParse:
 
         _expected_blocks = cls.expected_blocks()
         _init_classes = cls.block_classes()
-        _blocks: dict[str, str] = cls.parse_blocks(parse_context=parse_context)
+        _blocks: dict[str, ParseContext] = cls.parse_blocks(
+            parse_context=parse_context,
+        )
 
         _init_kwargs: dict[str, str] = {}
         for _block in _blocks:
             _lookup_block = _block.lower().strip()
             if _lookup_block in _expected_blocks and _lookup_block in _init_classes:
                 _init_arg = _expected_blocks[_lookup_block]
-                _init_kwargs[_init_arg] = _init_classes[_block].parse(
+                _init_kwargs[_init_arg] = cls._parse_block(
+                    _init_classes[_block],
                     _blocks[_block],
+                    needed,
+                    _lookup_block,
                 )
                 _expected_blocks.pop(_lookup_block)
             else:
@@ -409,16 +547,75 @@ class BasicBlockParse:
         _init_kwargs["parse_context"] = parse_context
         return _init_kwargs
 
+    @staticmethod
+    def _parse_block(
+        block_class: type,
+        block_context: ParseContext,
+        needed: dict | None,
+        name: str,
+    ) -> object:
+        """Parse one block as the needed plan asks, or defer it."""
+        if needed is None:
+            return block_class.parse(block_context)
+        if name not in needed:
+            return DeferredBlock(block_class, block_context)
+        if needed[name] is not None and issubclass(
+            block_class,
+            (BasicBlockParse, MultiBlockParse),
+        ):
+            return block_class.parse(block_context, needed=needed[name])
+        return block_class.parse(block_context)
+
     @classmethod
-    def parse(cls: T, parse_context: ParseContext) -> T:
-        """Parse the block of lines into an object."""
+    def parse(cls: T, parse_context: ParseContext, needed: dict | None = None) -> T:
+        """Parse the block of lines into an object.
+
+        Args:
+            parse_context (ParseContext): The lines of the block.
+            needed (dict | None): The blocks to parse now, by name, each
+                mapped to the plan for its own blocks, or None to parse all of
+                it. None parses every block.
+
+        Returns:
+            T: The parsed object.
+
+        Notes:
+            1. The blocks are parsed with kwargs_parse.
+            2. The object is created with None for each deferred block, and
+               the deferred blocks are kept on it, see __getattr__.
+
+        """
         assert isinstance(
             parse_context,
             ParseContext,
         ), "parse_context must be a ParseContext"
-        _init_kwargs = cls.kwargs_parse(parse_context=parse_context)
+        _init_kwargs = cls.kwargs_parse(parse_context=parse_context, needed=needed)
 
-        return cls(**_init_kwargs)
+        _deferred = {
+            _arg: _value
+            for _arg, _value in _init_kwargs.items()
+            if isinstance(_value, DeferredBlock)
+        }
+        _object = cls(**{**_init_kwargs, **dict.fromkeys(_deferred)})
+        if _deferred:
+            for _arg in _deferred:
+                delattr(_object, _arg)
+            _object._deferred_blocks = _deferred
+        return _object
+
+    def __getattr__(self, name: str) -> object:
+        """Parse a deferred block the first time its attribute is read.
+
+        The parsed block is stored as a normal attribute, so it is parsed once.
+        """
+        _deferred = vars(self).get("_deferred_blocks", {})
+        if name not in _deferred:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'",
+            )
+        setattr(self, name, _deferred[name].parse())
+        _deferred.pop(name, None)
+        return vars(self)[name]
 
 
 class MultiBlockParse:
@@ -433,23 +630,24 @@ class MultiBlockParse:
     Notes:
         1. The parse_context is validated to ensure it is a ParseContext.
         2. A list _blocks is initialized to store parsed block contexts.
-        3. A variable _current_block is initialized to collect lines for the current block.
-        4. A variable _section_header is initialized to track the current section.
-        5. Each line in the parse_context is processed:
+        3. A variable _section_header is initialized to track the current section.
+        4. Each line in the parse_context is processed:
             a. Empty lines are skipped.
             b. Lines starting with "# " are section headers, and _section_header is set.
-            c. If a new section header is found and _current_block is non-empty, it is added to _blocks.
-            d. If _section_header is set, the line is added to _current_block.
-        6. After processing, the last _current_block is added to _blocks if non-empty.
+            c. If a new section header is found, the previous block is taken as a view
+               of the parse_context and added to _blocks if it is non-empty.
+        5. After processing, the last block is added to _blocks if non-empty.
+        6. Blocks are views sharing the parse_context's lines; no lines are copied.
         7. The block contexts in _blocks are validated.
         8. The list_class method is called to get the type of the list items.
-        9. Each block context is parsed into an object using the list_class type.
+        9. Each block context is parsed into an object using the list_class type,
+           with the `needed` plan if one is given, see BasicBlockParse.
         10. The list of objects is returned as an instance of the class.
 
     """
 
     @classmethod
-    def parse_blocks(cls: T, parse_context: ParseContext) -> list[list[str]]:
+    def parse_blocks(cls: T, parse_context: ParseContext) -> list[ParseContext]:
         """Parse the block of lines into a list of blocks.
 
         Requires a static method named `list_class` which returns
@@ -462,8 +660,9 @@ class MultiBlockParse:
         ), "parse_context must be a ParseContext"
 
         _blocks = []
-        _current_block = ParseContext(lines=[], doc_line_num=parse_context.doc_line_num)
         _section_header = None
+        _section_start = parse_context.offset
+        _section_doc_line_num = parse_context.doc_line_num
 
         for _line in parse_context:
             # skip empty lines
@@ -471,25 +670,30 @@ class MultiBlockParse:
                 continue
 
             if _line.startswith("# "):
+                if _section_header is not None:
+                    # the previous block ends at this header
+                    _current_block = parse_context.view(
+                        start=_section_start,
+                        stop=parse_context.offset - 1,
+                        doc_line_num=_section_doc_line_num,
+                    )
+                    if len(_current_block) > 0:
+                        _blocks.append(_current_block)
+
                 _section_header = _line[1:].strip().lower()
                 log.info(f"Found section header: {_section_header}")
-                if len(_current_block) > 0:
-                    _blocks.append(_current_block)
-                _current_block = ParseContext(
-                    lines=[],
-                    doc_line_num=parse_context.doc_line_num,
-                )
-                continue
-
-            if _section_header is not None:
-                if _line.startswith("#"):
-                    # this is a subheader, we want the line, but not the extra level
-                    _line = _line[1:]
-                _current_block.append(_line)
+                _section_start = parse_context.offset
+                _section_doc_line_num = parse_context.doc_line_num
 
         # Get the last block
-        if len(_current_block) > 0:
-            _blocks.append(_current_block)
+        if _section_header is not None:
+            _current_block = parse_context.view(
+                start=_section_start,
+                stop=parse_context.offset,
+                doc_line_num=_section_doc_line_num,
+            )
+            if len(_current_block) > 0:
+                _blocks.append(_current_block)
 
         assert isinstance(
             _blocks,
@@ -502,8 +706,12 @@ class MultiBlockParse:
         return _blocks
 
     @classmethod
-    def parse(cls: T, parse_context: ParseContext) -> T:
-        """Parse the blocks and return a list of objects."""
+    def parse(cls: T, parse_context: ParseContext, needed: dict | None = None) -> T:
+        """Parse the blocks and return a list of objects.
+
+        `needed` is the plan for the blocks of each object, or None to parse
+        them all.
+        """
         assert isinstance(
             parse_context,
             ParseContext,
@@ -514,9 +722,10 @@ class MultiBlockParse:
         _object_list: list[cls] = []
         _object_blocks = cls.parse_blocks(parse_context=parse_context)
         _list_type = cls.list_class()
+        _kwargs = {} if needed is None else {"needed": needed}
 
         for _block in _object_blocks:
-            _object = _list_type.parse(_block)
+            _object = _list_type.parse(_block, **_kwargs)
             _object_list.append(_object)
 
         log.debug(f"Parsed {len(_object_list)} objects for type {type(T)}")
@@ -1,17 +1,145 @@
+import io
 import logging
 from datetime import datetime
+from functools import cache
 from pathlib import Path
+from typing import BinaryIO, TextIO
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    select_autoescape,
+)
 
 from resume_writer.models.resume import Resume
 from resume_writer.resume_render.html.resume_main import RenderResume
 from resume_writer.resume_render.render_settings import ResumeRenderSettings
-from resume_writer.utils.text_doc import HtmlDoc
+from resume_writer.utils.text_doc import HtmlDoc, HtmlStreamDoc
 
 log = logging.getLogger(__name__)
 
 
+def _date_filter(resdate: datetime | None, date_format: str = "%B %Y") -> str:
+    """Format dates in Jinja template.
+
+    Args:
+        resdate (datetime | None): The date to format.
+        date_format (str, optional): The format string for the date. Defaults to "%B %Y".
+
+    Returns:
+        str: The formatted date string or "Present" if resdate is None.
+
+    Notes:
+        1. Validates that resdate is either a datetime object or None.
+        2. Validates that date_format is a string.
+        3. Returns "Present" if resdate is None.
+        4. Otherwise, formats the date using strftime with the specified format.
+    """
+    assert isinstance(resdate, (datetime, type(None))), "Invalid datetime"
+    assert isinstance(date_format, str), "Invalid date format"
+
+    if resdate is None:
+        return "Present"
+
+    return resdate.strftime(date_format)
+
+
+def _lf_to_br(text: str) -> str:
+    """Convert line feeds to HTML breaks.
+
+    Args:
+        text (str): The input text.
+
+    Returns:
+        str: The input text with line feeds replaced by HTML breaks.
+
+    Notes:
+        1. Validates that text is a string.
+        2. Replaces "\r\n" with "\n".
+        3. Replaces "\n\n" with "\n".
+        4. Replaces "\n" with "<br>".
+    """
+    assert isinstance(text, str)
+    _txt = text.replace("\r\n", "\n")
+    _txt = _txt.replace("\n\n", "\n")
+    _txt = _txt.replace("\n", "<br>")
+    return _txt
+
+
+def _list_len(lst: list) -> int:
+    """Return the length of a list.
+
+    Args:
+        lst (list): The input list.
+
+    Returns:
+        int: The length of the list.
+
+    Notes:
+        1. Validates that lst is a list.
+        2. Returns the length of the list using len().
+    """
+    assert isinstance(lst, list)
+    return len(lst)
+
+
+def jinja_environment(bytecode_cache_dir: Path | None = None) -> Environment:
+    """Return the process-wide Jinja environment for the HTML templates.
+
+    The environment is created on first use, with every template compiled, and
+    shared by every renderer in the process.
+
+    Args:
+        bytecode_cache_dir (Path | None): A directory for compiled template
+            bytecode, shared between processes. If None, templates are compiled
+            in memory only.
+
+    Returns:
+        Environment: The shared Jinja environment.
+
+    Notes:
+        1. Initializes the Jinja environment with the date, lf_to_br and list_len
+           filters, and the bytecode cache if a directory is given.
+        2. Loads templates from the 'resume_writer.resume_render.html' package.
+        3. Enables autoescaping for HTML output. Templates are not checked for changes.
+        4. Compiles every template, so later renders reuse them.
+        5. The environment is cached per bytecode_cache_dir.
+        6. Disk access: Reads the templates, and reads and writes the bytecode cache.
+    """
+    return _jinja_environment(bytecode_cache_dir)
+
+
+@cache
+def _jinja_environment(bytecode_cache_dir: Path | None) -> Environment:
+    """Create the Jinja environment, see jinja_environment."""
+
+    _bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+        _bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+
+    # the templates are package data, so they are never reloaded
+    jinja_env = Environment(
+        loader=PackageLoader("resume_writer.resume_render.html"),
+        autoescape=select_autoescape(),
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache,
+    )
+    jinja_env.filters["date"] = _date_filter
+    jinja_env.filters["lf_to_br"] = _lf_to_br
+    jinja_env.filters["list_len"] = _list_len
+
+    # compile every template now, so renders only look them up
+    for _template_name in jinja_env.list_templates(extensions=["j2"]):
+        jinja_env.get_template(_template_name)
+
+    _msg = f"Initialized shared Jinja environment, bytecode cache: {bytecode_cache_dir}"
+    log.debug(_msg)
+
+    return jinja_env
+
+
 class RenderResumeHtml:
     """Render a resume to HTML format using Jinja2 templates.
 
@@ -19,48 +147,60 @@ class RenderResumeHtml:
     managing the rendering pipeline, and saving the final output.
 
     Attributes:
-        jinja_env (Environment): The Jinja2 environment configured with custom filters.
+        jinja_env (Environment): The shared Jinja2 environment configured with custom filters.
+        bytecode_cache_dir (Path | None): The directory for compiled template bytecode, if any.
         resume (Resume): The resume data to be rendered.
         settings (ResumeRenderSettings): Configuration settings for rendering.
         renderer (RenderResume): The underlying renderer responsible for generating HTML.
         rendered (bool): Flag indicating whether the resume has been rendered.
     """
 
-    def __init__(self, resume: Resume, settings: ResumeRenderSettings) -> None:
+    def __init__(
+        self,
+        resume: Resume,
+        settings: ResumeRenderSettings,
+        bytecode_cache_dir: Path | None = None,
+    ) -> None:
         """Initialize the HTMLRenderer object.
 
         Args:
             resume (Resume): The resume data to be rendered.
             settings (ResumeRenderSettings): The settings for rendering the resume.
+            bytecode_cache_dir (Path | None): A directory for compiled template bytecode, or None.
 
         Notes:
             1. Validates that resume is an instance of Resume and settings is an instance of ResumeRenderSettings.
-            2. Initializes the Jinja2 environment.
+            2. Gets the shared Jinja2 environment.
             3. Stores the resume and settings data.
             4. Initializes the HTML renderer.
             5. Sets the rendered flag to False.
         """
         assert isinstance(resume, Resume)
         assert isinstance(settings, ResumeRenderSettings)
+        assert isinstance(bytecode_cache_dir, (Path, type(None)))
 
+        self.bytecode_cache_dir = bytecode_cache_dir
         self.jinja_env = self.init_jinja()
         self.resume = resume
         self.settings = settings
         self.renderer = self.init_renderer()
         self.rendered: bool = False
 
-    def init_renderer(self) -> RenderResume:
+    def init_renderer(self, document: HtmlDoc | None = None) -> RenderResume:
         """Initialize and return a RenderResume object.
 
+        Args:
+            document (HtmlDoc | None): The document to render into. If None, a new HtmlDoc is used.
+
         Returns:
             RenderResume: Initialized RenderResume object.
 
         Notes:
-            1. Creates an instance of HtmlDoc.
-            2. Creates a RenderResume object with the HtmlDoc, Jinja environment, resume data, and settings.
+            1. Creates an instance of HtmlDoc, if no document is given.
+            2. Creates a RenderResume object with the document, Jinja environment, resume data, and settings.
             3. Returns the RenderResume object.
         """
-        _document: HtmlDoc = HtmlDoc()
+        _document: HtmlDoc = HtmlDoc() if document is None else document
         _renderer = RenderResume(
             document=_document,
             jinja_env=self.jinja_env,
@@ -70,90 +210,16 @@ class RenderResumeHtml:
         return _renderer
 
     def init_jinja(self) -> Environment:
-        """Initialize the Jinja environment with custom filters.
+        """Return the shared Jinja environment with custom filters.
 
         Returns:
-            Environment: The initialized Jinja environment.
+            Environment: The process-wide Jinja environment, from jinja_environment.
 
         Notes:
-            1. Defines a date filter function to format dates in the Jinja template.
-            2. Defines a line feed to HTML break function to convert line feeds to HTML breaks.
-            3. Defines a list length function to calculate the length of a list.
-            4. Initializes the Jinja environment with the custom filters.
-            5. Loads templates from the 'resume_writer.resume_render.html' package.
-            6. Enables autoescaping for HTML output.
+            1. The environment, and its compiled templates, are shared by every
+               renderer using the same bytecode cache directory.
         """
-
-        def date_filter(resdate: datetime | None, date_format: str = "%B %Y") -> str:
-            """Format dates in Jinja template.
-
-            Args:
-                resdate (datetime | None): The date to format.
-                date_format (str, optional): The format string for the date. Defaults to "%B %Y".
-
-            Returns:
-                str: The formatted date string or "Present" if resdate is None.
-
-            Notes:
-                1. Validates that resdate is either a datetime object or None.
-                2. Validates that date_format is a string.
-                3. Returns "Present" if resdate is None.
-                4. Otherwise, formats the date using strftime with the specified format.
-            """
-            assert isinstance(resdate, (datetime, type(None))), "Invalid datetime"
-            assert isinstance(date_format, str), "Invalid date format"
-
-            if resdate is None:
-                return "Present"
-
-            return resdate.strftime(date_format)
-
-        def lf_to_br(text: str) -> str:
-            """Convert line feeds to HTML breaks.
-
-            Args:
-                text (str): The input text.
-
-            Returns:
-                str: The input text with line feeds replaced by HTML breaks.
-
-            Notes:
-                1. Validates that text is a string.
-                2. Replaces "\r\n" with "\n".
-                3. Replaces "\n\n" with "\n".
-                4. Replaces "\n" with "<br>".
-            """
-            assert isinstance(text, str)
-            _txt = text.replace("\r\n", "\n")
-            _txt = _txt.replace("\n\n", "\n")
-            _txt = _txt.replace("\n", "<br>")
-            return _txt
-
-        def list_len(lst: list) -> int:
-            """Return the length of a list.
-
-            Args:
-                lst (list): The input list.
-
-            Returns:
-                int: The length of the list.
-
-            Notes:
-                1. Validates that lst is a list.
-                2. Returns the length of the list using len().
-            """
-            assert isinstance(lst, list)
-            return len(lst)
-
-        jinja_env = Environment(
-            loader=PackageLoader("resume_writer.resume_render.html"),
-            autoescape=select_autoescape(),
-        )
-        jinja_env.filters["date"] = date_filter
-        jinja_env.filters["lf_to_br"] = lf_to_br
-        jinja_env.filters["list_len"] = list_len
-
-        return jinja_env
+        return jinja_environment(self.bytecode_cache_dir)
 
     def render(
         self,
@@ -177,6 +243,64 @@ class RenderResumeHtml:
 
         log.info("Render of HTML resume complete.")
 
+    def stream_to(self, fileobj: TextIO) -> None:
+        """Render the resume straight to a file object, without buffering it.
+
+        Template output is written to fileobj as it is generated, so memory use
+        stays flat and the first bytes are written as soon as they are ready.
+
+        Args:
+            fileobj (TextIO): A text file object, or anything with a `write`
+                method taking a string, such as a socket's `makefile("w")`.
+
+        Returns:
+            None
+
+        Notes:
+            1. Creates a RenderResume object rendering into an HtmlStreamDoc for fileobj.
+            2. Renders the resume. Nothing is kept, so `content` and `save`
+               still need `render` to be called.
+            3. Performs whatever I/O fileobj does.
+        """
+        log.info("Streaming HTML resume")
+
+        self.init_renderer(HtmlStreamDoc(fileobj)).render()
+
+        log.info("Streamed HTML resume.")
+
+    def render_to(self, stream: BinaryIO) -> None:
+        """Render the resume straight to a binary stream, as UTF-8.
+
+        Args:
+            stream (BinaryIO): A writable binary file object, e.g. an HTTP response
+                body or `sys.stdout.buffer`.
+
+        Returns:
+            None
+
+        Notes:
+            1. Wraps stream in a UTF-8 text wrapper.
+            2. Streams the rendered HTML to it with stream_to.
+            3. Flushes and detaches the wrapper, leaving stream open.
+        """
+        _text = io.TextIOWrapper(stream, encoding="utf-8")
+        self.stream_to(_text)
+        _text.flush()
+        _text.detach()
+
+    def render_to_bytes(self) -> bytes:
+        """Render the resume and return it as UTF-8 bytes.
+
+        Returns:
+            bytes: The rendered HTML.
+
+        Notes:
+            1. Renders with render_to into an in-memory buffer.
+        """
+        _buffer = io.BytesIO()
+        self.render_to(_buffer)
+        return _buffer.getvalue()
+
     def save(self, path: Path) -> None:
         """Save the rendered resume to a file.
 
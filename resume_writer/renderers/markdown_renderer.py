@@ -1,5 +1,7 @@
+import io
 import logging
 from pathlib import Path
+from typing import BinaryIO
 
 from resume_writer.models.resume import Resume
 from resume_writer.resume_render.markdown.resume_main import RenderResume
@@ -110,6 +112,47 @@ class RenderResumeMarkdown:
 
         log.info("Render of Markdown resume complete.")
 
+    def render_to(self, stream: BinaryIO) -> None:
+        """Render the resume and write it to a binary stream, as UTF-8.
+
+        Parameters
+        ----------
+        stream : BinaryIO
+            A writable binary file object, e.g. an HTTP response body or
+            `sys.stdout.buffer`.
+
+        Notes
+        -----
+        1. Renders the resume with a new RenderResume, into a new MarkdownDoc,
+           so every call gives the same output. Nothing is kept, so `content`
+           and `save` still need `render` to be called.
+        2. Streams the document's chunks to a UTF-8 text wrapper around stream.
+        3. Flushes and detaches the wrapper, leaving stream open.
+        """
+        _renderer = self.init_renderer()
+        _renderer.render()
+
+        _text = io.TextIOWrapper(stream, encoding="utf-8")
+        _renderer.document.stream_to(_text)
+        _text.flush()
+        _text.detach()
+
+    def render_to_bytes(self) -> bytes:
+        """Render the resume and return it as UTF-8 bytes.
+
+        Returns
+        -------
+        bytes
+            The rendered Markdown.
+
+        Notes
+        -----
+        1. Renders with render_to into an in-memory buffer.
+        """
+        _buffer = io.BytesIO()
+        self.render_to(_buffer)
+        return _buffer.getvalue()
+
     def save(self, path: Path) -> None:
         """Save the rendered resume to a file.
 
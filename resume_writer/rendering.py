@@ -0,0 +1,596 @@
+"""Parse resumes and render them, for the CLI, the server and the watcher.
+
+These helpers hold no command-line state. `main` wraps them in click commands,
+`server` calls them from its render workers, and `watch` re-renders with them.
+
+"""
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+import docx
+import rich
+import tomli
+
+from resume_writer.models.parsers import ParseContext
+from resume_writer.models.resume import Resume
+from resume_writer.renderers.html_renderer import RenderResumeHtml
+from resume_writer.renderers.markdown_renderer import RenderResumeMarkdown
+from resume_writer.resume_render.ats.resume_main import (
+    RenderResume as AtsRenderResume,
+)
+from resume_writer.resume_render.basic.resume_main import (
+    RenderResume as BasicRenderResume,
+)
+from resume_writer.resume_render.docx_package import save_docx
+from resume_writer.resume_render.plain.resume_main import (
+    RenderResume as PlainRenderResume,
+)
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+from resume_writer.utils.resume_cache import ParsedResumeCache
+
+log = logging.getLogger(__name__)
+
+
+def load_settings(settings_file: str, *, echo: bool = True) -> dict:
+    """Load resume rendering settings from a TOML file.
+
+    Args:
+        settings_file (str): Path to the TOML settings file.
+        echo (bool): Print the parsed settings. Turned off when the output is
+            written to stdout.
+
+    Returns:
+        dict: A dictionary containing the parsed settings.
+
+    Notes:
+        1. Converts the settings_file path to a Path object.
+        2. Opens the TOML file in binary mode.
+        3. Parses the TOML content using tomli.load.
+        4. Prints the parsed settings using rich, if echo is set.
+        5. Returns the settings dictionary.
+        6. Disk access: Reads from the settings_file path.
+    """
+    _settings_file = Path(settings_file)
+
+    with _settings_file.open("rb") as _f:
+        _toml = tomli.load(_f)
+    if echo:
+        rich.print(_toml)
+    return _toml
+
+
+def load_render_settings(
+    settings_file: str,
+    *,
+    echo: bool = True,
+) -> ResumeRenderSettings:
+    """Load the render settings from a TOML settings file.
+
+    Args:
+        settings_file (str): Path to the TOML settings file.
+        echo (bool): Print the parsed settings.
+
+    Returns:
+        ResumeRenderSettings: The settings under [resume.render].
+
+    Notes:
+        1. The file is read with load_settings.
+        2. A new ResumeRenderSettings is updated from its resume.render table.
+        3. Disk access: Reads from the settings_file path.
+
+    """
+    _settings = load_settings(settings_file, echo=echo)
+    _render_settings = ResumeRenderSettings()
+    _render_settings.update_from_dict(_settings["resume"]["render"])
+    return _render_settings
+
+
+def basic_render(
+    docx_doc: docx.document.Document,
+    resume: Resume,
+    settings: ResumeRenderSettings,
+) -> None:
+    """Render the resume using the basic rendering style.
+
+    Args:
+        docx_doc (docx.document.Document): The Word document object to render into.
+        resume (Resume): The resume object containing the content to render.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+
+    Returns:
+        None
+
+    Notes:
+        1. Validates that all inputs are of the correct type.
+        2. Logs the start of the rendering process.
+        3. Creates a BasicRenderResume instance with the provided document, resume, and settings.
+        4. Calls the render method on the renderer to generate the document.
+        5. Logs the completion of the rendering process.
+        6. Disk access: Saves the rendered document to the output file path.
+    """
+    assert isinstance(docx_doc, docx.document.Document)
+    assert isinstance(resume, Resume)
+    assert isinstance(settings, ResumeRenderSettings)
+
+    log.info("Rendering simple resume")
+    _renderer = BasicRenderResume(document=docx_doc, resume=resume, settings=settings)
+    _renderer.render()
+    log.info("Render of basic resume complete")
+
+
+def ats_render(
+    docx_doc: docx.document.Document,
+    resume: Resume,
+    settings: ResumeRenderSettings,
+) -> None:
+    """Render the resume using the ATS (Applicant Tracking System) rendering style.
+
+    Args:
+        docx_doc (docx.document.Document): The Word document object to render into.
+        resume (Resume): The resume object containing the content to render.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+
+    Returns:
+        None
+
+    Notes:
+        1. Validates that all inputs are of the correct type.
+        2. Logs the start of the rendering process.
+        3. Creates an AtsRenderResume instance with the provided document, resume, and settings.
+        4. Calls the render method on the renderer to generate the document.
+        5. Logs the completion of the rendering process.
+        6. Disk access: Saves the rendered document to the output file path.
+    """
+    assert isinstance(docx_doc, docx.document.Document)
+    assert isinstance(resume, Resume)
+    assert isinstance(settings, ResumeRenderSettings)
+
+    log.info("Rendering simple resume")
+    _renderer = AtsRenderResume(document=docx_doc, resume=resume, settings=settings)
+    _renderer.render()
+    log.info("Render of simple resume complete")
+
+
+def plain_render(
+    docx_doc: docx.document.Document,
+    resume: Resume,
+    settings: ResumeRenderSettings,
+) -> None:
+    """Render the resume using the plain (minimalist) rendering style.
+
+    Args:
+        docx_doc (docx.document.Document): The Word document object to render into.
+        resume (Resume): The resume object containing the content to render.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+
+    Returns:
+        None
+
+    Notes:
+        1. Validates that all inputs are of the correct type.
+        2. Logs the start of the rendering process.
+        3. Creates a PlainRenderResume instance with the provided document, resume, and settings.
+        4. Calls the render method on the renderer to generate the document.
+        5. Logs the completion of the rendering process.
+        6. Disk access: Saves the rendered document to the output file path.
+    """
+    assert isinstance(docx_doc, docx.document.Document)
+    assert isinstance(resume, Resume)
+    assert isinstance(settings, ResumeRenderSettings)
+
+    log.info("Rendering plain resume")
+
+    _renderer = PlainRenderResume(
+        document=docx_doc,
+        resume=resume,
+        settings=settings,
+    )
+    _renderer.render()
+
+    log.info("Render of plain resume complete")
+
+
+# where HTML and Markdown are written when no output directory is given
+DEFAULT_HTML_FILE = Path("data/html_resume.html")
+DEFAULT_MARKDOWN_FILE = Path("data/markdown_resume.md")
+
+
+def html_render(
+    resume: Resume,
+    settings: ResumeRenderSettings,
+    output_file: Path = DEFAULT_HTML_FILE,
+) -> None:
+    """Render the resume as an HTML file.
+
+    Args:
+        resume (Resume): The resume object containing the content to render.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+        output_file (Path): The file to write the HTML to.
+
+    Returns:
+        None
+
+    Notes:
+        1. Validates that all inputs are of the correct type.
+        2. Logs the start of the HTML rendering process.
+        3. Creates a RenderResumeHtml instance with the resume and settings.
+        4. Calls the render method to generate the HTML content.
+        5. Saves the rendered HTML to output_file, "data/html_resume.html" by default.
+        6. Logs the completion of the rendering process.
+        7. Disk access: Writes to output_file.
+    """
+    assert isinstance(resume, Resume)
+    assert isinstance(settings, ResumeRenderSettings)
+
+    log.info("Rendering HTML resume")
+
+    _html_renderer = RenderResumeHtml(
+        resume=resume,
+        settings=settings,
+    )
+    _html_renderer.render()
+    _html_renderer.save(output_file)
+
+    log.info("Render of HTML resume complete.")
+
+
+def markdown_render(
+    resume: Resume,
+    settings: ResumeRenderSettings,
+    output_file: Path = DEFAULT_MARKDOWN_FILE,
+) -> None:
+    """Render the resume as a Markdown file.
+
+    Args:
+        resume (Resume): The resume object containing the content to render.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+        output_file (Path): The file to write the Markdown to.
+
+    Returns:
+        None
+
+    Notes:
+        1. Validates that all inputs are of the correct type.
+        2. Logs the start of the Markdown rendering process.
+        3. Creates a RenderResumeMarkdown instance with the resume and settings.
+        4. Calls the render method to generate the Markdown content.
+        5. Saves the rendered Markdown to output_file, "data/markdown_resume.md" by default.
+        6. Logs the completion of the rendering process.
+        7. Disk access: Writes to output_file.
+    """
+    assert isinstance(resume, Resume)
+    assert isinstance(settings, ResumeRenderSettings)
+
+    log.info("Rendering Markdown resume")
+
+    _markdown_renderer = RenderResumeMarkdown(
+        resume=resume,
+        settings=settings,
+    )
+    _markdown_renderer.render()
+    _markdown_renderer.save(output_file)
+
+    log.info("Render of Markdown resume complete.")
+
+
+# python-docx renderers are CPU bound, and are run in worker processes
+DOCX_RENDERERS: dict[
+    str,
+    Callable[[docx.document.Document, Resume, ResumeRenderSettings], None],
+] = {
+    "ats": ats_render,
+    "basic": basic_render,
+    "plain": plain_render,
+}
+
+# the Jinja and text renderers are cheap, and are run in threads
+TEXT_RENDERERS: dict[str, Callable[[Resume, ResumeRenderSettings, Path], None]] = {
+    "html": html_render,
+    "markdown": markdown_render,
+}
+
+# renderers writing straight to a stream, see render_to_stream
+TEXT_RENDER_CLASSES: dict[str, type[RenderResumeHtml | RenderResumeMarkdown]] = {
+    "html": RenderResumeHtml,
+    "markdown": RenderResumeMarkdown,
+}
+
+OUTPUT_SUFFIXES = {
+    "ats": ".docx",
+    "basic": ".docx",
+    "plain": ".docx",
+    "html": ".html",
+    "markdown": ".md",
+}
+
+
+def render_docx(
+    resume_type: str,
+    resume: Resume,
+    settings: ResumeRenderSettings,
+    output_file: Path,
+) -> Path:
+    """Render the resume to a new .docx file.
+
+    Args:
+        resume_type (str): The docx rendering style, one of DOCX_RENDERERS.
+        resume (Resume): The resume object containing the content to render.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+        output_file (Path): The file to save the document to.
+
+    Returns:
+        Path: The output file.
+
+    Notes:
+        1. Creates a new Word document.
+        2. Renders the resume into it with the renderer for resume_type.
+        3. If settings.coalesce_runs is set, merges adjacent runs with the same
+           formatting, and logs how many runs were removed.
+        4. Saves the document to output_file, with pinned timestamps if
+           settings.deterministic_docx is set.
+        5. Disk access: Writes to output_file.
+    """
+    _docx_doc = _build_docx(resume_type, resume, settings)
+    save_docx(
+        _docx_doc,
+        output_file,
+        deterministic=settings.deterministic_docx,
+        coalesce=settings.coalesce_runs,
+    )
+    return output_file
+
+
+def _build_docx(
+    resume_type: str,
+    resume: Resume,
+    settings: ResumeRenderSettings,
+) -> docx.document.Document:
+    """Render the resume into a new Word document."""
+    _docx_doc = docx.Document()
+    DOCX_RENDERERS[resume_type](_docx_doc, resume, settings)
+    return _docx_doc
+
+
+def render_to_stream(
+    resume_type: str,
+    resume: Resume,
+    settings: ResumeRenderSettings,
+    stream: BinaryIO,
+) -> None:
+    """Render the resume in one format to a binary stream, without touching disk.
+
+    Args:
+        resume_type (str): The rendering style, one of OUTPUT_SUFFIXES.
+        resume (Resume): The resume object containing the content to render.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+        stream (BinaryIO): A writable binary file object, e.g. stdout or an HTTP response body.
+
+    Returns:
+        None
+
+    Notes:
+        1. Docx formats are rendered into a new Word document, which is saved to
+           stream like render_docx saves it to a file.
+        2. HTML and Markdown are rendered with their renderer's render_to, as UTF-8.
+    """
+    if resume_type in DOCX_RENDERERS:
+        _docx_doc = _build_docx(resume_type, resume, settings)
+        save_docx(
+            _docx_doc,
+            stream,
+            deterministic=settings.deterministic_docx,
+            coalesce=settings.coalesce_runs,
+        )
+    else:
+        TEXT_RENDER_CLASSES[resume_type](resume, settings).render_to(stream)
+
+
+def render_text(
+    resume_type: str,
+    resume: Resume,
+    settings: ResumeRenderSettings,
+    output_file: Path,
+) -> Path:
+    """Render the resume to an HTML or Markdown file.
+
+    Args:
+        resume_type (str): The text rendering style, one of TEXT_RENDERERS.
+        resume (Resume): The resume object containing the content to render.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+        output_file (Path): The file to write to.
+
+    Returns:
+        Path: The output file.
+
+    Notes:
+        1. Renders and saves the resume with the renderer for resume_type.
+        2. Disk access: Writes to output_file.
+    """
+    TEXT_RENDERERS[resume_type](resume, settings, output_file)
+    return output_file
+
+
+def output_paths(
+    input_file: str,
+    resume_types: list[str],
+    output_dir: Path,
+) -> dict[str, Path]:
+    """Return the output file for each resume type, under an output directory.
+
+    Args:
+        input_file (str): Path to the input resume, used to name the outputs.
+        resume_types (list[str]): The resume types to render.
+        output_dir (Path): The directory to write the outputs to.
+
+    Returns:
+        dict[str, Path]: The output file for each resume type, named after the
+        input file and the resume type, e.g. "resume_plain.docx".
+
+    """
+    _stem = Path(input_file).stem
+    return {
+        _resume_type: output_dir
+        / f"{_stem}_{_resume_type}{OUTPUT_SUFFIXES[_resume_type]}"
+        for _resume_type in resume_types
+    }
+
+
+def _render_in_parallel(
+    resume: Resume,
+    settings: ResumeRenderSettings,
+    docx_outputs: dict[str, Path],
+    text_outputs: dict[str, Path],
+    jobs: int,
+) -> list[Path]:
+    """Render docx formats in a process pool, and text formats in a thread pool."""
+    _futures: dict[str, Future] = {}
+    _process_workers = min(jobs, max(len(docx_outputs), 1))
+    _thread_workers = min(jobs, max(len(text_outputs), 1))
+    with (
+        ProcessPoolExecutor(max_workers=_process_workers) as _processes,
+        ThreadPoolExecutor(max_workers=_thread_workers) as _threads,
+    ):
+        for _executor, _render, _outputs in (
+            (_processes, render_docx, docx_outputs),
+            (_threads, render_text, text_outputs),
+        ):
+            for _resume_type, _output_file in _outputs.items():
+                _futures[_resume_type] = _executor.submit(
+                    _render,
+                    _resume_type,
+                    resume,
+                    settings,
+                    _output_file,
+                )
+
+    return [_future.result() for _future in _futures.values()]
+
+
+def render_formats(
+    resume: Resume,
+    settings: ResumeRenderSettings,
+    outputs: dict[str, Path],
+    jobs: int = 1,
+) -> list[Path]:
+    """Render the resume in several formats, in parallel.
+
+    Args:
+        resume (Resume): The parsed resume, shared by every format.
+        settings (ResumeRenderSettings): The rendering settings for the output.
+        outputs (dict[str, Path]): The output file for each resume type.
+        jobs (int): The number of formats to render at once. 1 renders them in turn.
+
+    Returns:
+        list[Path]: The files written, in the order of outputs.
+
+    Notes:
+        1. With one job, each format is rendered in turn in this process.
+        2. Otherwise the docx formats are rendered in a process pool, and the
+           HTML and Markdown formats in a thread pool, each of up to jobs workers.
+           The resume and settings are pickled to the worker processes.
+        3. An error rendering any format is raised once every format has finished.
+        4. Disk access: Writes each output file.
+    """
+    assert jobs >= 1, "jobs must be at least 1"
+
+    _docx_outputs = {k: v for k, v in outputs.items() if k in DOCX_RENDERERS}
+    _text_outputs = {k: v for k, v in outputs.items() if k in TEXT_RENDERERS}
+    assert len(_docx_outputs) + len(_text_outputs) == len(outputs), (
+        "unknown resume type"
+    )
+
+    if jobs == 1:
+        for _resume_type, _output_file in _docx_outputs.items():
+            render_docx(_resume_type, resume, settings, _output_file)
+        for _resume_type, _output_file in _text_outputs.items():
+            render_text(_resume_type, resume, settings, _output_file)
+        return list(outputs.values())
+
+    _files = _render_in_parallel(
+        resume,
+        settings,
+        _docx_outputs,
+        _text_outputs,
+        jobs,
+    )
+    # in the order of outputs
+    return sorted(_files, key=list(outputs.values()).index)
+
+
+def parse_text_resume(
+    input_file: str,
+    cache: ParsedResumeCache | None = None,
+    needed: dict | None = None,
+) -> Resume:
+    """Parse a text-based resume file and convert it into a Resume object.
+
+    Args:
+        input_file (str): Path to the text file containing the resume content.
+        cache (ParsedResumeCache | None): The parsed resume cache to use, or None to always parse.
+        needed (dict | None): The blocks to parse now, or None to parse every block.
+
+    Returns:
+        Resume: The parsed Resume object.
+
+    Notes:
+        1. Opens the input file and reads its content.
+        2. Parses the content with parse_resume_text.
+        3. Disk access: Reads from the input_file path, and reads or writes the cache directory.
+    """
+    with open(input_file) as _f:
+        _resume_text = _f.read()
+
+    _msg = f"Parsing {input_file}"
+    log.debug(_msg)
+    return parse_resume_text(_resume_text, cache=cache, needed=needed)
+
+
+def parse_resume_text(
+    resume_text: str,
+    cache: ParsedResumeCache | None = None,
+    needed: dict | None = None,
+) -> Resume:
+    """Parse the text of a resume into a Resume object.
+
+    Args:
+        resume_text (str): The full text of the resume.
+        cache (ParsedResumeCache | None): The parsed resume cache to use, or None to always parse.
+        needed (dict | None): The blocks to parse now, from
+            `ResumeRenderSettings.parse_plan`, or None to parse every block.
+            The others are parsed when they are first used.
+
+    Returns:
+        Resume: The parsed Resume object.
+
+    Notes:
+        1. If a cache is given and holds a Resume for the text, it is returned without parsing.
+        2. Splits the text into lines while preserving line endings.
+        3. Creates a ParseContext object with the lines and initial line number.
+        4. Parses the resume content using the Resume.parse method, with the needed plan.
+        5. If a cache is given, the parsed Resume is stored in it, with its
+           deferred blocks still unparsed.
+        6. Returns the resulting Resume object.
+        7. Disk access: Reads or writes the cache directory, if a cache is given.
+    """
+    _cache_key = None
+    if cache is not None:
+        _cache_key = cache.key(resume_text)
+        _cached_resume = cache.load(_cache_key)
+        if _cached_resume is not None:
+            log.info("Using cached parse of the resume")
+            return _cached_resume
+
+    _resume_lines = resume_text.splitlines(keepends=True)
+
+    _parse_context = ParseContext(lines=_resume_lines, doc_line_num=0)
+
+    _resume = Resume.parse(_parse_context, needed=needed)
+
+    if cache is not None:
+        cache.store(_cache_key, _resume)
+
+    return _resume
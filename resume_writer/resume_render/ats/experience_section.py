@@ -11,6 +11,7 @@ from resume_writer.models.experience import (
     Role,
     Roles,
 )
+from resume_writer.resume_render.render_content import responsibility_lines
 from resume_writer.resume_render.render_settings import (
     ResumeExperienceSettings,
     ResumeProjectsSettings,
@@ -235,9 +236,8 @@ class RenderRoleSection(ResumeRenderRoleBase):
 
         # add the responsibilities section
         if self.role.responsibilities and self.settings.responsibilities:
-            _responsibilities_text = self.role.responsibilities.text.replace(
-                "\n\n",
-                "\n",
+            _responsibilities_text = "\n".join(
+                responsibility_lines(self.role.responsibilities.text),
             )
             _responsibilites_paragraph = self.document.add_paragraph()
             _responsibilities_run = _responsibilites_paragraph.add_run(
@@ -105,21 +105,21 @@ class RenderResume(ResumeRenderBase):
             11. Checks if experience data exists and the experience section is enabled.
             12. If enabled, renders the experience section using RenderExperienceSection.
         """
-        if self.resume.personal and self.settings.personal:
+        if self.settings.personal and self.resume.personal:
             RenderPersonalSection(
                 self.document,
                 self.resume.personal,
                 self.settings.personal_settings,
             ).render()
 
-        if self.resume.education and self.settings.education:
+        if self.settings.education and self.resume.education:
             RenderEducationSection(
                 self.document,
                 self.resume.education,
                 self.settings.education_settings,
             ).render()
 
-        if self.resume.certifications and self.settings.certifications:
+        if self.settings.certifications and self.resume.certifications:
             RenderCertificationsSection(
                 self.document,
                 self.resume.certifications,
@@ -127,7 +127,7 @@ class RenderResume(ResumeRenderBase):
             ).render()
 
         # the executive summary is built from experience, so it has to exist
-        if self.resume.experience and self.settings.executive_summary:
+        if self.settings.executive_summary and self.resume.experience:
             self.document.add_heading("Executive Summary", 2)
 
             RenderExecutiveSummarySection(
@@ -137,7 +137,7 @@ class RenderResume(ResumeRenderBase):
             ).render()
 
         # the skills section is built from experience, so it has to exist
-        if self.resume.experience and self.settings.skills_matrix:
+        if self.settings.skills_matrix and self.resume.experience:
             RenderSkillsMatrixSection(
                 self.document,
                 self.resume.experience,
@@ -145,7 +145,7 @@ class RenderResume(ResumeRenderBase):
             ).render()
 
         # render all the roles
-        if self.resume.experience and self.settings.experience:
+        if self.settings.experience and self.resume.experience:
             RenderExperienceSection(
                 self.document,
                 self.resume.experience,
@@ -6,13 +6,13 @@ import docx.document
 from resume_writer.models.experience import (
     Experience,
 )
+from resume_writer.resume_render.render_content import executive_summary
 from resume_writer.resume_render.render_settings import (
     ResumeExecutiveSummarySettings,
 )
 from resume_writer.resume_render.resume_render_base import (
     ResumeRenderExecutiveSummaryBase,
 )
-from resume_writer.utils.executive_summary import ExecutiveSummary
 
 log = logging.getLogger(__name__)
 
@@ -64,8 +64,8 @@ class RenderExecutiveSummarySection(ResumeRenderExecutiveSummaryBase):
         Notes:
             1. Log a debug message indicating that the functional experience section is being rendered.
             2. Check if the experience object has any roles; if not, raise a ValueError.
-            3. Create an ExecutiveSummary object using the experience data.
-            4. Generate the executive summary using the specified categories from the settings.
+            3. Get the executive summary from render_content, built once per resume.
+            4. The summary covers the categories from the settings.
             5. For each category in the summary:
                 a. Add a heading to the document with level 4.
                 b. For each summary entry in the category:
@@ -81,8 +81,10 @@ class RenderExecutiveSummarySection(ResumeRenderExecutiveSummaryBase):
         if not self.experience.roles:
             raise ValueError("Experience must have roles for a functional resume.")
 
-        _o_executive_summary = ExecutiveSummary(self.experience)
-        _executive_summary = _o_executive_summary.summary(self.settings.categories)
+        _executive_summary = executive_summary(
+            self.experience,
+            self.settings.categories,
+        )
 
         for _category in _executive_summary:
             self.document.add_heading(_category, level=4)
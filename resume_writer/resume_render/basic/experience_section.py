@@ -10,6 +10,7 @@ from resume_writer.models.experience import (
     Role,
     Roles,
 )
+from resume_writer.resume_render.render_content import responsibility_lines
 from resume_writer.resume_render.render_settings import (
     ResumeExperienceSettings,
     ResumeProjectsSettings,
@@ -224,9 +225,8 @@ class RenderRoleSection(ResumeRenderRoleBase):
             self.document.add_paragraph(self.role.summary.summary)
 
         if self.role.responsibilities and self.settings.responsibilities:
-            _responsibilities_text = self.role.responsibilities.text.replace(
-                "\n\n",
-                "\n",
+            _responsibilities_text = "\n".join(
+                responsibility_lines(self.role.responsibilities.text),
             )
             self.document.add_paragraph(_responsibilities_text)
 
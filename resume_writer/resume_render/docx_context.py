@@ -0,0 +1,127 @@
+"""The render context a docx document shares between its section renderers."""
+
+import docx.document
+import docx.opc.constants
+from docx.opc.part import Part
+from docx.shared import Pt
+
+from resume_writer.resume_render.docx_hyperlink import get_or_create_hyperlink_style
+
+
+class DocxRenderContext:
+    """Per-document state shared by the docx section renderers.
+
+    A resume renders one section object per role and per project, and each of
+    them used to look up and rewrite the Normal style, and re-check the style
+    table for every hyperlink. The context does that work once per document.
+
+    Attributes:
+        document (docx.document.Document): The document being rendered.
+        normal_style (docx.styles.style.ParagraphStyle): The document's Normal style.
+        font_size (float): The Normal style's font size in points.
+        fast_docx (bool): Add runs of text by writing their XML directly, see docx_runs.
+
+    Methods:
+        set_font_size: Sets the Normal style's font size.
+        hyperlink_style: Returns the name of the hyperlink style, creating it on first use.
+        hyperlink_rel_id: Returns the relationship ID for a hyperlink URL.
+
+    """
+
+    def __init__(self, document: docx.document.Document):
+        """Set up the document's Normal style.
+
+        Args:
+            document (docx.document.Document): The document being rendered.
+
+        Returns:
+            None
+
+        Notes:
+            1. Set the Normal style's font to Calibri Light.
+            2. Set the Normal style's font size to 12pt if it isn't set.
+            3. Store the font size.
+            4. Raise ValueError if the font size is not set.
+
+        """
+        self.document = document
+        self.normal_style = document.styles["Normal"]
+
+        _font = self.normal_style.font
+        _font.name = "Calibri Light"
+
+        # font size should always be set. Other classes use it for scaling.
+        # If it isn't set, the other classes will fail.
+        if not _font.size:
+            _font.size = Pt(12)
+
+        if not _font.size:
+            raise ValueError("Normal style font size not set.")
+        self.font_size = _font.size.pt
+
+        self.fast_docx = False
+
+        self._hyperlink_style: str | None = None
+        self._hyperlink_rel_ids: dict[tuple[Part, str], str] = {}
+
+    def set_font_size(self, size: int) -> None:
+        """Set the Normal style's font size, in points."""
+        self.normal_style.font.size = Pt(size)
+        self.font_size = self.normal_style.font.size.pt
+
+    def hyperlink_style(self) -> str:
+        """Return the name of the hyperlink style, creating the style on first use."""
+        if self._hyperlink_style is None:
+            self._hyperlink_style = get_or_create_hyperlink_style(self.document)
+        return self._hyperlink_style
+
+    def hyperlink_rel_id(self, part: Part, url: str) -> str:
+        """Return the ID of the part's relationship to an external URL.
+
+        Args:
+            part (Part): The part containing the hyperlink, usually the document part.
+            url (str): The URL the hyperlink points to.
+
+        Returns:
+            str: The relationship ID, shared by every hyperlink to the URL in the part.
+
+        Notes:
+            1. A new relationship is only added the first time a URL is linked from a part.
+
+        """
+        _key = (part, url)
+        _r_id = self._hyperlink_rel_ids.get(_key)
+        if _r_id is None:
+            _r_id = part.relate_to(
+                url,
+                docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK,
+                is_external=True,
+            )
+            self._hyperlink_rel_ids[_key] = _r_id
+        return _r_id
+
+
+# attribute of the document part holding its render context
+_CONTEXT_ATTRIBUTE = "_resume_writer_render_context"
+
+
+def docx_render_context(document: docx.document.Document) -> DocxRenderContext:
+    """Return the document's render context, creating it on first use.
+
+    The context is kept as an attribute of the document part, since Document
+    objects are proxies and can't hold state of their own. It goes away with
+    the document; a module-level table keyed by the part would keep every
+    document alive, as the context refers back to its document.
+
+    Args:
+        document (docx.document.Document): The document being rendered.
+
+    Returns:
+        DocxRenderContext: The context shared by every section rendering into the document.
+
+    """
+    _context = vars(document.part).get(_CONTEXT_ATTRIBUTE)
+    if _context is None:
+        _context = DocxRenderContext(document)
+        setattr(document.part, _CONTEXT_ATTRIBUTE, _context)
+    return _context
@@ -0,0 +1,174 @@
+"""Save rendered documents, optionally byte for byte reproducibly.
+
+python-docx stamps every zip entry of a saved .docx with the current time, so
+two renders of the same resume differ in their bytes even though every part is
+the same. `save_docx` can instead pin the zip entry timestamps and the core
+properties, so identical inputs produce identical files.
+
+The rest of a .docx is already stable: parts are written in the same order,
+and relationship ids are allocated in render order, one per hyperlink URL (see
+`DocxRenderContext.hyperlink_rel_id`).
+
+"""
+
+import io
+import logging
+import os
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO
+
+import docx.document
+
+from resume_writer.resume_render import docx_runs
+
+log = logging.getLogger(__name__)
+
+# reproducible-builds convention for a fixed build time, in seconds since the epoch
+SOURCE_DATE_EPOCH_ENV = "SOURCE_DATE_EPOCH"
+
+# the earliest time a zip entry can hold
+ZIP_EPOCH = datetime(1980, 1, 1, tzinfo=timezone.utc)
+
+# read and write for the owner, as python-docx writes entries
+_ENTRY_ATTR = 0o600 << 16
+
+# zip entries written on unix, whatever the platform
+_CREATE_SYSTEM_UNIX = 3
+
+
+def pinned_timestamp() -> datetime:
+    """Return the timestamp written to deterministic documents.
+
+    Args:
+        None
+
+    Returns:
+        datetime: The time in SOURCE_DATE_EPOCH, or ZIP_EPOCH.
+
+    Notes:
+        1. If SOURCE_DATE_EPOCH is set, it is read as seconds since the epoch.
+        2. Times before ZIP_EPOCH are moved up to it, as zip entries can't hold them.
+
+    """
+    _epoch = os.environ.get(SOURCE_DATE_EPOCH_ENV)
+    if not _epoch:
+        return ZIP_EPOCH
+
+    _timestamp = datetime.fromtimestamp(int(_epoch), tz=timezone.utc)
+    return max(_timestamp, ZIP_EPOCH)
+
+
+def pin_core_properties(document: docx.document.Document, timestamp: datetime) -> None:
+    """Set the core properties that record when and how often a document was saved.
+
+    Args:
+        document (docx.document.Document): The rendered document.
+        timestamp (datetime): The created and modified time to set.
+
+    Returns:
+        None
+
+    Notes:
+        1. The created and modified times are set to timestamp.
+        2. The revision is set to 1, and last modified by is cleared.
+
+    """
+    _properties = document.core_properties
+    _properties.created = timestamp
+    _properties.modified = timestamp
+    _properties.revision = 1
+    _properties.last_modified_by = ""
+
+
+def normalize_zip(package: bytes, timestamp: datetime) -> bytes:
+    """Rewrite a zip package with pinned entry metadata.
+
+    Args:
+        package (bytes): The saved .docx package.
+        timestamp (datetime): The time to give every entry.
+
+    Returns:
+        bytes: The same package, with the same entries in the same order, whose
+            entries all have the given time, permissions and creating system.
+
+    Notes:
+        1. Each entry is read from package and written to a new zip, deflated,
+           with a ZipInfo holding only the pinned metadata.
+
+    """
+    _date_time = timestamp.timetuple()[:6]
+    _buffer = io.BytesIO()
+    with (
+        zipfile.ZipFile(io.BytesIO(package)) as _source,
+        zipfile.ZipFile(_buffer, "w", compression=zipfile.ZIP_DEFLATED) as _target,
+    ):
+        for _entry in _source.infolist():
+            _info = zipfile.ZipInfo(_entry.filename, date_time=_date_time)
+            _info.compress_type = zipfile.ZIP_DEFLATED
+            _info.external_attr = _ENTRY_ATTR
+            _info.create_system = _CREATE_SYSTEM_UNIX
+            _target.writestr(_info, _source.read(_entry))
+    return _buffer.getvalue()
+
+
+def save_docx(
+    document: docx.document.Document,
+    target: str | Path | BinaryIO,
+    *,
+    deterministic: bool = False,
+    coalesce: bool = False,
+) -> None:
+    """Save a rendered document to a file or binary stream.
+
+    Args:
+        document (docx.document.Document): The rendered document.
+        target (str | Path | BinaryIO): The file, or writable binary stream, to save to.
+        deterministic (bool): Pin the zip entry timestamps and core properties,
+            so the same document always saves to the same bytes.
+        coalesce (bool): Merge adjacent runs with the same formatting first, see
+            docx_runs.coalesce_runs.
+
+    Returns:
+        None
+
+    Notes:
+        1. With coalesce, adjacent runs are merged in the document, and the
+           number of runs removed is logged. Every renderer saves through
+           here, so the CLI and the renderers' own save methods agree.
+        2. Without deterministic, the document is saved with python-docx as is.
+        3. Otherwise the core properties are pinned to `pinned_timestamp()`, the
+           document is saved to memory, and the package is rewritten with
+           `normalize_zip` before it is written to target.
+        4. A target path is replaced rather than written in place, so an
+           output hardlinked to a cached entry never writes through into the
+           cache.
+        5. Disk access: Writes to target, if it is a path.
+
+    """
+    if coalesce:
+        _removed = docx_runs.coalesce_runs(document)
+        _msg = f"Merged away {_removed} runs"
+        log.info(_msg)
+
+    if isinstance(target, (str, Path)):
+        Path(target).unlink(missing_ok=True)
+
+    if not deterministic:
+        document.save(target)
+        return
+
+    _timestamp = pinned_timestamp()
+    pin_core_properties(document, _timestamp)
+
+    _buffer = io.BytesIO()
+    document.save(_buffer)
+    _package = normalize_zip(_buffer.getvalue(), _timestamp)
+
+    if isinstance(target, (str, Path)):
+        Path(target).write_bytes(_package)
+    else:
+        target.write(_package)
+
+    log.debug("Saved a deterministic .docx package")
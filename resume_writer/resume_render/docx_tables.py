@@ -0,0 +1,66 @@
+"""Add tables of text to a document.
+
+python-docx's `Table.cell()` rebuilds the table's cell grid on every call, so
+filling a table cell by cell takes time proportional to the square of its
+size. `add_text_table` fills a whole table in a single pass over its rows.
+
+"""
+
+from collections.abc import Collection, Sequence
+from itertools import islice
+
+import docx.document
+from docx.enum.table import WD_ALIGN_VERTICAL
+from docx.table import Table
+
+
+def add_text_table(
+    document: docx.document.Document,
+    header: Sequence[str],
+    rows: Sequence[Sequence[str]],
+    *,
+    style: str = "Table Grid",
+    centered_columns: Collection[int] = (),
+) -> Table:
+    """Add a table of text to the document, filling every cell in one pass.
+
+    `Table.cell()` rebuilds the table's cell grid on every call, so filling a
+    table cell by cell takes time proportional to the square of its size. This
+    walks the rows once instead, reading each row's cells once.
+
+    Args:
+        document (docx.document.Document): The document to add the table to.
+        header (Sequence[str]): The bold header labels, one per column.
+        rows (Sequence[Sequence[str]]): The text of each row's cells. A row may be
+            shorter than the header, leaving its last cells empty.
+        style (str): The table style.
+        centered_columns (Collection[int]): The columns whose filled cells are
+            vertically centered.
+
+    Returns:
+        Table: The new table, set to autofit.
+
+    Notes:
+        1. Add a table with a row for the header and one for each of the rows.
+        2. Add the header labels to the first row as bold runs.
+        3. For each following row, get its cells once, set the text of each filled
+           cell, and vertically center it if its column is in centered_columns.
+        4. Enable automatic table fitting to adjust column widths.
+
+    """
+    assert all(len(_row) <= len(header) for _row in rows)
+
+    _table = document.add_table(rows=len(rows) + 1, cols=len(header), style=style)
+
+    for _cell, _label in zip(_table.rows[0].cells, header):
+        _cell.paragraphs[0].add_run(_label).bold = True
+
+    # rows are read once; indexing _table.rows would rebuild the row list each time
+    for _table_row, _row in zip(islice(_table.rows, 1, None), rows):
+        for _col, (_cell, _text) in enumerate(zip(_table_row.cells, _row)):
+            _cell.text = _text
+            if _col in centered_columns:
+                _cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+
+    _table.autofit = True
+    return _table
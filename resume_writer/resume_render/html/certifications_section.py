@@ -39,9 +39,9 @@ class RenderCertificationsSection(ResumeRenderCertificationsBase):
 
         log.debug("Rendering certifications.")
 
-        _rendered = self.template.render(
-            settings=self.settings,
-            certifications=self.certifications,
+        self.document.add_chunks(
+            self.template.generate(
+                settings=self.settings,
+                certifications=self.certifications,
+            ),
         )
-
-        self.document.add_text(_rendered)
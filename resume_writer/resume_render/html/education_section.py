@@ -39,9 +39,9 @@ class RenderEducationSection(ResumeRenderEducationBase):
 
         log.debug("Rendering education section.")
 
-        _rendered = self.template.render(
-            settings=self.settings,
-            education=self.education,
+        self.document.add_chunks(
+            self.template.generate(
+                settings=self.settings,
+                education=self.education,
+            ),
         )
-
-        self.document.add_text(_rendered)
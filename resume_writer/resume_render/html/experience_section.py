@@ -46,7 +46,7 @@ class RenderRolesSection(ResumeRenderRolesBase):
            roles, template name, and settings.
         2. The `render` method checks if roles exist.
         3. If roles exist, it uses the Jinja2 template to render the roles with the given settings.
-        4. The rendered content is added to the document using `add_text`.
+        4. The rendered content is added to the document using `add_chunks`.
         5. No disk, network, or database access is performed.
 
     Returns:
@@ -100,7 +100,7 @@ class RenderRolesSection(ResumeRenderRolesBase):
             1. Checks if `self.roles` is empty; if so, logs a debug message and exits.
             2. Logs a debug message indicating rendering has started.
             3. Renders the Jinja2 template with `settings` and `roles` as context.
-            4. Adds the rendered string to the document using `add_text`.
+            4. Adds the rendered chunks to the document as they are generated, using `add_chunks`.
             5. No disk, network, or database access is used.
 
         """
@@ -109,9 +109,9 @@ class RenderRolesSection(ResumeRenderRolesBase):
 
         log.debug("Rendering roles section.")
 
-        _rendered = self.template.render(settings=self.settings, roles=self.roles)
-
-        self.document.add_text(_rendered)
+        self.document.add_chunks(
+            self.template.generate(settings=self.settings, roles=self.roles),
+        )
 
 
 class RenderProjectsSection(ResumeRenderProjectsBase):
@@ -137,7 +137,7 @@ class RenderProjectsSection(ResumeRenderProjectsBase):
            projects, template name, and settings.
         2. The `render` method checks if projects exist.
         3. If projects exist, it uses the Jinja2 template to render the projects with the given settings.
-        4. The rendered content is added to the document using `add_text`.
+        4. The rendered content is added to the document using `add_chunks`.
         5. No disk, network, or database access is performed.
 
     Returns:
@@ -193,7 +193,7 @@ class RenderProjectsSection(ResumeRenderProjectsBase):
             1. Checks if `len(self.projects)` is zero; if so, logs a debug message and returns.
             2. Logs a debug message indicating rendering has started.
             3. Renders the Jinja2 template with `settings` and `projects` as context.
-            4. Adds the rendered string to the document using `add_text`.
+            4. Adds the rendered chunks to the document as they are generated, using `add_chunks`.
             5. No disk, network, or database access is used.
 
         """
@@ -202,9 +202,9 @@ class RenderProjectsSection(ResumeRenderProjectsBase):
             return
 
         log.debug("Rendering projects section.")
-        _rendered = self.template.render(settings=self.settings, projects=self.projects)
-
-        self.document.add_text(_rendered)
+        self.document.add_chunks(
+            self.template.generate(settings=self.settings, projects=self.projects),
+        )
 
 
 class RenderExperienceSection(ResumeRenderExperienceBase):
@@ -62,9 +62,9 @@ class RenderPersonalSection(ResumeRenderPersonalBase):
 
         Notes:
             1. Renders the Jinja2 template using the settings and personal data.
-            2. Adds the rendered HTML content to the document.
+            2. Adds the rendered HTML content to the document, chunk by chunk.
             3. No network, disk, or database access is performed.
         """
-        _rendered = self.template.render(settings=self.settings, personal=self.personal)
-
-        self.document.add_text(_rendered)
+        self.document.add_chunks(
+            self.template.generate(settings=self.settings, personal=self.personal),
+        )
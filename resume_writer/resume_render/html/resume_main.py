@@ -78,7 +78,7 @@ class RenderResume(ResumeRenderBase):
             4. If the resume has experience data and experience rendering is enabled, render the experience section.
             5. No disk, network, or database access occurs during this process.
         """
-        if self.resume.personal and self.settings.personal:
+        if self.settings.personal and self.resume.personal:
             RenderPersonalSection(
                 document=self.document,
                 personal=self.resume.personal,
@@ -86,7 +86,7 @@ class RenderResume(ResumeRenderBase):
                 settings=self.settings.personal_settings,
             ).render()
 
-        if self.resume.education and self.settings.education:
+        if self.settings.education and self.resume.education:
             RenderEducationSection(
                 document=self.document,
                 jinja_env=self.jinja_env,
@@ -94,7 +94,7 @@ class RenderResume(ResumeRenderBase):
                 settings=self.settings.education_settings,
             ).render()
 
-        if self.resume.certifications and self.settings.certifications:
+        if self.settings.certifications and self.resume.certifications:
             RenderCertificationsSection(
                 document=self.document,
                 jinja_env=self.jinja_env,
@@ -102,7 +102,7 @@ class RenderResume(ResumeRenderBase):
                 settings=self.settings.certifications_settings,
             ).render()
 
-        if self.resume.experience and self.settings.experience:
+        if self.settings.experience and self.resume.experience:
             RenderExperienceSection(
                 document=self.document,
                 jinja_env=self.jinja_env,
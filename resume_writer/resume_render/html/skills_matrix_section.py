@@ -12,7 +12,7 @@ from resume_writer.models.experience import (
 from resume_writer.resume_render.render_settings import (
     ResumeSkillsMatrixSettings,
 )
-from resume_writer.resume_render.resume_render_base import (
+from resume_writer.resume_render.skills_matrix_base import (
     ResumeRenderSkillsMatrixBase,
 )
 
@@ -69,34 +69,11 @@ class RenderSkillsMatrixSection(ResumeRenderSkillsMatrixBase):
                 - The latest end date for any role that includes the skill (or None if not found).
 
         Notes:
-            1. Collects all start dates from roles where the skill appears.
-            2. Collects all end dates from roles where the skill appears.
-            3. If any roles contain the skill, finds the minimum start date and maximum end date.
-            4. Returns the earliest start date and latest end date as a tuple.
+            1. Looks up the skill in the SkillsMatrix inverted skill index for the roles.
+            2. Returns the earliest start date and latest end date as a tuple.
 
         """
-        _earliest_start_date = None
-        _last_end_date = None
-
-        # collect the start dates for each role with this skill
-        _start_dates = [
-            role.basics.start_date
-            for role in self.experience.roles
-            if skill in role.skills
-        ]
-        # collect the end dates for each role with this skill
-        _end_dates = [
-            role.basics.end_date
-            for role in self.experience.roles
-            if skill in role.skills
-        ]
-
-        # find the earliest start date
-        if len(_start_dates) > 0:
-            _earliest_start_date = min(_start_dates)
-            _last_end_date = max(_end_dates)
-
-        return _earliest_start_date, _last_end_date
+        return SkillsMatrix(self.experience.roles).find_skill_date_range(skill)
 
     def _get_skills_matrix(self) -> dict[str, float]:
         """Compute and filter skills matrix based on settings.
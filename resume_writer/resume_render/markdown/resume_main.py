@@ -80,28 +80,28 @@ class RenderResume(ResumeRenderBase):
             9. This method performs no disk, network, or database access.
 
         """
-        if self.resume.personal and self.settings.personal:
+        if self.settings.personal and self.resume.personal:
             RenderPersonalSection(
                 document=self.document,
                 personal=self.resume.personal,
                 settings=self.settings.personal_settings,
             ).render()
 
-        if self.resume.education and self.settings.education:
+        if self.settings.education and self.resume.education:
             RenderEducationSection(
                 document=self.document,
                 education=self.resume.education,
                 settings=self.settings.education_settings,
             ).render()
 
-        if self.resume.certifications and self.settings.certifications:
+        if self.settings.certifications and self.resume.certifications:
             RenderCertificationsSection(
                 document=self.document,
                 certifications=self.resume.certifications,
                 settings=self.settings.certifications_settings,
             ).render()
 
-        if self.resume.experience and self.settings.experience:
+        if self.settings.experience and self.resume.experience:
             RenderExperienceSection(
                 document=self.document,
                 experience=self.resume.experience,
@@ -6,13 +6,13 @@ import docx.document
 from resume_writer.models.experience import (
     Experience,
 )
+from resume_writer.resume_render.render_content import executive_summary
 from resume_writer.resume_render.render_settings import (
     ResumeExecutiveSummarySettings,
 )
 from resume_writer.resume_render.resume_render_base import (
     ResumeRenderExecutiveSummaryBase,
 )
-from resume_writer.utils.executive_summary import ExecutiveSummary
 
 log = logging.getLogger(__name__)
 
@@ -60,8 +60,8 @@ class RenderExecutiveSummarySection(ResumeRenderExecutiveSummaryBase):
 
         Notes:
             1. Validate that the experience has at least one role; raise ValueError if not.
-            2. Create an ExecutiveSummary instance using the experience data.
-            3. Generate the executive summary using the specified categories from settings.
+            2. Get the executive summary from render_content, built once per resume.
+            3. The summary covers the categories from settings.
             4. For each category in the summary:
                 a. Add a heading with level 4 to the document.
                 b. For each summary entry in the category:
@@ -79,8 +79,10 @@ class RenderExecutiveSummarySection(ResumeRenderExecutiveSummaryBase):
         if not self.experience.roles:
             raise ValueError("Experience must have roles for a functional resume.")
 
-        _o_executive_summary = ExecutiveSummary(self.experience)
-        _executive_summary = _o_executive_summary.summary(self.settings.categories)
+        _executive_summary = executive_summary(
+            self.experience,
+            self.settings.categories,
+        )
 
         for _category in _executive_summary:
             self.document.add_heading(_category, level=4)
@@ -1,5 +1,6 @@
 import logging
 import re
+from collections.abc import Container
 from datetime import datetime
 
 import docx
@@ -14,6 +15,8 @@ from resume_writer.models.experience import (
     Role,
     Roles,
 )
+from resume_writer.resume_render.docx_runs import TextRun
+from resume_writer.resume_render.render_content import responsibility_lines
 from resume_writer.resume_render.render_settings import (
     ResumeExperienceSettings,
     ResumeProjectsSettings,
@@ -36,6 +39,46 @@ log = logging.getLogger(__name__)
 _punctuation_end_re = re.compile(r"[\).,!?;:\]]")
 
 
+def _highlight_runs(fragments: list[str], skills: Container[str]) -> list[TextRun]:
+    """Return the runs for a line split into skills and the text between them.
+
+    Args:
+        fragments (list[str]): The line's fragments, as returned by a skills splitter.
+        skills (Container[str]): The skills to bold.
+
+    Returns:
+        list[TextRun]: A (texts, bold) run for each fragment.
+
+    Notes:
+        1. Fragments that are skills are bold.
+        2. A skill is preceded by a space, unless the fragment before it ends
+           with an opening bracket.
+        3. A skill is followed by a space, unless it is the last fragment or the
+           next fragment starts with closing punctuation.
+        4. Other fragments are added as they are.
+
+    """
+    _runs: list[TextRun] = []
+    _leading_space = True
+    for _ndx, _fragment in enumerate(fragments):
+        if _fragment in skills:
+            _trailing_space = (_ndx + 1) < len(fragments) and not (
+                _punctuation_end_re.match(fragments[_ndx + 1])
+            )
+            _texts = [" "] if _leading_space else []
+            _texts.append(_fragment)
+            if _trailing_space:
+                _texts.append(" ")
+            _runs.append((_texts, True))
+        else:
+            _runs.append(([_fragment], False))
+
+        # used on the next fragment
+        _leading_space = not re.search(r"[({[]$", _fragment)
+
+    return _runs
+
+
 class RenderRoleSection(ResumeRenderRoleBase):
     """Render experience roles section.
 
@@ -251,15 +294,9 @@ class RenderRoleSection(ResumeRenderRoleBase):
         Notes:
             1. Checks if skills are present and if the settings allow including tasks.
             2. Splits the task line using the skills splitter function.
-            3. Initializes leading and trailing space flags.
-            4. Iterates through each fragment in the task line.
-            5. Creates a new run for each fragment.
-            6. Determines if a trailing space is needed based on punctuation.
-            7. If the fragment is a skill, adds it in bold.
-            8. Adds leading space if needed.
-            9. Adds the fragment text to the run.
-            10. Adds trailing space if needed.
-            11. Adds a line break after the last fragment.
+            3. Builds a run for each fragment with _highlight_runs, bolding skills
+               and spacing them from the text around them.
+            4. Adds the runs to the paragraph with add_runs.
         """
         if (
             self.role.skills
@@ -267,32 +304,7 @@ class RenderRoleSection(ResumeRenderRoleBase):
             and len(self.role.skills) > 0
         ):
             _fragments = skills_splitter(task_line, self.role.skills)
-            _leading_space = True
-            _trailing_space = True
-            for _ndx, _fragment in enumerate(_fragments):
-                _run = paragraph.add_run()
-
-                if (_ndx + 1) < len(_fragments) and not _punctuation_end_re.match(
-                    _fragments[_ndx + 1],
-                ):
-                    _trailing_space = True
-                else:
-                    _trailing_space = False
-
-                if _fragment in self.role.skills:
-                    if _leading_space:
-                        _run.add_text(" ")
-
-                    _run.add_text(_fragment)
-                    _run.bold = True
-
-                    if _trailing_space:
-                        _run.add_text(" ")
-                else:
-                    _run.add_text(_fragment)
-
-                # used on the next iteration of the loop
-                _leading_space = not re.search(r"[({[]$", _fragment)
+            self.add_runs(paragraph, _highlight_runs(_fragments, self.role.skills))
 
             # _run.add_break()
 
@@ -322,10 +334,7 @@ class RenderRoleSection(ResumeRenderRoleBase):
         # _situation_paragraph.paragraph_format.space_before = Pt(0)
         # _situation_paragraph.paragraph_format.space_after = Pt(6)
 
-        _responsibilities_lines: list[str] = self.role.responsibilities.text.replace(
-            "\n\n",
-            "\n",
-        ).split("\n")
+        _responsibilities_lines = responsibility_lines(self.role.responsibilities.text)
 
         if len(_responsibilities_lines) > 0:
             _responsibilities_paragraph = self.document.add_paragraph()
@@ -650,32 +659,7 @@ class RenderProjectSection(ResumeRenderProjectBase):
                 self.project.description.text,
                 self.project.skills,
             )
-            _leading_space = True
-            _trailing_space = True
-            for _ndx, _fragment in enumerate(_fragments):
-                _run = paragraph.add_run()
-
-                if (_ndx + 1) < len(_fragments) and not _punctuation_end_re.match(
-                    _fragments[_ndx + 1],
-                ):
-                    _trailing_space = True
-                else:
-                    _trailing_space = False
-
-                if _fragment in self.project.skills:
-                    if _leading_space:
-                        _run.add_text(" ")
-
-                    _run.add_text(_fragment)
-                    _run.bold = True
-
-                    if _trailing_space:
-                        _run.add_text(" ")
-                else:
-                    _run.add_text(_fragment)
-
-                # used on the next iteration of the loop
-                _leading_space = not re.search(r"[({[]$", _fragment)
+            self.add_runs(paragraph, _highlight_runs(_fragments, self.project.skills))
 
 
 class RenderProjectsSection(ResumeRenderProjectsBase):
@@ -84,7 +84,7 @@ class RenderResume(ResumeRenderBase):
         """
         log.debug("RenderResume.render starting")
 
-        if self.resume.personal and self.settings.personal:
+        if self.settings.personal and self.resume.personal:
             log.debug("Rendering personal section")
             RenderPersonalSection(
                 self.document,
@@ -92,7 +92,7 @@ class RenderResume(ResumeRenderBase):
                 self.settings.personal_settings,
             ).render()
 
-        if self.resume.certifications and self.settings.certifications:
+        if self.settings.certifications and self.resume.certifications:
             log.debug("Rendering certifications section")
             RenderCertificationsSection(
                 self.document,
@@ -102,8 +102,8 @@ class RenderResume(ResumeRenderBase):
 
         # Render Education in default position (after Certifications) if render_at_end is False
         if (
-            self.resume.education
-            and self.settings.education
+            self.settings.education
+            and self.resume.education
             and not self.settings.education_settings.render_at_end
         ):
             log.debug("Rendering education section in default position")
@@ -114,7 +114,7 @@ class RenderResume(ResumeRenderBase):
             ).render()
 
         # the executive summary is built from experience, so it has to exist
-        if self.resume.experience and self.settings.executive_summary:
+        if self.settings.executive_summary and self.resume.experience:
             log.debug("Rendering executive summary section")
             _heading = self.document.add_heading("Executive Summary", 2)
             _heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -128,7 +128,7 @@ class RenderResume(ResumeRenderBase):
         # the skills section is built from experience, so it has to exist
         # Only render the skills matrix if we have an executive summary
         if (
-            self.resume.experience and self.settings.skills_matrix
+            self.settings.skills_matrix and self.resume.experience
             # and self.settings.executive_summary
         ):
             log.debug("Rendering skills matrix section")
@@ -142,7 +142,7 @@ class RenderResume(ResumeRenderBase):
             ).render()
 
         # render all the roles
-        if self.resume.experience and self.settings.experience:
+        if self.settings.experience and self.resume.experience:
             log.debug("Rendering experience section")
             RenderExperienceSection(
                 self.document,
@@ -152,8 +152,8 @@ class RenderResume(ResumeRenderBase):
 
         # Render Education at end if render_at_end is True
         if (
-            self.resume.education
-            and self.settings.education
+            self.settings.education
+            and self.resume.education
             and self.settings.education_settings.render_at_end
         ):
             log.debug("Rendering education section at end")
@@ -0,0 +1,149 @@
+"""Prepare resume content once, for every render backend.
+
+Each backend walks the same parsed resume: it drops roles older than the
+`months_ago` setting, builds the executive summary and skills matrix, and
+splits responsibilities into lines. These functions do that preparation in one
+place, and cache the results against the model objects, so when one process
+renders several formats from the same Resume the work is done once.
+
+Results are shared between callers, and must not be modified.
+
+"""
+
+import logging
+import weakref
+from datetime import datetime, timedelta, timezone
+
+from resume_writer.models.experience import Experience, Role, Roles
+from resume_writer.utils.executive_summary import ExecutiveSummary
+from resume_writer.utils.skills_matrix import SkillsMatrix
+
+log = logging.getLogger(__name__)
+
+# filtered roles, by months_ago and the day they were filtered on
+_recent_roles: "weakref.WeakKeyDictionary[Roles, dict[tuple, list[Role]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# executive summaries, by categories
+_executive_summaries: "weakref.WeakKeyDictionary[Experience, dict[tuple, dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# skills matrices, by skills and the day they were computed on
+_skills_matrices: "weakref.WeakKeyDictionary[Roles, dict[tuple, dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _today() -> str:
+    """Return today's UTC date, for keys of results that depend on it."""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def recent_roles(roles: Roles, months_ago: int | str | None) -> list[Role]:
+    """Return the roles which have not been filtered out by age.
+
+    Args:
+        roles (Roles): The parsed roles.
+        months_ago (int | str | None): Drop roles which ended more than this many
+            months ago. 0 or None keeps every role.
+
+    Returns:
+        list[Role]: The roles to render, in their original order.
+
+    Notes:
+        1. If the roles have already been filtered today with months_ago, the
+           earlier result is returned.
+        2. Otherwise, if months_ago is set and greater than 0, a role whose end
+           date is more than months_ago * 30 days ago is skipped. Roles without
+           an end date are current, and always kept.
+        3. The result is cached against the Roles object.
+
+    """
+    assert isinstance(roles, Roles), "roles must be a Roles object"
+
+    _months_ago = int(months_ago) if months_ago else 0
+    _key = (_months_ago, _today())
+    _cached = _recent_roles.setdefault(roles, {})
+    if _key in _cached:
+        return _cached[_key]
+
+    _roles = list(roles)
+    if _months_ago > 0:
+        _now = datetime.now(tz=timezone.utc)
+        _threshold = _now - timedelta(days=_months_ago * 30)
+        _roles = [
+            _role for _role in _roles if (_role.basics.end_date or _now) >= _threshold
+        ]
+
+    _cached[_key] = _roles
+    return _roles
+
+
+def executive_summary(experience: Experience, categories: list[str]) -> dict[str, list]:
+    """Return the executive summary of the experience, for the categories.
+
+    Args:
+        experience (Experience): The parsed experience.
+        categories (list[str]): The job categories to summarize, in order.
+
+    Returns:
+        dict[str, list]: The summaries of the roles in each category, from
+            `ExecutiveSummary.summary`.
+
+    Notes:
+        1. The summary is built with ExecutiveSummary the first time the
+           categories are asked for.
+        2. The result is cached against the Experience object.
+
+    """
+    assert isinstance(experience, Experience), "experience must be an Experience"
+
+    _key = tuple(categories)
+    _cached = _executive_summaries.setdefault(experience, {})
+    if _key not in _cached:
+        _cached[_key] = ExecutiveSummary(experience).summary(list(categories))
+    return _cached[_key]
+
+
+def skills_matrix(roles: Roles, skills: list[str]) -> dict[str, dict]:
+    """Return the skills matrix of the roles, for the skills.
+
+    Args:
+        roles (Roles): The parsed roles.
+        skills (list[str]): The skills to include, or ["*all*"] for every skill.
+
+    Returns:
+        dict[str, dict]: The years of experience and first and last use of each
+            skill, from `SkillsMatrix.matrix`.
+
+    Notes:
+        1. The matrix is built with SkillsMatrix the first time the skills are
+           asked for on a day, as years of experience are counted up to today.
+        2. The result is cached against the Roles object.
+
+    """
+    assert isinstance(roles, Roles), "roles must be a Roles object"
+
+    _key = (tuple(skills), _today())
+    _cached = _skills_matrices.setdefault(roles, {})
+    if _key not in _cached:
+        _cached[_key] = SkillsMatrix(roles).matrix(list(skills))
+    return _cached[_key]
+
+
+def responsibility_lines(text: str) -> list[str]:
+    """Split the text of a role's responsibilities into lines.
+
+    Args:
+        text (str): The responsibilities text.
+
+    Returns:
+        list[str]: The lines, with the blank lines between paragraphs removed.
+
+    Notes:
+        1. Double newlines are collapsed to one, and the text is split on newlines.
+
+    """
+    return text.replace("\n\n", "\n").split("\n")
@@ -655,12 +655,21 @@ class ResumeRenderSettings(ResumeSettingsBase):
         margin_width (float): Margin width in inches.
         top_margin (float): Top margin in inches.
         bottom_margin (float): Bottom margin in inches.
+        fast_docx (bool): Write .docx runs directly as XML instead of through python-docx.
+        coalesce_runs (bool): Merge adjacent .docx runs with the same formatting after rendering.
+        deterministic_docx (bool): Save .docx files with pinned timestamps, so identical inputs
+            give identical bytes.
+        lazy_parse (bool): Parse the blocks of each role and project the first time they are used.
 
     Methods:
         update_from_dict(data_dict: dict | None = None) -> None
             Update settings for resume and subsections.
         to_dict() -> dict
             Convert settings for resume and subsections to a dictionary.
+        rendered_sections() -> set[str]
+            Return the top-level resume sections the settings render.
+        parse_plan() -> dict
+            Return the blocks of a resume to parse for the settings.
 
     """
 
@@ -679,6 +688,10 @@ class ResumeRenderSettings(ResumeSettingsBase):
             3. The margin_width is set to 0.5.
             4. The top_margin is set to 0.5.
             5. The bottom_margin is set to 0.5.
+            6. fast_docx is set to False.
+            7. coalesce_runs is set to False.
+            8. deterministic_docx is set to False.
+            9. lazy_parse is set to False.
 
         """
         self.personal_settings = ResumePersonalSettings(default_init=default_init)
@@ -704,6 +717,14 @@ class ResumeRenderSettings(ResumeSettingsBase):
         self.margin_width = 0.5
         self.top_margin = 0.5
         self.bottom_margin = 0.5
+        # same output, built with lxml instead of python-docx run objects
+        self.fast_docx = False
+        # smaller document.xml, see docx_runs.coalesce_runs
+        self.coalesce_runs = False
+        # reproducible .docx bytes, see docx_package.save_docx
+        self.deterministic_docx = False
+        # parse role and project blocks on first use, see parse_plan
+        self.lazy_parse = False
 
     def update_from_dict(self, data_dict: dict | None = None) -> None:
         """Update settings for resume and subsections.
@@ -750,7 +771,13 @@ class ResumeRenderSettings(ResumeSettingsBase):
                including subsection settings.
 
         """
-        settings_dict = super().to_dict()
+        settings_dict = {
+            "personal": self.personal,
+            "education": self.education,
+            "certifications": self.certifications,
+            "experience": self.experience,
+            "skills_matrix": self.skills_matrix,
+        }
         settings_dict["section"] = {
             "personal": self.personal_settings.to_dict(),
             "education": self.education_settings.to_dict(),
@@ -763,7 +790,63 @@ class ResumeRenderSettings(ResumeSettingsBase):
         settings_dict["margin_width"] = self.margin_width
         settings_dict["top_margin"] = self.top_margin
         settings_dict["bottom_margin"] = self.bottom_margin
+        settings_dict["fast_docx"] = self.fast_docx
+        settings_dict["coalesce_runs"] = self.coalesce_runs
+        settings_dict["deterministic_docx"] = self.deterministic_docx
+        settings_dict["lazy_parse"] = self.lazy_parse
         settings_dict["executive_summary"] = self.executive_summary
         return settings_dict
 
+    def rendered_sections(self) -> set[str]:
+        """Return the top-level resume sections the settings render.
+
+        Returns:
+            set[str]: The names of the sections, as in `Resume.expected_blocks`.
+
+        Notes:
+            1. Personal, education and certifications are rendered when their flags are set.
+            2. Experience is rendered when the experience, executive summary or
+               skills matrix flag is set, as all three are built from it.
+
+        """
+        _sections = {
+            _name
+            for _name in ("personal", "education", "certifications")
+            if getattr(self, _name)
+        }
+        if self.experience or self.executive_summary or self.skills_matrix:
+            _sections.add("experience")
+        return _sections
+
+    def parse_plan(self) -> dict:
+        """Return the blocks of a resume to parse for the settings.
+
+        Returns:
+            dict: The `needed` plan for `Resume.parse`. Each rendered section
+                maps to the plan for its own blocks, or None to parse all of it.
+
+        Notes:
+            1. Each section from rendered_sections is parsed in full.
+            2. Without the experience flag, only the roles of the experience are
+               parsed, as the executive summary and skills matrix don't use the
+               projects.
+            3. With lazy_parse, the blocks of each role, and the skills of each
+               project, are left until they are first used. A parse error in
+               one of them is then raised while rendering.
+            4. Sections which aren't in the plan are parsed if they are used anyway.
+
+        """
+        _plan: dict = dict.fromkeys(self.rendered_sections())
+        if "experience" in _plan and (self.lazy_parse or not self.experience):
+            # an empty plan defers every block of each role
+            _plan["experience"] = {"roles": {} if self.lazy_parse else None}
+            if self.experience:
+                # a project can't be made without its overview and description
+                _plan["experience"]["projects"] = (
+                    dict.fromkeys(["overview", "description"])
+                    if self.lazy_parse
+                    else None
+                )
+        return _plan
+
     # this is the top-level, and has no section name
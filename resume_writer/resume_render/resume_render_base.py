@@ -1,5 +1,7 @@
-from datetime import datetime, timedelta, timezone
+import io
+from collections.abc import Iterable
 from pathlib import Path
+from typing import BinaryIO
 
 import docx.document
 from docx import Document
@@ -19,6 +21,13 @@ from resume_writer.models.experience import (
 )
 from resume_writer.models.personal import Personal
 from resume_writer.models.resume import Resume
+from resume_writer.resume_render.docx_context import (
+    DocxRenderContext,
+    docx_render_context,
+)
+from resume_writer.resume_render.docx_package import save_docx
+from resume_writer.resume_render.docx_runs import TextRun, add_runs, add_runs_fast
+from resume_writer.resume_render.render_content import recent_roles
 from resume_writer.resume_render.render_settings import (
     ResumeCertificationsSettings,
     ResumeEducationSettings,
@@ -28,54 +37,9 @@ from resume_writer.resume_render.render_settings import (
     ResumeProjectsSettings,
     ResumeRenderSettings,
     ResumeRolesSettings,
-    ResumeSkillsMatrixSettings,
 )
 
 
-def get_or_create_hyperlink_style(d: Document) -> str:
-    """Create a hyperlink style if one doesn't exist, or return existing style.
-
-    Args:
-        d (Document): The Document object to check or modify for the hyperlink style.
-
-    Returns:
-        str: The name of the style used for hyperlinks, which is "Hyperlink".
-
-    Notes:
-        1. Check if a style named "Hyperlink" already exists in the document.
-        2. If not, create a new style named "Default Character Font" with default character formatting.
-        3. The "Default Character Font" style is set to be the default font and is hidden.
-        4. Create a new style named "Hyperlink" based on the "Default Character Font" style.
-        5. Set the hyperlink style to be visible when used and apply blue color and underline to the font.
-        6. Return the name "Hyperlink" as the style identifier.
-
-    """
-    if "Hyperlink" not in d.styles:
-        if "Default Character Font" not in d.styles:
-            ds = d.styles.add_style(
-                "Default Character Font",
-                docx.enum.style.WD_STYLE_TYPE.CHARACTER,
-                True,  # noqa: FBT003
-            )
-            ds.element.set(docx.oxml.shared.qn("w:default"), "1")
-            ds.priority = 1
-            ds.hidden = True
-            ds.unhide_when_used = True
-            del ds
-        hs = d.styles.add_style(
-            "Hyperlink",
-            docx.enum.style.WD_STYLE_TYPE.CHARACTER,
-            True,  # noqa: FBT003
-        )
-        hs.base_style = d.styles["Default Character Font"]
-        hs.unhide_when_used = True
-        hs.font.color.rgb = docx.shared.RGBColor(0x05, 0x63, 0xC1)
-        hs.font.underline = True
-        del hs
-
-    return "Hyperlink"
-
-
 class RenderBase:
     """Base class for rendering docx files.
 
@@ -86,24 +50,33 @@ class RenderBase:
         errors (list): List of errors encountered during rendering.
         warnings (list): List of warnings encountered during rendering.
         document (docx.document.Document): The document object to render into.
+        context (DocxRenderContext): The render context shared by all sections of the document.
         font_size (float): The font size used in the document, extracted from the Normal style.
 
     Methods:
         add_horizontal_line: Adds a horizontal line to a paragraph with optional offset.
+        add_runs: Adds runs of text to a paragraph.
 
     Notes:
         1. The class initializes error and warning lists.
         2. It sets up the document reference.
-        3. It ensures the Normal style font size is set to 12pt if not already set.
+        3. It borrows the document's render context, which sets the Normal style
+           font size to 12pt if not already set, once per document.
         4. The font size is stored in the class for use by subclasses.
 
     """
 
-    def __init__(self, document: docx.document.Document):
+    def __init__(
+        self,
+        document: docx.document.Document,
+        context: DocxRenderContext | None = None,
+    ):
         """Initialize superclass.
 
         Args:
             document (docx.document.Document): The document object to render into.
+            context (DocxRenderContext | None): The document's render context. If None,
+                the context shared by the document's sections is used.
 
         Returns:
             None
@@ -111,30 +84,19 @@ class RenderBase:
         Notes:
             1. Initialize errors and warnings lists.
             2. Store the document reference.
-            3. Ensure the Normal style font size is set to 12pt if not already set.
-            4. Store the font size from the Normal style in the class.
-            5. Raise ValueError if the font size is not set.
+            3. Get the document's render context, which sets up the Normal style
+               the first time it is used for the document.
+            4. Store the font size from the context in the class.
 
         """
         self.errors = []
         self.warnings = []
 
         self.document = document
-
-        _normal = self.document.styles["Normal"]
-        _font = _normal.font
-        _font.name = "Calibri Light"
-
-        # font size should always be set. Other classes use it for scaling.
-        # If it isn't set, the other classes will fail.
-        if not _font.size:
-            _font.size = Pt(12)
+        self.context = context if context is not None else docx_render_context(document)
 
         # put the font-size into the class, so subclasses easily use it
-        if _normal.font.size:
-            self.font_size = _normal.font.size.pt
-        else:
-            raise ValueError("Normal style font size not set.")
+        self.font_size = self.context.font_size
 
     def add_horizontal_line(self, paragraph: Paragraph, offset: int = 0) -> None:
         """Add a horizontal line to a paragraph with optional offset.
@@ -167,6 +129,27 @@ class RenderBase:
         paragraph.paragraph_format.left_indent = Inches(offset)
         paragraph.paragraph_format.right_indent = Inches(offset)
 
+    def add_runs(self, paragraph: Paragraph, runs: Iterable[TextRun]) -> None:
+        """Add runs of text to the end of a paragraph.
+
+        Args:
+            paragraph (Paragraph): The paragraph to add the runs to.
+            runs (Iterable[TextRun]): The runs to add, as (texts, bold) pairs.
+
+        Returns:
+            None
+
+        Notes:
+            1. If the render context's fast_docx is set, the runs' XML is written
+               directly with add_runs_fast, otherwise python-docx is used.
+            2. Both produce the same XML.
+
+        """
+        if self.context.fast_docx:
+            add_runs_fast(paragraph, runs)
+        else:
+            add_runs(paragraph, runs)
+
     def add_hyperlink(
         self,
         paragraph: Paragraph,
@@ -192,11 +175,11 @@ class RenderBase:
 
         Notes:
             1. Access the document part of the paragraph to manage relationships.
-            2. Create a unique relationship ID for the hyperlink using the provided URL.
+            2. Get the relationship ID for the URL from the render context, which reuses it for repeated URLs.
             3. Create an XML element for the hyperlink and set its relationship ID.
             4. Create a new run element to hold the hyperlink text.
             5. Set the text of the run to the provided display text.
-            6. Apply the hyperlink style to the run by retrieving or creating it.
+            6. Apply the hyperlink style to the run, which the render context creates on first use.
             7. Append the run element to the hyperlink XML element.
             8. Append the complete hyperlink element to the paragraph's XML content.
             9. Return the created hyperlink element.
@@ -206,13 +189,9 @@ class RenderBase:
         if font_size == 0:
             font_size = self.font_size
 
-        # This gets access to the document.xml.rels file and gets a new relation id value
+        # This gets access to the document.xml.rels file and gets a relation id value
         part = paragraph.part
-        r_id = part.relate_to(
-            url,
-            docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK,
-            is_external=True,
-        )
+        r_id = self.context.hyperlink_rel_id(part, url)
 
         # Create the w:hyperlink tag and add needed values
         hyperlink = docx.oxml.shared.OxmlElement("w:hyperlink")
@@ -229,7 +208,7 @@ class RenderBase:
         new_run.italic = italic
 
         # Set the run's style to the builtin hyperlink style, defining it if necessary
-        new_run.style = get_or_create_hyperlink_style(part.document)
+        new_run.style = self.context.hyperlink_style()
 
         # Join all the xml elements together
         hyperlink.append(new_run._element)  # noqa: SLF001
@@ -247,6 +226,8 @@ class ResumeRenderBase(RenderBase):
 
     Methods:
         save: Saves the rendered document to a file.
+        render_to: Renders the resume and writes the document to a binary stream.
+        render_to_bytes: Renders the resume and returns the document as bytes.
 
     Notes:
         1. The class initializes with a document, resume, and optional settings.
@@ -279,8 +260,10 @@ class ResumeRenderBase(RenderBase):
             3. Call the parent constructor to initialize common attributes.
             4. Store the settings and resume objects.
             5. Configure the Normal style to have no space before or after paragraphs.
-            6. Set the font size from settings if provided.
+            6. Set the font size from settings if provided, through the render context
+               so the sections rendered afterwards use it.
             7. Configure document margins based on settings (left, right, top, bottom).
+            8. Set the render context's fast_docx from settings.
 
         """
         assert isinstance(resume, Resume)
@@ -294,15 +277,16 @@ class ResumeRenderBase(RenderBase):
         self.settings = settings
         self.resume = resume
 
-        _normal = self.document.styles["Normal"]
+        _normal = self.context.normal_style
 
         _normal.paragraph_format.space_before = Pt(0)
         _normal.paragraph_format.space_after = Pt(0)
 
-        _font = _normal.font
-
         if self.settings.font_size:
-            _font.size = Pt(int(self.settings.font_size))
+            self.context.set_font_size(int(self.settings.font_size))
+            self.font_size = self.context.font_size
+
+        self.context.fast_docx = bool(self.settings.fast_docx)
 
         # margins are set per-section
         _section = self.document.sections[0]
@@ -327,11 +311,59 @@ class ResumeRenderBase(RenderBase):
             None
 
         Notes:
-            1. The document is saved to the specified path using the docx library.
+            1. The document is saved to the specified path with save_docx, with
+               runs merged if settings.coalesce_runs is set, and pinned
+               timestamps if settings.deterministic_docx is set.
             2. This operation writes to disk.
 
         """
-        self.document.save(path)
+        save_docx(
+            self.document,
+            path,
+            deterministic=self.settings.deterministic_docx,
+            coalesce=self.settings.coalesce_runs,
+        )
+
+    def render_to(self, stream: BinaryIO) -> None:
+        """Render the resume and write the document to a binary stream.
+
+        Args:
+            stream (BinaryIO): A writable binary file object, e.g. an HTTP response
+                body or `sys.stdout.buffer`.
+
+        Returns:
+            None
+
+        Notes:
+            1. A renderer of the same class renders the resume into a new Word
+               document, so every call gives the same output, and this
+               renderer's document is left as it is.
+            2. The document is written to the stream as a .docx package, like `save`
+               writes it. Nothing is written to disk.
+
+        """
+        _renderer = type(self)(Document(), self.resume, self.settings)
+        _renderer.render()
+        save_docx(
+            _renderer.document,
+            stream,
+            deterministic=self.settings.deterministic_docx,
+            coalesce=self.settings.coalesce_runs,
+        )
+
+    def render_to_bytes(self) -> bytes:
+        """Render the resume and return the document as .docx bytes.
+
+        Returns:
+            bytes: The .docx package.
+
+        Notes:
+            1. The document is rendered with render_to into an in-memory buffer.
+
+        """
+        _buffer = io.BytesIO()
+        self.render_to(_buffer)
+        return _buffer.getvalue()
 
 
 class ResumeRenderPersonalBase(RenderBase):
@@ -447,25 +479,13 @@ class ResumeRenderRolesBase(RenderBase):
             list[Role]: A list of Role objects that are not older than the specified number of months.
 
         Notes:
-            1. Initialize an empty list to store filtered roles.
-            2. Iterate through each role in _roles.
-            3. If months_ago is set and greater than 0, calculate the date threshold.
-            4. If the role's end date is older than the threshold, skip it.
-            5. Otherwise, add the role to the result list.
-            6. Return the filtered list.
+            1. The roles are filtered by render_content.recent_roles, once per
+               resume, for every format rendered from it.
+            2. If months_ago is set and greater than 0, roles which ended before
+               the threshold are left out.
 
         """
-        _ret_roles = []
-        for _role in self._roles:
-            # Check if the role is older than the specified number of months
-            if self.settings.months_ago and int(self.settings.months_ago) > 0:
-                _now = datetime.now(tz=timezone.utc)
-                _end_date = _role.basics.end_date or _now
-                _months_ago = _now - timedelta(days=int(self.settings.months_ago) * 30)
-                if _end_date < _months_ago:
-                    continue
-            _ret_roles.append(_role)
-        return _ret_roles
+        return recent_roles(self._roles, self.settings.months_ago)
 
 
 class ResumeRenderRoleBase(RenderBase):
@@ -945,52 +965,3 @@ class ResumeRenderExecutiveSummaryBase(RenderBase):
         self.experience = experience
         self.document = document
         self.settings = settings
-
-
-class ResumeRenderSkillsMatrixBase(RenderBase):
-    """Base class for rendering resume skills matrix section.
-
-    Attributes:
-        experience (Experience): The experience object containing data for the skills matrix.
-        document (docx.document.Document): The document object to render into.
-        settings (ResumeSkillsMatrixSettings): Configuration settings for the skills matrix section.
-
-    Methods:
-        None
-
-    Notes:
-        1. The class initializes with a document, experience, and settings.
-        2. It validates the types of the inputs.
-        3. It calls the parent constructor.
-
-    """
-
-    def __init__(
-        self,
-        document: docx.document.Document,
-        experience: Experience,
-        settings: ResumeSkillsMatrixSettings,
-    ) -> None:
-        """Initialize the skills matrix section.
-
-        Args:
-            document (docx.document.Document): The document object to render into.
-            experience (Experience): The experience object to extract skills data from.
-            settings (ResumeSkillsMatrixSettings): Configuration settings for the skills matrix section.
-
-        Returns:
-            None
-
-        Notes:
-            1. Call the parent constructor.
-            2. Validate that experience is of type Experience.
-            3. Validate that settings is of type ResumeSkillsMatrixSettings.
-            4. Store the experience, document, and settings.
-
-        """
-        super().__init__(document=document)
-        assert isinstance(experience, Experience)
-        assert isinstance(settings, ResumeSkillsMatrixSettings)
-        self.experience = experience
-        self.document = document
-        self.settings = settings
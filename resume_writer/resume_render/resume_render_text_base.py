@@ -1,5 +1,4 @@
 import logging
-from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from jinja2 import Environment
@@ -14,6 +13,7 @@ from resume_writer.models.experience import (
 )
 from resume_writer.models.personal import Personal
 from resume_writer.models.resume import Resume
+from resume_writer.resume_render.render_content import recent_roles
 from resume_writer.resume_render.render_settings import (
     ResumeCertificationsSettings,
     ResumeEducationSettings,
@@ -81,12 +81,15 @@ class RenderBase:
             None
 
         Notes:
-            1. Opens the file at the given path in write mode.
-            2. Writes the document's text content to the file.
-            3. Closes the file.
+            1. Removes any existing file at the path, so an output hardlinked
+               to a cached entry is replaced rather than written through.
+            2. Opens the file at the given path in write mode.
+            3. Streams the document's chunks to the file, without joining them.
+            4. Closes the file.
         """
+        path.unlink(missing_ok=True)
         with path.open("w") as f:
-            f.write(self.document.text)
+            self.document.stream_to(f)
 
     def add_error(self, error: str) -> None:
         """Add an error to the list of errors.
@@ -312,24 +315,12 @@ class ResumeRenderRolesBase(RenderBase):
             list[Role]: A list of roles that are not older than the specified number of months.
 
         Notes:
-            1. Initializes an empty list to store filtered roles.
-            2. Iterates over each role in the _roles list.
-            3. If the settings specify a number of months ago, checks if the role's end date is older than that time.
-            4. If the role is older than the specified time, skips it.
-            5. Otherwise, adds the role to the filtered list.
-            6. Returns the filtered list of roles.
+            1. The roles are filtered by render_content.recent_roles, once per
+               resume, for every format rendered from it.
+            2. If the settings specify a number of months ago, roles which ended
+               before then are left out.
         """
-        _ret_roles = []
-        for _role in self._roles:
-            # Check if the role is older than the specified number of months
-            if self.settings.months_ago and int(self.settings.months_ago) > 0:
-                _now = datetime.now(tz=timezone.utc)
-                _end_date = _role.basics.end_date or _now
-                _months_ago = _now - timedelta(days=int(self.settings.months_ago) * 30)
-                if _end_date < _months_ago:
-                    continue
-            _ret_roles.append(_role)
-        return _ret_roles
+        return recent_roles(self._roles, self.settings.months_ago)
 
 
 class ResumeRenderProjectsBase(RenderBase):
@@ -0,0 +1,96 @@
+"""The base class for docx skills matrix sections, and the table they share."""
+
+import docx.document
+from docx.table import Table
+
+from resume_writer.models.experience import Experience
+from resume_writer.resume_render.docx_tables import add_text_table
+from resume_writer.resume_render.render_settings import ResumeSkillsMatrixSettings
+from resume_writer.resume_render.resume_render_base import RenderBase
+
+
+class ResumeRenderSkillsMatrixBase(RenderBase):
+    """Base class for rendering resume skills matrix section.
+
+    Attributes:
+        experience (Experience): The experience object containing data for the skills matrix.
+        document (docx.document.Document): The document object to render into.
+        settings (ResumeSkillsMatrixSettings): Configuration settings for the skills matrix section.
+
+    Methods:
+        add_skills_table: Adds a table of skills and their years of experience, two skills per row.
+
+    Notes:
+        1. The class initializes with a document, experience, and settings.
+        2. It validates the types of the inputs.
+        3. It calls the parent constructor.
+
+    """
+
+    def __init__(
+        self,
+        document: docx.document.Document,
+        experience: Experience,
+        settings: ResumeSkillsMatrixSettings,
+    ) -> None:
+        """Initialize the skills matrix section.
+
+        Args:
+            document (docx.document.Document): The document object to render into.
+            experience (Experience): The experience object to extract skills data from.
+            settings (ResumeSkillsMatrixSettings): Configuration settings for the skills matrix section.
+
+        Returns:
+            None
+
+        Notes:
+            1. Call the parent constructor.
+            2. Validate that experience is of type Experience.
+            3. Validate that settings is of type ResumeSkillsMatrixSettings.
+            4. Store the experience, document, and settings.
+
+        """
+        super().__init__(document=document)
+        assert isinstance(experience, Experience)
+        assert isinstance(settings, ResumeSkillsMatrixSettings)
+        self.experience = experience
+        self.document = document
+        self.settings = settings
+
+    def add_skills_table(self, skills_matrix: dict[str, dict]) -> Table:
+        """Add a table of skills and their years of experience, two skills per row.
+
+        Args:
+            skills_matrix (dict[str, dict]): The skills matrix, mapping each skill to
+                a dict with "yoe", "first_used" and "last_used" keys.
+
+        Returns:
+            Table: The table added to the document.
+
+        Notes:
+            1. Format each skill's YOE string as "X (from - to)", using the years of
+               first_used and last_used, or "N/A" if a date is missing.
+            2. Pair up the skills, two per row, as (skill, YOE, skill, YOE). An odd
+               last skill leaves the last two cells empty.
+            3. Add the table with add_text_table, with "Skill" and "YOE (from - to)"
+               header labels, centering the skill columns vertically.
+
+        """
+        _cells = []
+        for _skill, _data in skills_matrix.items():
+            _first_used = (
+                _data["first_used"].strftime("%Y") if _data["first_used"] else "N/A"
+            )
+            _last_used = (
+                _data["last_used"].strftime("%Y") if _data["last_used"] else "N/A"
+            )
+            _cells.extend([_skill, f"{_data['yoe']} ({_first_used} - {_last_used})"])
+
+        _rows = [_cells[_ndx : _ndx + 4] for _ndx in range(0, len(_cells), 4)]
+
+        return add_text_table(
+            self.document,
+            ["Skill", "YOE (from - to)", "Skill", "YOE (from - to)"],
+            _rows,
+            centered_columns=(0, 2),
+        )
@@ -0,0 +1,697 @@
+"""Serve render requests from a long-running process, with warm caches.
+
+Each CLI run imports python-docx, NLTK and dateparser, and reads its settings
+file, before it renders anything. `serve` pays those costs once: it loads the
+settings profiles at startup, warms the NLTK model, the date parser and the
+compiled templates, and keeps recently parsed resumes in memory.
+
+Requests are HTTP/1.1 over a local TCP port or a Unix socket, one per
+connection:
+
+    POST /render
+    {"resume": "<resume text>", "resume_type": "plain",
+     "profile": "full", "settings": {"fast_docx": true}}
+
+returns the rendered document. "profile" names a settings file given to
+`serve`, and "settings" overrides entries of its [resume.render] table; both
+are optional. `GET /health` returns the profiles and resume types. Errors are
+returned as JSON, e.g. `{"error": "unknown resume type"}`.
+
+The .docx formats are rendered in a pool of worker processes, and HTML and
+Markdown in threads, so a slow render never blocks the event loop.
+
+"""
+
+import asyncio
+import copy
+import io
+import json
+import logging
+import signal
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import docx
+
+from resume_writer.models.resume import Resume
+from resume_writer.renderers.html_renderer import jinja_environment
+from resume_writer.rendering import (
+    DOCX_RENDERERS,
+    OUTPUT_SUFFIXES,
+    load_render_settings,
+    parse_resume_text,
+    render_to_stream,
+)
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+from resume_writer.utils.date_parser import parse_date
+from resume_writer.utils.resume_cache import ParsedResumeCache
+from resume_writer.utils.skills_splitter import skills_splitter
+
+log = logging.getLogger(__name__)
+
+# parsed resumes kept in memory by each process
+WARM_RESUMES = 32
+
+# largest request body accepted, in bytes
+MAX_REQUEST_SIZE = 10 * 1024 * 1024
+
+# longest request line and headers accepted, in bytes
+_MAX_HEADER_SIZE = 64 * 1024
+
+# renders by a worker process before it is replaced, bounding its memory
+WORKER_MAX_TASKS = 500
+
+CONTENT_TYPES = {
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".html": "text/html; charset=utf-8",
+    ".md": "text/markdown; charset=utf-8",
+}
+
+
+class RequestError(Exception):
+    """A request which can't be served, and the HTTP status to answer it with."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        """Initialize the error.
+
+        Args:
+            status (HTTPStatus): The response status.
+            message (str): The reason, returned to the client.
+
+        Returns:
+            None
+
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class RenderRequest:
+    """One resume to render in one format.
+
+    Attributes:
+        resume_text (str): The full text of the resume.
+        resume_type (str): The format to render, one of OUTPUT_SUFFIXES.
+        settings (ResumeRenderSettings): The rendering settings.
+
+    """
+
+    def __init__(
+        self,
+        resume_text: str,
+        resume_type: str,
+        settings: ResumeRenderSettings,
+    ):
+        """Initialize the request.
+
+        Args:
+            resume_text (str): The full text of the resume.
+            resume_type (str): The format to render.
+            settings (ResumeRenderSettings): The rendering settings.
+
+        Returns:
+            None
+
+        Notes:
+            1. Validate the arguments, and store them.
+
+        """
+        assert isinstance(resume_text, str), "resume_text must be a string"
+        assert resume_type in OUTPUT_SUFFIXES, "unknown resume type"
+        assert isinstance(settings, ResumeRenderSettings)
+
+        self.resume_text = resume_text
+        self.resume_type = resume_type
+        self.settings = settings
+
+
+class WarmResumes:
+    """The most recently parsed resumes of a process, by the hash of their text.
+
+    Rendering the same resume again, in another format or with other settings,
+    reuses the parsed Resume, along with the content prepared for it by
+    render_content.
+
+    Attributes:
+        cache (ParsedResumeCache | None): The on-disk parsed resume cache, or None.
+        size (int): The most resumes to keep in memory.
+
+    """
+
+    def __init__(self, cache: ParsedResumeCache | None, size: int = WARM_RESUMES):
+        """Initialize the in-memory cache.
+
+        Args:
+            cache (ParsedResumeCache | None): The on-disk parsed resume cache
+                to parse through, or None to always parse.
+            size (int): The most resumes to keep in memory.
+
+        Returns:
+            None
+
+        """
+        assert size >= 1, "size must be at least 1"
+
+        self.cache = cache
+        self.size = size
+        self._resumes: OrderedDict[str, Resume] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resume(self, resume_text: str) -> Resume:
+        """Return the parsed resume for the text.
+
+        Args:
+            resume_text (str): The full text of the resume.
+
+        Returns:
+            Resume: The parsed resume. It is shared, and must not be modified.
+
+        Notes:
+            1. A resume kept in memory is returned, and marked as recently used.
+            2. Otherwise the text is parsed with parse_resume_text, through the
+               on-disk cache, and kept.
+            3. The least recently used resumes are dropped past size.
+            4. Disk access: Reads or writes the parsed resume cache, on a miss.
+
+        """
+        _key = ParsedResumeCache.key(resume_text)
+        with self._lock:
+            if _key in self._resumes:
+                self._resumes.move_to_end(_key)
+                return self._resumes[_key]
+
+        _resume = parse_resume_text(resume_text, cache=self.cache)
+
+        with self._lock:
+            self._resumes[_key] = _resume
+            while len(self._resumes) > self.size:
+                self._resumes.popitem(last=False)
+        return _resume
+
+
+# this process's parsed resumes, replaced by init_render_worker
+_warm_resumes = WarmResumes(None)
+
+
+def warm_up() -> None:
+    """Load everything a render loads on first use, so the first request is fast.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Notes:
+        1. Splitting a sentence loads the NLTK punkt model, if it is installed.
+        2. Parsing a date which isn't in a common format creates the dateparser parser.
+        3. The Jinja environment is created, compiling every template.
+        4. A new Word document loads python-docx's default template.
+        5. Disk access: Reads the NLTK data, the templates and the docx template.
+
+    """
+    skills_splitter("Warm up the tokenizer.", ["tokenizer"])
+    parse_date("1 January 2020")
+    jinja_environment()
+    docx.Document()
+
+
+def init_render_worker(cache_dir: Path | None, log_level: int) -> None:
+    """Set up a process to render requests.
+
+    Args:
+        cache_dir (Path | None): The parsed resume cache directory, or None to always parse.
+        log_level (int): The log level of the server.
+
+    Returns:
+        None
+
+    Notes:
+        1. The root log level is set to log_level.
+        2. The process's WarmResumes is replaced by one using the cache.
+        3. The process is warmed up with warm_up.
+
+    """
+    global _warm_resumes  # noqa: PLW0603 - one per process, shared by its threads
+
+    logging.getLogger().setLevel(log_level)
+    _cache = None if cache_dir is None else ParsedResumeCache(cache_dir)
+    _warm_resumes = WarmResumes(_cache)
+    warm_up()
+
+
+def render_request(request: RenderRequest) -> bytes:
+    """Render a request in this process.
+
+    Args:
+        request (RenderRequest): The resume, format and settings.
+
+    Returns:
+        bytes: The rendered document.
+
+    Notes:
+        1. The resume is parsed, or taken from this process's WarmResumes.
+        2. It is rendered to memory with render_to_stream.
+
+    """
+    _resume = _warm_resumes.resume(request.resume_text)
+    _buffer = io.BytesIO()
+    render_to_stream(request.resume_type, _resume, request.settings, _buffer)
+    return _buffer.getvalue()
+
+
+def load_profiles(settings_files: tuple[str, ...]) -> dict[str, ResumeRenderSettings]:
+    """Load the settings profiles given to serve.
+
+    Args:
+        settings_files (tuple[str, ...]): Settings files, each as NAME=PATH, or
+            PATH to name the profile after the file's stem.
+
+    Returns:
+        dict[str, ResumeRenderSettings]: The render settings of each profile, by name.
+
+    Notes:
+        1. Each file is read once, with load_render_settings.
+        2. Disk access: Reads each settings file.
+
+    """
+    _profiles = {}
+    for _settings_file in settings_files:
+        _name, _sep, _path = _settings_file.rpartition("=")
+        if not _sep:
+            _name = Path(_path).stem
+        _profiles[_name] = load_render_settings(_path, echo=False)
+        _msg = f"Loaded settings profile {_name!r} from {_path}"
+        log.info(_msg)
+    return _profiles
+
+
+class RenderServer:
+    """Answer render requests over HTTP, rendering them in warm pools.
+
+    Attributes:
+        profiles (dict[str, ResumeRenderSettings]): The settings profiles, by name.
+        cache_dir (Path | None): The parsed resume cache directory, or None.
+        jobs (int): The number of worker processes rendering .docx formats.
+
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, ResumeRenderSettings],
+        cache_dir: Path | None,
+        jobs: int,
+    ):
+        """Initialize the server. Its pools are started by start.
+
+        Args:
+            profiles (dict[str, ResumeRenderSettings]): The settings profiles, by name.
+            cache_dir (Path | None): The parsed resume cache directory, or None to always parse.
+            jobs (int): The number of worker processes, and of threads.
+
+        Returns:
+            None
+
+        """
+        assert jobs >= 1, "jobs must be at least 1"
+
+        self.profiles = profiles
+        self.cache_dir = cache_dir
+        self.jobs = jobs
+        self._processes: ProcessPoolExecutor | None = None
+        self._threads: ThreadPoolExecutor | None = None
+
+    async def start(
+        self,
+        host: str,
+        port: int,
+        socket_path: Path | None = None,
+    ) -> asyncio.Server:
+        """Start the pools, and listen for requests.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The TCP port to listen on, 0 for any free port.
+            socket_path (Path | None): A Unix socket to listen on instead of host and port.
+
+        Returns:
+            asyncio.Server: The listening server.
+
+        Notes:
+            1. This process and every worker process are set up with
+               init_render_worker, and warmed up before the first request.
+            2. On Python 3.11 and later, a worker process is replaced after
+               WORKER_MAX_TASKS renders, so a long-running server's memory
+               stays bounded.
+            3. Disk access: Creates socket_path, if given.
+
+        """
+        _log_level = logging.getLogger().level
+        init_render_worker(self.cache_dir, _log_level)
+        self._threads = ThreadPoolExecutor(max_workers=self.jobs)
+        # max_tasks_per_child is new in Python 3.11
+        _recycle = (
+            {"max_tasks_per_child": WORKER_MAX_TASKS}
+            if sys.version_info >= (3, 11)
+            else {}
+        )
+        self._processes = ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=init_render_worker,
+            initargs=(self.cache_dir, _log_level),
+            **_recycle,
+        )
+
+        # start every worker now, rather than on the first requests
+        _loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                _loop.run_in_executor(self._processes, time.sleep, 0)
+                for _ in range(self.jobs)
+            ),
+        )
+
+        if socket_path is not None:
+            return await asyncio.start_unix_server(
+                self.handle,
+                path=socket_path,
+                limit=_MAX_HEADER_SIZE,
+            )
+        return await asyncio.start_server(
+            self.handle,
+            host=host,
+            port=port,
+            limit=_MAX_HEADER_SIZE,
+        )
+
+    def close(self) -> None:
+        """Shut down the pools, waiting for running renders to finish."""
+        for _pool in (self._threads, self._processes):
+            if _pool is not None:
+                _pool.shutdown()
+        self._threads = self._processes = None
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer the request on a connection, then close it.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's input.
+            writer (asyncio.StreamWriter): The connection's output.
+
+        Returns:
+            None
+
+        Notes:
+            1. The request is read and answered with respond.
+            2. A RequestError is answered with its status, and any other
+               error with 500, as JSON.
+
+        """
+        _start = time.perf_counter()
+        try:
+            _method, _path, _body = await read_request(reader)
+            _status, _content_type, _content = await self.respond(
+                _method,
+                _path,
+                _body,
+            )
+        except RequestError as _e:
+            _status, _content_type, _content = _error_response(_e.status, str(_e))
+        except Exception as _e:  # noqa: BLE001 - a failed render must not stop the server
+            _msg = f"Failed to serve a request: {type(_e).__name__}: {_e}"
+            log.warning(_msg)
+            _status, _content_type, _content = _error_response(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                f"{type(_e).__name__}: {_e}",
+            )
+
+        await write_response(writer, _status, _content_type, _content)
+        _msg = f"{_status.value} in {time.perf_counter() - _start:.3f}s"
+        log.info(_msg)
+
+    async def respond(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+    ) -> tuple[HTTPStatus, str, bytes]:
+        """Return the status, content type and content answering a request.
+
+        Args:
+            method (str): The request method.
+            path (str): The request path, without its query.
+            body (bytes): The request body.
+
+        Returns:
+            tuple[HTTPStatus, str, bytes]: The response.
+
+        Notes:
+            1. GET /health returns the profiles and resume types.
+            2. POST /render renders the request in the body, the .docx formats
+               in the process pool and the others in the thread pool.
+            3. Anything else raises a RequestError.
+
+        """
+        _routes = {"/health": "GET", "/render": "POST"}
+        if path not in _routes:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"no such path: {path}")
+        if method != _routes[path]:
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"use {_routes[path]}")
+
+        if path == "/health":
+            _health = {
+                "status": "ok",
+                "profiles": list(self.profiles),
+                "resume_types": list(OUTPUT_SUFFIXES),
+            }
+            return HTTPStatus.OK, "application/json", json.dumps(_health).encode()
+
+        _request = render_request_from_json(body, self.profiles)
+        _pool = (
+            self._processes if _request.resume_type in DOCX_RENDERERS else self._threads
+        )
+        _loop = asyncio.get_running_loop()
+        _content = await _loop.run_in_executor(_pool, render_request, _request)
+        _content_type = CONTENT_TYPES[OUTPUT_SUFFIXES[_request.resume_type]]
+        return HTTPStatus.OK, _content_type, _content
+
+
+def render_request_from_json(
+    body: bytes,
+    profiles: dict[str, ResumeRenderSettings],
+) -> RenderRequest:
+    """Read a render request from a JSON request body.
+
+    Args:
+        body (bytes): The request body, a JSON object with "resume",
+            "resume_type", and optionally "profile" and "settings".
+        profiles (dict[str, ResumeRenderSettings]): The settings profiles, by name.
+
+    Returns:
+        RenderRequest: The request to render.
+
+    Notes:
+        1. The settings start as a copy of the named profile, or the defaults.
+        2. The "settings" object is checked with _check_settings, and applied
+           over them as a [resume.render] table.
+        3. A body which isn't a valid request raises a RequestError.
+
+    """
+    try:
+        _json = json.loads(body)
+    except ValueError as _e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"invalid JSON: {_e}") from _e
+    if not isinstance(_json, dict) or not isinstance(_json.get("resume"), str):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "resume must be a string")
+
+    _resume_type = _json.get("resume_type")
+    if _resume_type not in OUTPUT_SUFFIXES:
+        raise RequestError(
+            HTTPStatus.BAD_REQUEST,
+            f"unknown resume type: {_resume_type}",
+        )
+
+    _profile = _json.get("profile")
+    if _profile is not None and _profile not in profiles:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"unknown profile: {_profile}")
+    _settings = copy.deepcopy(profiles.get(_profile, ResumeRenderSettings()))
+    _overrides = _json.get("settings") or {}
+    _check_settings(_overrides, _settings.to_dict(), "settings")
+    _settings.update_from_dict(_overrides)
+
+    return RenderRequest(_json["resume"], _resume_type, _settings)
+
+
+def _check_settings(overrides: object, known: dict, name: str) -> None:
+    """Raise a RequestError unless every override names a known setting.
+
+    Args:
+        overrides (object): The "settings" of a request, or a table inside it.
+        known (dict): The settings the overrides may set, from to_dict.
+        name (str): Where the overrides are in the request, for the error.
+
+    Returns:
+        None
+
+    Notes:
+        1. The overrides must be an object, and each key a setting in known.
+        2. A table of settings, such as "section", is checked the same way.
+        3. Any other setting must be a single value, not an object or a list,
+           so an override can't replace a table of settings.
+
+    """
+    if not isinstance(overrides, dict):
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"{name} must be an object")
+    for _key, _value in overrides.items():
+        _name = f"{name}.{_key}"
+        if _key not in known:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"unknown setting: {_name}")
+        _check_setting(_value, known[_key], _name)
+
+
+def _check_setting(value: object, known: object, name: str) -> None:
+    """Raise a RequestError unless value can override the known setting, see _check_settings."""
+    if isinstance(known, dict):
+        _check_settings(value, known, name)
+    elif isinstance(value, (dict, list)):
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"{name} must be a value")
+
+
+async def read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    """Read an HTTP request from a connection.
+
+    Args:
+        reader (asyncio.StreamReader): The connection's input.
+
+    Returns:
+        tuple[str, str, bytes]: The method, the path without its query, and the body.
+
+    Notes:
+        1. The request line and headers are read up to the blank line after them.
+        2. The body is read as Content-Length bytes. Chunked bodies aren't supported.
+        3. A malformed or oversized request, an invalid Content-Length, or a
+           body shorter than it, raises a RequestError.
+
+    """
+    try:
+        _head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as _e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "incomplete request") from _e
+
+    _lines = _head.decode("latin-1").split("\r\n")
+    _parts = _lines[0].split()
+    if len(_parts) != 3:  # noqa: PLR2004 - method, target and version
+        raise RequestError(HTTPStatus.BAD_REQUEST, "malformed request line")
+    _method, _target, _version = _parts
+
+    _headers = {}
+    for _line in filter(None, _lines[1:]):
+        _name, _sep, _value = _line.partition(":")
+        _headers[_name.strip().lower()] = _value.strip()
+
+    try:
+        _body = await reader.readexactly(_content_length(_headers))
+    except asyncio.IncompleteReadError as _e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "incomplete request body") from _e
+    return _method, urlsplit(_target).path, _body
+
+
+def _content_length(headers: dict[str, str]) -> int:
+    """Return the request's Content-Length, 0 if it has none, or raise a RequestError."""
+    try:
+        _length = int(headers.get("content-length", "0") or "0")
+    except ValueError as _e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from _e
+    if _length < 0:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    if _length > MAX_REQUEST_SIZE:
+        raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request too large")
+    return _length
+
+
+async def write_response(
+    writer: asyncio.StreamWriter,
+    status: HTTPStatus,
+    content_type: str,
+    content: bytes,
+) -> None:
+    """Write an HTTP response, and close the connection.
+
+    Args:
+        writer (asyncio.StreamWriter): The connection's output.
+        status (HTTPStatus): The response status.
+        content_type (str): The Content-Type of content.
+        content (bytes): The response body.
+
+    Returns:
+        None
+
+    """
+    _head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(content)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    writer.write(_head.encode("latin-1") + content)
+    try:
+        await writer.drain()
+    except ConnectionError:
+        log.warning("Client disconnected before the response was sent")
+    writer.close()
+
+
+def _error_response(status: HTTPStatus, message: str) -> tuple[HTTPStatus, str, bytes]:
+    """Return a JSON error response."""
+    return status, "application/json", json.dumps({"error": message}).encode()
+
+
+async def serve_forever(
+    server: RenderServer,
+    host: str,
+    port: int,
+    socket_path: Path | None = None,
+) -> None:
+    """Run the server until it is interrupted or terminated, then shut down its pools.
+
+    Args:
+        server (RenderServer): The server to run.
+        host (str): The address to listen on.
+        port (int): The TCP port to listen on.
+        socket_path (Path | None): A Unix socket to listen on instead of host and port.
+
+    Returns:
+        None
+
+    Notes:
+        1. SIGTERM stops the server like Ctrl-C does.
+        2. The pools are shut down once the server stops, waiting for running renders.
+
+    """
+    asyncio.get_running_loop().add_signal_handler(
+        signal.SIGTERM,
+        asyncio.current_task().cancel,
+    )
+    _listener = await server.start(host, port, socket_path)
+    _address = socket_path or ":".join(
+        str(_part) for _part in _listener.sockets[0].getsockname()[:2]
+    )
+    _msg = f"Serving render requests on {_address}"
+    log.info(_msg)
+    try:
+        async with _listener:
+            await _listener.serve_forever()
+    except asyncio.CancelledError:
+        log.info("Stopped serving render requests")
+    finally:
+        server.close()
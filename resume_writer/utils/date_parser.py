@@ -0,0 +1,139 @@
+import logging
+import re
+from datetime import datetime
+from functools import cache, lru_cache
+
+from dateparser.date import DateDataParser
+
+log = logging.getLogger(__name__)
+
+# number of distinct date strings kept by parse_date
+DATE_CACHE_SIZE = 1024
+
+# the formats resumes use most, matched without dateparser
+_MONTH_SLASH_YEAR = re.compile(r"(?P<month>\d{1,2})/(?P<year>\d{4})")
+_YEAR_DASH_MONTH = re.compile(r"(?P<year>\d{4})-(?P<month>\d{1,2})")
+_MONTH_NAME_YEAR = re.compile(r"(?P<month>[A-Za-z]+)\.?,? (?P<year>\d{4})")
+
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+
+_MONTH_LOOKUP = {
+    **{_name: _num for _num, _name in enumerate(_MONTH_NAMES, start=1)},
+    **{_name[:3]: _num for _num, _name in enumerate(_MONTH_NAMES, start=1)},
+    "sept": 9,
+}
+
+
+@cache
+def _fallback_parser() -> DateDataParser:
+    """Return the shared dateparser instance used for uncommon formats.
+
+    Args:
+        None
+
+    Returns:
+        DateDataParser: A parser restricted to English, preferring the first day of the month.
+
+    Notes:
+        1. The parser is created on first use and reused for the life of the process.
+        2. Restricting to English avoids loading every language dateparser supports.
+
+    """
+    return DateDataParser(
+        languages=["en"],
+        settings={"PREFER_DAY_OF_MONTH": "first"},
+    )
+
+
+def _match_month(month: str) -> int | None:
+    """Return the month number for a numeric or English month name.
+
+    Args:
+        month (str): The month as digits ("01"), a name ("January"), or an abbreviation ("Jan").
+
+    Returns:
+        int | None: The month number (1-12), or None if it is not a month.
+
+    Notes:
+        1. Digits are converted to an integer and range checked.
+        2. Names and abbreviations are looked up case-insensitively.
+
+    """
+    if month.isdigit():
+        _month = int(month)
+        return _month if 1 <= _month <= len(_MONTH_NAMES) else None
+
+    return _MONTH_LOOKUP.get(month.lower())
+
+
+def _fast_parse(date_string: str) -> datetime | None:
+    """Parse the common resume date formats without dateparser.
+
+    Args:
+        date_string (str): The stripped date string, e.g. "01/2020", "January 2020" or "2020-01".
+
+    Returns:
+        datetime | None: The first day of the month, or None if the format is not recognized.
+
+    Notes:
+        1. Each strict pattern is tried in turn against the whole string.
+        2. On a match, the month is validated and a naive datetime is returned.
+
+    """
+    for _pattern in (_MONTH_SLASH_YEAR, _YEAR_DASH_MONTH, _MONTH_NAME_YEAR):
+        _match = _pattern.fullmatch(date_string)
+        if _match is None:
+            continue
+
+        _month = _match_month(_match.group("month"))
+        if _month is not None:
+            return datetime(year=int(_match.group("year")), month=_month, day=1)
+
+    return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(date_string: str) -> datetime | None:
+    """Parse a date string from a resume.
+
+    Results are cached, so repeated dates are only parsed once per process.
+
+    Args:
+        date_string (str): The date as written in the resume.
+
+    Returns:
+        datetime | None: A naive datetime, on the first of the month when no day
+        is given, or None if the string is not a date.
+
+    Notes:
+        1. Surrounding whitespace is removed.
+        2. Common formats ("01/2020", "January 2020", "2020-01") are matched directly.
+        3. Anything else is parsed by dateparser, restricted to English.
+        4. The result is kept in a bounded LRU cache keyed by the date string.
+
+    """
+    assert isinstance(date_string, str), "date_string must be a string"
+
+    _date_string = date_string.strip()
+
+    _date = _fast_parse(_date_string)
+    if _date is None:
+        _msg = f"Falling back to dateparser for {_date_string!r}"
+        log.debug(_msg)
+        _date = _fallback_parser().get_date_data(_date_string).date_obj
+
+    assert isinstance(_date, (datetime, type(None)))
+    return _date
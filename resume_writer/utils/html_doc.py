@@ -1,4 +1,7 @@
-class HtmlDoc:
+from resume_writer.utils.text_doc import TextDoc
+
+
+class HtmlDoc(TextDoc):
     """HTML document.
 
     Attributes:
@@ -9,9 +12,9 @@ class HtmlDoc:
         """Initialize HTML document.
 
         Notes:
-            1. Initializes the text attribute to an empty string.
+            1. Initializes the document with no chunks of text.
         """
-        self.text: str = ""
+        super().__init__()
 
     def add_text(self, text: str) -> None:
         """Add text to HTML document.
@@ -23,7 +26,7 @@ class HtmlDoc:
             None: This function does not return a value.
 
         Notes:
-            1. Concatenates the provided text to the existing document content.
+            1. Appends the provided text to the document as a chunk.
             2. No disk, network, or database access occurs.
         """
-        self.text += text
+        self._append(text)
@@ -1,7 +1,7 @@
-import re
+from resume_writer.utils.text_doc import TextDoc
 
 
-class MarkdownDoc:
+class MarkdownDoc(TextDoc):
     """Represents a Markdown document used for generating and managing markdown content.
 
     Attributes:
@@ -12,9 +12,9 @@ class MarkdownDoc:
         """Initialize an empty Markdown document.
 
         Notes:
-            1. Initializes the internal `text` attribute as an empty string.
+            1. Initializes the document with no chunks of text.
         """
-        self.text: str = ""
+        super().__init__()
 
     def add_text(self, text: str) -> None:
         """Add formatted text to the Markdown document.
@@ -26,12 +26,12 @@ class MarkdownDoc:
             None
 
         Notes:
-            1. Strips leading and trailing whitespace from the input text.
+            1. Strips leading and trailing newlines from the input text.
             2. If the text starts with a '#' (indicating a heading), adds a newline before and after the text to ensure proper formatting in the document.
-            3. Appends the processed text to the document's internal `text` attribute.
+            3. Appends the processed text to the document as a chunk.
             4. No disk, network, or database access is performed.
         """
-        _text = re.sub(r"^\n+|\n+$", "", text)
+        _text = text.strip("\n")
         if _text.startswith("#"):
             _text = "\n" + _text + "\n"
-        self.text += _text
+        self._append(_text)
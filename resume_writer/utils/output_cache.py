@@ -0,0 +1,279 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+
+log = logging.getLogger(__name__)
+
+# used when --output-cache-size is not given
+DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".output"
+
+# entries are never written in place, see store
+_ENTRY_MODE = 0o444
+
+
+def package_version() -> str:
+    """Return the installed version of resume-writer.
+
+    Args:
+        None
+
+    Returns:
+        str: The package version, or "dev" when running from a source checkout
+            that is not installed.
+
+    Notes:
+        1. The version is read from the installed package metadata.
+
+    """
+    try:
+        return version("resume-writer")
+    except PackageNotFoundError:
+        return "dev"
+
+
+class RenderedOutputCache:
+    """Content-addressed on-disk cache of rendered resumes.
+
+    Entries are keyed by a hash of the resume text, the render settings, the
+    resume type and the package version, so rendering the same input with the
+    same settings again copies the earlier output instead of parsing and
+    rendering. The least recently used entries are removed when the cache
+    grows past max_size.
+
+    Attributes:
+        cache_dir (Path): The directory holding the cached outputs.
+        max_size (int): The most bytes of outputs to keep. 0 disables the cache.
+        hardlink (bool): Hardlink cached outputs into place, instead of copying.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size: int = DEFAULT_MAX_SIZE,
+        *,
+        hardlink: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir (Path): The base cache directory. Outputs are kept in its "rendered" subdirectory.
+            max_size (int): The most bytes of outputs to keep. 0 disables the cache.
+            hardlink (bool): Hardlink cached outputs into place, instead of copying
+                them. A hardlinked output is read-only, as editing it in place
+                would edit the cache entry too.
+
+        Returns:
+            None
+
+        Notes:
+            1. Validate that cache_dir is a Path and max_size is not negative.
+            2. Store the "rendered" subdirectory. It is created on the first store.
+
+        """
+        assert isinstance(cache_dir, Path), "cache_dir must be a Path"
+        assert max_size >= 0, "max_size must not be negative"
+
+        self.cache_dir = cache_dir / "rendered"
+        self.max_size = max_size
+        self.hardlink = hardlink
+
+    @staticmethod
+    def key(
+        resume_text: str,
+        settings: ResumeRenderSettings,
+        resume_type: str,
+    ) -> str:
+        """Return the cache key for rendering the resume text.
+
+        Args:
+            resume_text (str): The full text of the input resume.
+            settings (ResumeRenderSettings): The rendering settings for the output.
+            resume_type (str): The format to render.
+
+        Returns:
+            str: A hex SHA-256 digest of everything the output depends on.
+
+        Notes:
+            1. The package version, today's UTC date, the resume type, the
+               settings and the UTF-8 encoded text are hashed together.
+            2. The settings are hashed as JSON with sorted keys, so the order
+               they were read in does not matter.
+            3. The date is included because years of experience are counted up
+               to today, so an output is never reused on a later day.
+
+        """
+        assert isinstance(resume_text, str), "resume_text must be a string"
+        assert isinstance(settings, ResumeRenderSettings), (
+            "settings must be a ResumeRenderSettings"
+        )
+
+        _settings = json.dumps(settings.to_dict(), sort_keys=True, default=str)
+        _today = datetime.now(timezone.utc).date().isoformat()
+
+        _hash = hashlib.sha256()
+        for _part in (package_version(), _today, resume_type, _settings):
+            _hash.update(_part.encode())
+            _hash.update(b"\0")
+        _hash.update(resume_text.encode("utf-8"))
+        return _hash.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.cache_dir / f"{key}{_ENTRY_SUFFIX}"
+
+    def fetch(self, key: str, output_file: Path) -> bool:
+        """Put the cached output for the key at output_file, if there is one.
+
+        Args:
+            key (str): The cache key, from `key`.
+            output_file (Path): Where the output is wanted.
+
+        Returns:
+            bool: True on a hit, False on a miss.
+
+        Notes:
+            1. If the cache is disabled or no entry exists, False is returned.
+            2. The entry's modification time is updated, marking it as recently used.
+            3. Any existing output_file is replaced by a hardlink to the entry, if
+               hardlink is set and the link can be made, or a copy of it.
+            4. Disk access: reads the cache entry and writes output_file.
+
+        """
+        _path = self._entry_path(key)
+        if self.max_size == 0 or not _path.exists():
+            log.debug("Rendered output cache miss")
+            return False
+
+        _path.touch()
+        output_file.unlink(missing_ok=True)
+        if self.hardlink:
+            try:
+                output_file.hardlink_to(_path)
+            except OSError:
+                _msg = f"Could not hardlink {output_file}, copying it instead"
+                log.warning(_msg)
+            else:
+                log.debug("Rendered output cache hit")
+                return True
+
+        shutil.copyfile(_path, output_file)
+        log.debug("Rendered output cache hit")
+        return True
+
+    def store(self, key: str, output_file: Path) -> None:
+        """Store a rendered output under the key.
+
+        Args:
+            key (str): The cache key, from `key`.
+            output_file (Path): The rendered output.
+
+        Returns:
+            None
+
+        Notes:
+            1. If the cache is disabled, nothing is stored.
+            2. The cache directory is created if needed.
+            3. The output is copied to a temporary file, made read-only, and
+               then renamed over the entry so readers never see a partial file.
+               A hardlinked output is read-only too, so it can't be edited in
+               place by mistake.
+            4. Entries are evicted until the cache fits in max_size.
+            5. If the cache can't be written, a warning is logged and nothing is
+               stored; the output itself is already in place.
+            6. Disk access: reads output_file, and writes the cache directory.
+
+        """
+        if self.max_size == 0:
+            return
+
+        _path = self._entry_path(key)
+        _tmp_path = _path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_file, _tmp_path)
+            _tmp_path.chmod(_ENTRY_MODE)
+            _tmp_path.replace(_path)
+        except OSError as _e:
+            _msg = (
+                f"Could not write the rendered output cache in {self.cache_dir}: {_e}"
+            )
+            log.warning(_msg)
+            if _tmp_path.exists():
+                _tmp_path.unlink()
+            return
+
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until the cache fits in max_size.
+
+        Args:
+            None
+
+        Returns:
+            int: The number of entries removed.
+
+        Notes:
+            1. Entries are ordered by modification time, which `fetch` updates.
+            2. The oldest entries are removed while the total size of the
+               entries is over max_size.
+            3. Disk access: reads and deletes files in the cache directory.
+
+        """
+        _stats = [
+            (_path.stat(), _path) for _path in self.cache_dir.glob(f"*{_ENTRY_SUFFIX}")
+        ]
+        _entries = sorted(
+            (_stat.st_mtime, _stat.st_size, _path) for _stat, _path in _stats
+        )
+        _size = sum(_entry_size for _mtime, _entry_size, _path in _entries)
+
+        _count = 0
+        for _mtime, _entry_size, _path in _entries:
+            if _size <= self.max_size:
+                break
+            _path.unlink(missing_ok=True)
+            _size -= _entry_size
+            _count += 1
+
+        if _count:
+            _msg = f"Evicted {_count} rendered outputs from the cache"
+            log.info(_msg)
+        return _count
+
+    def clear(self) -> int:
+        """Remove every cached output.
+
+        Args:
+            None
+
+        Returns:
+            int: The number of entries removed.
+
+        Notes:
+            1. If the cache directory does not exist, nothing is removed.
+            2. Every entry file in the cache directory is deleted.
+            3. Disk access: deletes files in the cache directory.
+
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        _count = 0
+        for _path in self.cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+            _path.unlink(missing_ok=True)
+            _count += 1
+
+        _msg = f"Removed {_count} rendered output cache entries"
+        log.info(_msg)
+        return _count
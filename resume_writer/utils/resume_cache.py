@@ -0,0 +1,191 @@
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from resume_writer.models.parsers import PARSER_VERSION
+from resume_writer.models.resume import Resume
+
+log = logging.getLogger(__name__)
+
+# used when neither --cache-dir nor RESUME_WRITER_CACHE_DIR is given
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "resume_writer"
+
+CACHE_DIR_ENV = "RESUME_WRITER_CACHE_DIR"
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory to use when none is given.
+
+    Args:
+        None
+
+    Returns:
+        Path: The directory named by RESUME_WRITER_CACHE_DIR, or DEFAULT_CACHE_DIR.
+
+    Notes:
+        1. The RESUME_WRITER_CACHE_DIR environment variable is checked first.
+        2. If it is not set, DEFAULT_CACHE_DIR is returned.
+
+    """
+    _env_dir = os.environ.get(CACHE_DIR_ENV)
+    if _env_dir:
+        return Path(_env_dir)
+    return DEFAULT_CACHE_DIR
+
+
+class ParsedResumeCache:
+    """Content-addressed on-disk cache of parsed Resume objects.
+
+    Entries are keyed by a hash of the resume text and PARSER_VERSION, so an
+    edited input or a parser change never returns a stale model.
+
+    Attributes:
+        cache_dir (Path): The directory holding the cached, pickled models.
+
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir (Path): The base cache directory. Parsed models are kept in its "parsed" subdirectory.
+
+        Returns:
+            None
+
+        Notes:
+            1. Validate that cache_dir is a Path.
+            2. Store the "parsed" subdirectory. It is created on the first store.
+
+        """
+        assert isinstance(cache_dir, Path), "cache_dir must be a Path"
+
+        self.cache_dir = cache_dir / "parsed"
+
+    @staticmethod
+    def key(resume_text: str) -> str:
+        """Return the cache key for the resume text.
+
+        Args:
+            resume_text (str): The full text of the input resume.
+
+        Returns:
+            str: A hex SHA-256 digest of PARSER_VERSION and the resume text.
+
+        Notes:
+            1. The parser version and the UTF-8 encoded text are hashed together.
+
+        """
+        assert isinstance(resume_text, str), "resume_text must be a string"
+
+        _hash = hashlib.sha256()
+        _hash.update(PARSER_VERSION.encode())
+        _hash.update(b"\0")
+        _hash.update(resume_text.encode("utf-8"))
+        return _hash.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.cache_dir / f"{key}.pickle"
+
+    def load(self, key: str) -> Resume | None:
+        """Return the cached Resume for the key, if there is one.
+
+        Args:
+            key (str): The cache key, from `key`.
+
+        Returns:
+            Resume | None: The cached Resume, or None on a miss.
+
+        Notes:
+            1. If no entry exists, None is returned.
+            2. The entry is read from disk and unpickled.
+            3. An unreadable or invalid entry is removed and treated as a miss.
+            4. Disk access: reads the cache entry.
+
+        """
+        _path = self._entry_path(key)
+        if not _path.exists():
+            log.debug("Parsed resume cache miss")
+            return None
+
+        try:
+            with _path.open("rb") as _f:
+                _resume = pickle.load(_f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            _msg = f"Discarding unreadable cache entry {_path}"
+            log.exception(_msg)
+            _path.unlink(missing_ok=True)
+            return None
+
+        if not isinstance(_resume, Resume):
+            _msg = f"Discarding cache entry {_path}, it is not a Resume"
+            log.warning(_msg)
+            _path.unlink(missing_ok=True)
+            return None
+
+        log.debug("Parsed resume cache hit")
+        return _resume
+
+    def store(self, key: str, resume: Resume) -> None:
+        """Store a parsed Resume under the key.
+
+        Args:
+            key (str): The cache key, from `key`.
+            resume (Resume): The parsed resume.
+
+        Returns:
+            None
+
+        Notes:
+            1. The cache directory is created if needed.
+            2. The resume is pickled to a temporary file, which is then renamed
+               over the entry so readers never see a partial file.
+            3. If the cache can't be written, a warning is logged and nothing is
+               stored, as `load` treats an unreadable entry as a miss.
+            4. Disk access: writes the cache entry.
+
+        """
+        assert isinstance(resume, Resume), "resume must be a Resume"
+
+        _path = self._entry_path(key)
+        _tmp_path = _path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with _tmp_path.open("wb") as _f:
+                pickle.dump(resume, _f, protocol=pickle.HIGHEST_PROTOCOL)
+            _tmp_path.replace(_path)
+        except OSError as _e:
+            _msg = f"Could not write the parsed resume cache in {self.cache_dir}: {_e}"
+            log.warning(_msg)
+            if _tmp_path.exists():
+                _tmp_path.unlink()
+
+    def clear(self) -> int:
+        """Remove every cached parsed resume.
+
+        Args:
+            None
+
+        Returns:
+            int: The number of entries removed.
+
+        Notes:
+            1. If the cache directory does not exist, nothing is removed.
+            2. Every entry file in the cache directory is deleted.
+            3. Disk access: deletes files in the cache directory.
+
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        _count = 0
+        for _path in self.cache_dir.glob("*.pickle"):
+            _path.unlink(missing_ok=True)
+            _count += 1
+
+        _msg = f"Removed {_count} parsed resume cache entries"
+        log.info(_msg)
+        return _count
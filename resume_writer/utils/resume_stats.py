@@ -1,5 +1,6 @@
 import logging
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
 
 log = logging.getLogger(__name__)
 
@@ -7,18 +8,47 @@ log = logging.getLogger(__name__)
 class DateStats:
     """Provide date-range related statistics.
 
+    Date ranges are merged as they are added, so the merged ranges and the
+    total days of experience are always up to date.
+
     Attributes:
         date_ranges (list[tuple[datetime, datetime]]): A list of date ranges
-            represented as tuples of start and end datetimes.
+            represented as tuples of start and end datetimes, as added.
+        as_of (datetime): The timezone-aware time used as the end of open
+            date ranges. Fixed when the object is created.
     """
 
-    def __init__(self):
+    def __init__(self, as_of: datetime | None = None):
         """Initialize the DateStats class.
 
-        Initializes an empty list to store date ranges.
+        Args:
+            as_of (datetime | None): The end date for open date ranges. If None,
+                the current time is used.
+
+        Notes:
+            1. Store as_of, or the current local time, as a timezone-aware datetime.
+            2. Initialize empty lists for the added and merged date ranges.
+            3. Initialize the total days of experience to 0.
         """
+        if as_of is None:
+            as_of = datetime.now(timezone.utc).astimezone()
+        elif as_of.tzinfo is None:
+            as_of = as_of.astimezone()
+
+        self.as_of = as_of
         self.date_ranges = []
 
+        # merged, non-overlapping ranges, sorted by start (and so by end)
+        self._merged_starts: list[datetime] = []
+        self._merged_ends: list[datetime] = []
+        self._days = 0
+
+    def _open_end_date(self, start_date: datetime) -> datetime:
+        """Return as_of in the same form (naive or aware) as start_date."""
+        if start_date.tzinfo is None:
+            return self.as_of.replace(tzinfo=None)
+        return self.as_of
+
     def add_date_range(
         self,
         start_date: datetime,
@@ -29,29 +59,52 @@ class DateStats:
         Args:
             start_date (datetime): The start date of the range.
             end_date (datetime | None): The end date of the range. If None,
-                the current date is used.
+                as_of is used.
 
         Returns:
             None
 
         Notes:
             1. Validate that start_date is not after end_date.
-            2. If end_date is None, use the current date as end_date.
+            2. If end_date is None, use as_of as end_date.
             3. Append the (start_date, end_date) tuple to the date_ranges list.
+            4. Find the merged ranges which overlap or touch the new range, using
+               bisection on the merged start and end dates.
+            5. Replace them with a single range covering all of them, and update
+               the total days of experience.
         """
         # Check if the start date is before the end date
         if end_date and start_date > end_date:
             raise ValueError("Start date must be before end date")
 
-        _end_date = datetime.now() if end_date is None else end_date  # noqa: DTZ005
+        _end_date = self._open_end_date(start_date) if end_date is None else end_date
 
         self.date_ranges.append((start_date, _end_date))
 
+        # merged ranges [_first, _last) overlap the new range
+        _first = bisect_left(self._merged_ends, start_date)
+        _last = bisect_right(self._merged_starts, _end_date)
+
+        _new_start, _new_end = start_date, _end_date
+        if _first < _last:
+            _new_start = min(_new_start, self._merged_starts[_first])
+            _new_end = max(_new_end, self._merged_ends[_last - 1])
+
+        for _start, _end in zip(
+            self._merged_starts[_first:_last],
+            self._merged_ends[_first:_last],
+        ):
+            self._days -= (_end - _start).days
+
+        self._merged_starts[_first:_last] = [_new_start]
+        self._merged_ends[_first:_last] = [_new_end]
+        self._days += (_new_end - _new_start).days
+
     def merge_date_ranges(self) -> list[tuple[datetime, datetime]]:
-        """Take a list of date ranges, and consolidate them.
+        """Return the date ranges, consolidated.
 
-        This function merges overlapping or adjacent date ranges into a single
-        continuous range.
+        Overlapping or adjacent date ranges are merged into a single
+        continuous range as they are added.
 
         Returns:
             list[tuple[datetime, datetime]]: A list of merged date ranges,
@@ -59,32 +112,13 @@ class DateStats:
 
         Notes:
             1. If no date ranges exist, return an empty list.
-            2. Sort date ranges by start date.
-            3. Initialize the first range as the current range.
-            4. Iterate through the remaining ranges:
-                a. If the current range overlaps with the next range (next start <= current end),
-                   extend the current end date to the maximum of the two.
-                b. Otherwise, add the current range to the merged list and start a new range.
-            5. Add the final current range to the merged list.
-            6. Return the merged ranges.
+            2. Return the merged ranges, sorted by start date.
         """
         if len(self.date_ranges) == 0:
             log.warning("No date ranges to merge")
             return []
 
-        _sorted_ranges = sorted(self.date_ranges, key=lambda x: x[0])
-        _merged_ranges = []
-
-        _current_start_date, _current_end_date = _sorted_ranges[0]
-
-        for _start, _end in _sorted_ranges[1:]:
-            if _start <= _current_end_date:  # overlapping
-                _current_end_date = max(_current_end_date, _end)
-            else:
-                _merged_ranges.append((_current_start_date, _current_end_date))
-                _current_start_date, _current_end_date = _start, _end
-        _merged_ranges.append((_current_start_date, _current_end_date))
-        return _merged_ranges
+        return list(zip(self._merged_starts, self._merged_ends))
 
     @property
     def days_of_experience(self) -> int:
@@ -94,20 +128,10 @@ class DateStats:
             int: The total number of days of experience.
 
         Notes:
-            1. Merge all date ranges using merge_date_ranges.
-            2. Initialize a counter for total days.
-            3. For each merged date range, add the number of days between start and end dates.
-            4. Return the total.
+            1. Return the total, which is kept up to date as ranges are added.
         """
-        _merged_ranges = self.merge_date_ranges()
-
-        _total_days = 0
-
-        for _start, _end in _merged_ranges:
-            _total_days += (_end - _start).days
-
-        assert _total_days >= 0, "_total_experience must be greater than 0"
-        return _total_days
+        assert self._days >= 0, "_total_experience must be greater than 0"
+        return self._days
 
     @property
     def years_of_experience(self) -> float:
@@ -132,16 +156,13 @@ class DateStats:
             float: The span of experience in years, rounded to one decimal place.
 
         Notes:
-            1. Merge all date ranges using merge_date_ranges.
-            2. Get the first start date and the last end date from the merged ranges.
-            3. Calculate the difference between last end and first start.
-            4. Divide by 365.25 to get years.
-            5. Round to one decimal place.
+            1. Get the first start date and the last end date from the merged ranges.
+            2. Calculate the difference between last end and first start.
+            3. Divide by 365.25 to get years.
+            4. Round to one decimal place.
         """
-        _merged_ranges = self.merge_date_ranges()
-
-        _first_date = _merged_ranges[0][0]
-        _last_date = _merged_ranges[-1][1]
+        _first_date = self._merged_starts[0]
+        _last_date = self._merged_ends[-1]
 
         _span = _last_date - _first_date
         _yoe = _span.days / 365.25
@@ -0,0 +1,213 @@
+import logging
+from datetime import datetime, timezone
+
+from resume_writer.models.experience import Roles
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, SkillsMatrix falls back to DateStats
+    np = None
+
+log = logging.getLogger(__name__)
+
+SkillStats = dict[str, tuple[float, datetime | None, datetime | None]]
+
+_SECONDS_PER_DAY = 86400
+
+
+def numpy_available() -> bool:
+    """Return True if NumPy can be imported, and SkillsEngine can be used."""
+    return np is not None
+
+
+def _epoch_day(date: datetime) -> int:
+    """Return the number of whole days from the epoch to the date.
+
+    Naive dates are treated as UTC. Only differences between epoch days are
+    used, so this matches subtracting the datetimes as long as the start dates
+    fall on midnight, as parsed resume dates do.
+    """
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return int(date.timestamp() // _SECONDS_PER_DAY)
+
+
+class SkillsEngine:
+    """Vectorized per-skill experience for a set of roles, using NumPy.
+
+    Roles are encoded as arrays of start and end epoch-days, sorted by start,
+    with a role by skill boolean matrix marking the skills each role lists.
+    Experience for every skill is then computed at once.
+
+    Attributes:
+        skills (list[str]): The skills listed by the roles, in order of first use.
+
+    """
+
+    def __init__(self, roles: Roles, as_of: datetime):
+        """Encode the roles as arrays.
+
+        Args:
+            roles (Roles): The roles to encode.
+            as_of (datetime): The end date used for roles without an end date.
+
+        Returns:
+            None
+
+        Notes:
+            1. NumPy must be available.
+            2. Roles without skills are skipped.
+            3. Each role's start and end dates are converted to epoch-days, using
+               as_of for open roles, in the role's naive or aware form.
+            4. Each skill is given a column, in order of first use, and the
+               columns of the skills a role lists are set in its row.
+            5. The rows are sorted by start date.
+
+        """
+        assert np is not None, "SkillsEngine requires numpy"
+
+        _roles = [_role for _role in roles if _role.skills]
+        _columns: dict[str, int] = {}
+        for _role in _roles:
+            for _skill in _role.skills:
+                _columns.setdefault(_skill, len(_columns))
+
+        self.skills = list(_columns)
+
+        _membership = np.zeros((len(_roles), len(_columns)), dtype=bool)
+        _starts = np.empty(len(_roles), dtype=np.int64)
+        _ends = np.empty(len(_roles), dtype=np.int64)
+        for _row, _role in enumerate(_roles):
+            _start_date = _role.basics.start_date
+            _end_date = _role.basics.end_date
+            if _end_date is None:
+                _end_date = as_of if _start_date.tzinfo else as_of.replace(tzinfo=None)
+            _starts[_row] = _epoch_day(_start_date)
+            _ends[_row] = _epoch_day(_end_date)
+            _membership[_row, [_columns[_skill] for _skill in _role.skills]] = True
+
+        _order = np.argsort(_starts, kind="stable")
+        self._roles = [_roles[_row] for _row in _order]
+        self._starts = _starts[_order]
+        self._ends = _ends[_order]
+        self._membership = _membership[_order]
+        self._columns = _columns
+
+    def _select(self, skills: list[str] | None) -> tuple[list[str], "np.ndarray"]:
+        """Return the known skills among skills, and their membership columns."""
+        if skills is None:
+            skills = self.skills
+        _wanted = [_skill for _skill in skills if _skill in self._columns]
+        _columns = [self._columns[_skill] for _skill in _wanted]
+        return _wanted, self._membership[:, _columns]
+
+    def _days(self, membership: "np.ndarray") -> "np.ndarray":
+        """Return the length in days of the union of each column's date ranges.
+
+        Notes:
+            1. Rows are sorted by start, so the days a row adds to a skill are
+               those after the latest end of the earlier rows using the skill.
+            2. A running maximum down each column gives that latest end.
+            3. The new days of each row are summed per column.
+
+        """
+        _no_end = np.iinfo(np.int64).min
+        _ends = np.where(membership, self._ends[:, None], _no_end)
+        _latest_end = np.maximum.accumulate(_ends, axis=0)
+        # the latest end of the rows before each row
+        _latest_end = np.vstack(
+            [np.full((1, _ends.shape[1]), _no_end), _latest_end[:-1]],
+        )
+
+        _new_from = np.maximum(self._starts[:, None], _latest_end)
+        _new_days = np.clip(self._ends[:, None] - _new_from, 0, None)
+        return np.where(membership, _new_days, 0).sum(axis=0)
+
+    def skill_stats(self, skills: list[str] | None = None) -> SkillStats:
+        """Return years of experience and first and last use for skills.
+
+        Args:
+            skills (list[str] | None): The skills to return. If None, all skills are returned.
+
+        Returns:
+            SkillStats: A dict mapping each skill to a tuple of
+            (years of experience, first used, last used), in the order of skills.
+            Last used is None if a role using the skill has no end date.
+
+        Notes:
+            1. The union lengths of every skill's date ranges are computed at once.
+            2. First used is the start date of the first row using the skill.
+            3. Last used is None if any row using the skill is open, otherwise
+               the end date of the row using the skill that ends last.
+            4. Skills not listed by any role are left out.
+
+        """
+        _wanted, _membership = self._select(skills)
+        if not _wanted:
+            return {}
+
+        _days = self._days(_membership)
+
+        _first_rows = _membership.argmax(axis=0)
+        _open = np.array(
+            [_role.basics.end_date is None for _role in self._roles],
+            dtype=bool,
+        )
+        _any_open = (_membership & _open[:, None]).any(axis=0)
+        _last_rows = np.where(
+            _membership,
+            self._ends[:, None],
+            np.iinfo(np.int64).min,
+        ).argmax(axis=0)
+
+        _stats: SkillStats = {}
+        for _skill, _day_count, _first_row, _last_row, _is_open in zip(
+            _wanted,
+            _days.tolist(),
+            _first_rows.tolist(),
+            _last_rows.tolist(),
+            _any_open.tolist(),
+        ):
+            _last_used = None if _is_open else self._roles[_last_row].basics.end_date
+            _stats[_skill] = (
+                round(_day_count / 365.25, 1),
+                self._roles[_first_row].basics.start_date,
+                _last_used,
+            )
+
+        return _stats
+
+    def skill_spans(self, skills: list[str] | None = None) -> dict[str, float]:
+        """Return the span of use of skills, from first start to last end.
+
+        Args:
+            skills (list[str] | None): The skills to return. If None, all skills are returned.
+
+        Returns:
+            dict[str, float]: A dict mapping each skill to its span in years,
+            rounded to one decimal place, in the order of skills.
+
+        Notes:
+            1. Open roles end at as_of.
+            2. Skills not listed by any role are left out.
+
+        """
+        _wanted, _membership = self._select(skills)
+        if not _wanted:
+            return {}
+
+        _first_starts = np.where(
+            _membership,
+            self._starts[:, None],
+            np.iinfo(np.int64).max,
+        ).min(axis=0)
+        _last_ends = np.where(
+            _membership,
+            self._ends[:, None],
+            np.iinfo(np.int64).min,
+        ).max(axis=0)
+
+        return {
+            _skill: round(_days / 365.25, 1)
+            for _skill, _days in zip(_wanted, (_last_ends - _first_starts).tolist())
+        }
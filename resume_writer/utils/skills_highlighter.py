@@ -0,0 +1,197 @@
+import logging
+from collections.abc import Sequence
+from functools import lru_cache
+
+log = logging.getLogger(__name__)
+
+# number of distinct skill lists kept compiled by compile_skills
+HIGHLIGHTER_CACHE_SIZE = 256
+
+
+class SkillsHighlighter:
+    """A compiled matcher for finding skills in tokenized text.
+
+    Skills are split on whitespace into token sequences and compiled into an
+    Aho-Corasick automaton, so every skill is found in one pass over the tokens.
+    Where skills overlap, the leftmost match wins, and at the same position the
+    longest skill (by characters) wins. Ties go to the skill listed first.
+
+    Attributes:
+        skills (tuple[str, ...]): The skills, in the order they were given.
+
+    """
+
+    def __init__(self, skills: Sequence[str]):
+        """Compile the skills.
+
+        Args:
+            skills (Sequence[str]): The skills to find. Blank skills are ignored.
+
+        Returns:
+            None
+
+        Notes:
+            1. Skills are ranked by length, longest first, keeping the given order for ties.
+            2. Each skill's tokens are added to a trie, marking the final state with the skill's rank.
+            3. Failure links are added breadth first, and each state's matches
+               include those of its failure state.
+
+        """
+        assert all(isinstance(_skill, str) for _skill in skills)
+
+        self.skills = tuple(skills)
+
+        # the longest skills are the most specific
+        _ranked = sorted(
+            (_skill for _skill in self.skills if _skill.strip()),
+            key=len,
+            reverse=True,
+        )
+
+        # the trie: token transitions, failure links, and (rank, token count)
+        # of the skills ending at each state
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[int, int]]] = [[]]
+
+        for _rank, _skill in enumerate(_ranked):
+            self._add(_rank, _skill.split())
+
+        self._link()
+
+    def _add(self, rank: int, tokens: list[str]) -> None:
+        """Add a skill's tokens to the trie."""
+        _state = 0
+        for _token in tokens:
+            _next = self._goto[_state].get(_token)
+            if _next is None:
+                _next = len(self._goto)
+                self._goto[_state][_token] = _next
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            _state = _next
+
+        # the same tokens may be listed twice; the higher ranked skill wins
+        if not self._output[_state]:
+            self._output[_state].append((rank, len(tokens)))
+
+    def _link(self) -> None:
+        """Add failure links to the trie, breadth first."""
+        _queue = list(self._goto[0].values())
+        for _state in _queue:
+            for _token, _next in self._goto[_state].items():
+                _fail = self._fail[_state]
+                while _fail and _token not in self._goto[_fail]:
+                    _fail = self._fail[_fail]
+                _fail_next = self._goto[_fail].get(_token, 0)
+                self._fail[_next] = _fail_next
+                self._output[_next] = self._output[_next] + self._output[_fail_next]
+                _queue.append(_next)
+
+    def _best_matches(self, tokens: Sequence[str]) -> list[tuple[int, int] | None]:
+        """Return the (rank, token count) of the best skill starting at each token."""
+        _best: list[tuple[int, int] | None] = [None] * len(tokens)
+        _state = 0
+        for _ndx, _token in enumerate(tokens):
+            while _state and _token not in self._goto[_state]:
+                _state = self._fail[_state]
+            _state = self._goto[_state].get(_token, 0)
+
+            for _rank, _length in self._output[_state]:
+                _start = _ndx - _length + 1
+                if _best[_start] is None or _rank < _best[_start][0]:
+                    _best[_start] = (_rank, _length)
+
+        return _best
+
+    def match_tokens(self, tokens: Sequence[str]) -> list[tuple[int, int]]:
+        """Return the token spans of the skills found in the tokens.
+
+        Args:
+            tokens (Sequence[str]): The tokens of the text to search.
+
+        Returns:
+            list[tuple[int, int]]: (start, end) token indexes of each skill found,
+            in order, without overlaps. tokens[start:end] are the skill's tokens.
+
+        Notes:
+            1. The tokens are passed through the automaton once, recording the
+               best ranked skill starting at each token.
+            2. Starting at the first token, the best skill starting at each
+               token is taken, and its tokens are skipped.
+
+        """
+        _best = self._best_matches(tokens)
+
+        _spans = []
+        _ndx = 0
+        while _ndx < len(tokens):
+            _match = _best[_ndx]
+            if _match is None:
+                _ndx += 1
+                continue
+            _spans.append((_ndx, _ndx + _match[1]))
+            _ndx += _match[1]
+
+        return _spans
+
+    def fragment_spans(
+        self,
+        text: str,
+        token_spans: Sequence[tuple[int, int]],
+    ) -> list[tuple[int, int, bool]]:
+        """Return the text split into skills and the fragments between them.
+
+        Args:
+            text (str): The text to split.
+            token_spans (Sequence[tuple[int, int]]): The (start, end) character
+                offsets of each token in the text.
+
+        Returns:
+            list[tuple[int, int, bool]]: (start, end, is_skill) character offsets
+            covering the whole text. Each skill is preceded by the fragment
+            before it, which may be empty, and the last entry is the fragment
+            after the last skill.
+
+        Notes:
+            1. The skills are found with match_tokens, using the text of each token.
+            2. A skill runs from the start of its first token to the end of its
+               last, including the whitespace between them.
+
+        """
+        _tokens = [text[_start:_end] for _start, _end in token_spans]
+
+        _fragments = []
+        _position = 0
+        for _first, _last in self.match_tokens(_tokens):
+            _skill_start = token_spans[_first][0]
+            _skill_end = token_spans[_last - 1][1]
+            _fragments.append((_position, _skill_start, False))
+            _fragments.append((_skill_start, _skill_end, True))
+            _position = _skill_end
+
+        _fragments.append((_position, len(text), False))
+        return _fragments
+
+
+@lru_cache(maxsize=HIGHLIGHTER_CACHE_SIZE)
+def compile_skills(skills: tuple[str, ...]) -> SkillsHighlighter:
+    """Return a compiled highlighter for the skills.
+
+    Highlighters are cached, so a role's skills are compiled once and reused
+    for every line and every output format.
+
+    Args:
+        skills (tuple[str, ...]): The skills to find.
+
+    Returns:
+        SkillsHighlighter: The compiled highlighter.
+
+    Notes:
+        1. The highlighter is kept in a bounded LRU cache keyed by the skills.
+
+    """
+    _msg = f"Compiling highlighter for {len(skills)} skills"
+    log.debug(_msg)
+    return SkillsHighlighter(skills)
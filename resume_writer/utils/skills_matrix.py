@@ -1,18 +1,64 @@
 import logging
-from datetime import datetime
+import weakref
+from datetime import datetime, timezone
 from typing import Any
 
 from resume_writer.models.experience import Role, Roles
 from resume_writer.utils.resume_stats import DateStats
+from resume_writer.utils.skills_engine import SkillsEngine, SkillStats, numpy_available
 
 log = logging.getLogger(__name__)
 
+SkillIndex = dict[str, list[tuple[datetime, datetime | None]]]
+
+# inverted skill indexes, built once per Roles object
+_skill_indexes: "weakref.WeakKeyDictionary[Roles, SkillIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def skill_index(roles: Roles) -> SkillIndex:
+    """Return an index of each skill to the date ranges of the roles using it.
+
+    The index is built on first use and cached for the life of the Roles object.
+
+    Args:
+        roles (Roles): The roles to index.
+
+    Returns:
+        SkillIndex: A dict mapping each skill to a list of (start_date, end_date)
+        tuples, one per role listing the skill. Skills are in order of first use.
+
+    Notes:
+        1. If an index has already been built for roles, it is returned.
+        2. Each role with skills is visited once, and its date range is added to
+           the entry for each distinct skill it lists.
+        3. The index is cached against the Roles object.
+
+    """
+    _index = _skill_indexes.get(roles)
+    if _index is not None:
+        return _index
+
+    _index = {}
+    for _role in roles:
+        if not _role.skills:
+            continue
+        _date_range = (_role.basics.start_date, _role.basics.end_date)
+        # a role counts once per skill, even if it lists the skill twice
+        for _skill in dict.fromkeys(_role.skills):
+            _index.setdefault(_skill, []).append(_date_range)
+
+    _skill_indexes[roles] = _index
+    return _index
+
 
 class SkillsMatrix:
     """A matrix of skills, includes years and spans of experience.
 
     Attributes:
         roles (Roles): A collection of Role objects representing the user's work experience.
+        as_of (datetime): The end date used for roles without an end date.
 
     Notes:
         1. The class processes skill data from roles to calculate experience metrics.
@@ -30,10 +76,20 @@ class SkillsMatrix:
 
         Raises:
             AssertionError: If roles is not an instance of Roles or if any role is not a Role instance.
+
+        Notes:
+            1. Validate the roles.
+            2. Fix the current time as the end date for open roles, so every
+               calculation from this matrix agrees.
+            3. Get the inverted skill index for the roles, building it if needed.
+            4. The NumPy skills engine, if available, is built on first use.
         """
         assert isinstance(roles, Roles)
         assert all(isinstance(role, Role) for role in roles)
         self.roles = roles
+        self.as_of = datetime.now(timezone.utc).astimezone()
+        self._skill_index = skill_index(roles)
+        self._engine: SkillsEngine | None = None
 
     def career_experience_total(self) -> float:
         """Return the total years of career experience across all roles.
@@ -48,7 +104,7 @@ class SkillsMatrix:
         """
         assert all(isinstance(role, Role) for role in self.roles)
 
-        _date_stats = DateStats()
+        _date_stats = DateStats(as_of=self.as_of)
         for role in self.roles:
             _date_stats.add_date_range(role.basics.start_date, role.basics.end_date)
 
@@ -69,7 +125,7 @@ class SkillsMatrix:
         """
         assert all(isinstance(role, Role) for role in self.roles)
 
-        _date_stats = DateStats()
+        _date_stats = DateStats(as_of=self.as_of)
         for role in self.roles:
             _date_stats.add_date_range(role.basics.start_date, role.basics.end_date)
         _yoe = _date_stats.span_of_experience
@@ -83,19 +139,31 @@ class SkillsMatrix:
             list: A list of unique skill strings found across all roles.
 
         Notes:
-            1. Initializes an empty list to store unique skills.
-            2. Iterates through each role and adds each skill to the list if not already present.
-            3. Returns the list of unique skills.
+            1. Returns the skills in the inverted skill index, in order of first use.
         """
-        _skills = []
+        return list(self._skill_index)
 
-        for role in self.roles:
-            if role.skills:
-                for skill in role.skills:
-                    if skill not in _skills:
-                        _skills.append(skill)
+    def _years_of_experience(
+        self,
+        date_ranges: list[tuple[datetime, datetime | None]],
+    ) -> float:
+        """Return the years of experience covered by a list of date ranges.
 
-        return _skills
+        Args:
+            date_ranges (list[tuple[datetime, datetime | None]]): The date ranges of the roles using a skill.
+
+        Returns:
+            float: The total years of experience, with overlapping ranges counted once.
+
+        Notes:
+            1. Adds each date range to a DateStats instance, using the matrix's as_of time.
+            2. Returns the total years of experience from the date stats.
+        """
+        _date_stats = DateStats(as_of=self.as_of)
+        for _start_date, _end_date in date_ranges:
+            _date_stats.add_date_range(_start_date, _end_date)
+
+        return _date_stats.years_of_experience
 
     def skill_experience(self, skill: str) -> float:
         """Return the total years of experience with a specific skill.
@@ -107,17 +175,10 @@ class SkillsMatrix:
             float: The total years of experience with the skill across all roles.
 
         Notes:
-            1. Creates a DateStats instance to track date ranges for the skill.
-            2. Iterates through each role and checks if the skill is present.
-            3. If the skill is found, adds the role's date range to the date stats.
-            4. Returns the total years of experience from the date stats.
+            1. Looks up the date ranges for the skill in the inverted skill index.
+            2. Returns the total years of experience for those date ranges.
         """
-        _date_stats = DateStats()
-        for role in self.roles:
-            if skill in role.skills:
-                _date_stats.add_date_range(role.basics.start_date, role.basics.end_date)
-
-        return _date_stats.years_of_experience
+        return self._years_of_experience(self._skill_index.get(skill, []))
 
     def skills_experience(self) -> dict:
         """Return a dictionary mapping each skill to its years of experience.
@@ -126,23 +187,49 @@ class SkillsMatrix:
             dict: A dictionary where keys are skill names and values are float years of experience.
 
         Notes:
-            1. Retrieves the list of unique skills using skills_list.
-            2. For each skill, calculates its years of experience using skill_experience.
-            3. Filters out skills with zero experience.
-            4. Returns the resulting dictionary with only non-zero experience entries.
+            1. For each skill in the inverted skill index, calculates its years of
+               experience, with NumPy if it is available.
+            2. Filters out skills with zero experience.
+            3. Returns the resulting dictionary with only non-zero experience entries.
         """
-        _skills = {}
-
-        # get a list of unique skills
-        _skills_list = self.skills_list()
-        # for each skill, get the years of experience
-        for skill in _skills_list:
-            _skills[skill] = self.skill_experience(skill)
+        _skills = {
+            _skill: _yoe
+            for _skill, (_yoe, _, _) in self._skill_stats(
+                list(self._skill_index),
+            ).items()
+        }
 
         # remove skills with 0 years of experience
-        _skills = {k: v for k, v in _skills.items() if v > 0}
+        return {k: v for k, v in _skills.items() if v > 0}
 
-        return _skills
+    def _skill_stats(self, skills: list[str]) -> SkillStats:
+        """Return years of experience and first and last use for skills.
+
+        Args:
+            skills (list[str]): The skills to return, in order of first use.
+
+        Returns:
+            SkillStats: A dict mapping each skill to a tuple of
+            (years of experience, first used, last used).
+
+        Notes:
+            1. If NumPy is available, every skill is computed at once by the
+               skills engine, which is built on first use.
+            2. Otherwise, each skill's date ranges are merged with DateStats.
+
+        """
+        if numpy_available():
+            if self._engine is None:
+                self._engine = SkillsEngine(self.roles, as_of=self.as_of)
+            return self._engine.skill_stats(skills)
+
+        return {
+            _skill: (
+                self._years_of_experience(self._skill_index[_skill]),
+                *self._date_range(self._skill_index[_skill]),
+            )
+            for _skill in skills
+        }
 
     def matrix(self, skills: list[str]) -> dict:
         """Return a dictionary of skills with years of experience and usage dates.
@@ -161,53 +248,44 @@ class SkillsMatrix:
 
         Notes:
             1. Validates input to ensure skills is a list of strings.
-            2. Retrieves the full list of unique skills from the resume.
-            3. If the skills list is ["*all*"], uses all skills; otherwise, filters to only those present.
-            4. Removes empty strings and skills not found in the resume.
-            5. Returns an empty dict if no valid skills are found.
-            6. For each valid skill, retrieves years of experience and first/last usage dates.
-            7. Constructs the result dictionary with skill data.
-            8. Sorts the result by years of experience in descending order.
-            9. No external I/O (network, disk, or database) is performed.
+            2. If the skills list is ["*all*"], uses all skills; otherwise, removes empty strings.
+            3. Walks the inverted skill index once, skipping skills that were not requested.
+            4. Calculates years of experience and first/last usage dates for the
+               requested skills, with NumPy if it is available. Skills with no
+               experience are skipped.
+            5. Constructs the result dictionary with skill data.
+            6. Sorts the result by years of experience in descending order.
+            7. No external I/O (network, disk, or database) is performed.
         """
         assert isinstance(skills, list)
         assert all(isinstance(skill, str) for skill in skills)
 
-        _all_skills = self.skills_list()
-
-        if len(skills) == 1 and skills[0] == "*all*":
-            _return_skills = _all_skills
-        else:
-            # remove blank lines from skills
-            _return_skills = [x for x in skills if x.strip()]
-            # remove skills that are not in the resume
-            _return_skills = [x for x in _return_skills if x in _all_skills]
-
-        # if no skills are found, return an empty dictionary
-        if not _return_skills:
-            return {}
+        _all_skills = len(skills) == 1 and skills[0] == "*all*"
+        # remove blank lines from skills
+        _return_skills = {x for x in skills if x.strip()}
 
         # create a matrix of skills and years of experience
         _skills_matrix: dict[str, dict[str, Any]] = {}
 
-        # get a list of all the skills and years of experience
-        _all_skills_yoe = self.skills_experience()
+        # only add skills that are in the list of skills to return
+        _skills = [
+            _skill
+            for _skill in self._skill_index
+            if _all_skills or _skill in _return_skills
+        ]
 
-        for _skill, _yoe in _all_skills_yoe.items():
-            # only add skills that are in the list of skills to return
-            if _skill not in _return_skills:
+        for _skill, (_yoe, _first_used, _last_used) in self._skill_stats(
+            _skills,
+        ).items():
+            # skip skills with 0 years of experience
+            if _yoe <= 0:
                 continue
 
-            # add the skill to the matrix
-            _skills_matrix[_skill] = {}
-
-            # add the years of experience to the matrix
-            _skills_matrix[_skill]["yoe"] = _yoe
-
-            # get the first and last usage of the skill
-            _date_range = self.find_skill_date_range(_skill)
-            _skills_matrix[_skill]["first_used"] = _date_range[0]
-            _skills_matrix[_skill]["last_used"] = _date_range[1]
+            _skills_matrix[_skill] = {
+                "yoe": _yoe,
+                "first_used": _first_used,
+                "last_used": _last_used,
+            }
 
         _skills_matrix = dict(
             sorted(
@@ -234,29 +312,40 @@ class SkillsMatrix:
                 - The latest end date the skill was used, or None if not used.
 
         Notes:
-            1. Initializes variables to track the earliest start and latest end dates.
-            2. Collects all start dates from roles where the skill is present.
-            3. Collects all end dates from roles where the skill is present.
-            4. If any start dates exist, finds the earliest and latest end date.
-            5. Returns the earliest and latest dates as a tuple.
-            6. No external I/O (network, disk, or database) is performed.
+            1. Looks up the date ranges for the skill in the inverted skill index.
+            2. Returns the earliest start date and latest end date of those ranges.
+            3. No external I/O (network, disk, or database) is performed.
         """
-        _earliest_start_date = None
-        _last_end_date = None
+        return self._date_range(self._skill_index.get(skill, []))
 
-        # collect the start dates for each role with this skill
-        _start_dates = [
-            role.basics.start_date for role in self.roles if skill in role.skills
-        ]
-        # collect the end dates for each role with this skill
-        _end_dates = [
-            role.basics.end_date for role in self.roles if skill in role.skills
-        ]
+    @staticmethod
+    def _date_range(
+        date_ranges: list[tuple[datetime, datetime | None]],
+    ) -> tuple[datetime | None, datetime | None]:
+        """Return the earliest start date and latest end date of the date ranges.
+
+        Args:
+            date_ranges (list[tuple[datetime, datetime | None]]): The date ranges of the roles using a skill.
+
+        Returns:
+            tuple[datetime | None, datetime | None]: The earliest start and latest end
+            dates, or (None, None) if there are no date ranges. The end date is
+            None if any of the ranges is open.
+
+        Notes:
+            1. If there are no date ranges, returns (None, None).
+            2. If any range has no end date, the skill is still in use, and
+               returns the minimum start date and None.
+            3. Otherwise, returns the minimum start date and maximum end date.
+        """
+        if not date_ranges:
+            return None, None
+
+        _start_dates = [_start_date for _start_date, _ in date_ranges]
+        _end_dates = [_end_date for _, _end_date in date_ranges]
 
-        # find the earliest start date
-        if len(_start_dates) > 0:
-            _earliest_start_date = min(_start_dates)
-            _last_end_date = max(_end_dates)
+        if any(_end_date is None for _end_date in _end_dates):
+            return min(_start_dates), None
 
         # return the first and last usage of the skill
-        return _earliest_start_date, _last_end_date
+        return min(_start_dates), max(_end_dates)
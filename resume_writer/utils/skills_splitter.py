@@ -1,22 +1,38 @@
+import logging
+import os
 import re
+from functools import cache
 
 import nltk
 from nltk.downloader import Downloader
-from nltk.tokenize import sent_tokenize, word_tokenize
+from nltk.tokenize import NLTKWordTokenizer
+from nltk.tokenize.punkt import PunktSentenceTokenizer, PunktTokenizer
+
+from resume_writer.utils.skills_highlighter import compile_skills
+
+log = logging.getLogger(__name__)
+
+# when set, the installed punkt model is never looked for
+NLTK_OFFLINE_ENV = "RESUME_WRITER_NLTK_OFFLINE"
 
 _punctuation_re = re.compile(r"\s+([)\]}.,;:!?])")
 _open_pair_re = re.compile(r"([\(\[\{])\s+")
 
+_word_tokenizer = NLTKWordTokenizer()
+
 
 def download_nltk_data() -> None:
-    """Ensure the nltk data is present.
+    """Download the nltk data used for sentence splitting, if it is missing.
+
+    Rendering never downloads data. This is for setting up an environment.
 
     Notes:
         1. Checks if the 'punkt' NLTK data is installed.
         2. If not installed, downloads 'punkt' data.
         3. Checks if the 'punkt_tab' NLTK data is installed.
         4. If not installed, downloads 'punkt_tab' data.
-        5. This function performs disk access to download required NLTK data.
+        5. Clears the cached sentence tokenizer, so the data is used.
+        6. This function performs network and disk access to download required NLTK data.
     """
     downloader = Downloader()
     if not downloader.is_installed("punkt"):
@@ -24,6 +40,53 @@ def download_nltk_data() -> None:
     if not downloader.is_installed("punkt_tab"):
         nltk.download("punkt_tab")
 
+    _sentence_tokenizer.cache_clear()
+
+
+@cache
+def _sentence_tokenizer() -> PunktSentenceTokenizer:
+    """Return the sentence tokenizer, checking for the punkt data once per process.
+
+    Returns:
+        PunktSentenceTokenizer: The English punkt model if it is installed,
+        otherwise an untrained punkt tokenizer, which needs no data.
+
+    Notes:
+        1. If RESUME_WRITER_NLTK_OFFLINE is set, the untrained tokenizer is used
+           without looking for the data.
+        2. Otherwise the installed English punkt model is loaded.
+        3. If it is not installed, a warning is logged and the untrained tokenizer is used.
+        4. This function performs disk access to load the model. It never downloads it.
+    """
+    if os.environ.get(NLTK_OFFLINE_ENV):
+        log.debug("Using the offline sentence tokenizer")
+        return PunktSentenceTokenizer()
+
+    try:
+        return PunktTokenizer("english")
+    except LookupError:
+        log.warning(
+            "NLTK punkt_tab data is not installed, using the untrained sentence "
+            "tokenizer. Run download_nltk_data() to install it.",
+        )
+        return PunktSentenceTokenizer()
+
+
+def _word_spans(text: str) -> list[tuple[int, int]]:
+    """Return the character span of each word and punctuation token in the text.
+
+    The text is split into sentences, so punctuation ending a sentence is a
+    separate token, then each sentence is split into words.
+    """
+    _spans = []
+    for _sentence_start, _sentence_end in _sentence_tokenizer().span_tokenize(text):
+        _sentence = text[_sentence_start:_sentence_end]
+        _spans.extend(
+            (_sentence_start + _start, _sentence_start + _end)
+            for _start, _end in _word_tokenizer.span_tokenize(_sentence)
+        )
+    return _spans
+
 
 def normalize_sentence_fragment(fragment: str) -> str:
     """Normalize a sentence by removing extra spaces and punctuation.
@@ -58,28 +121,25 @@ def normalize_sentence_fragment(fragment: str) -> str:
     return sentence
 
 
-def nltk_normalize_fragment(fragment: str) -> str:
-    """Use a more advanced detokenizer to reassemble fragments.
+def normalize_fragment_span(text: str, start: int, end: int) -> str:
+    """Return a fragment of text with its spacing normalized.
 
     Args:
-        fragment: The input sentence fragment to normalize.
+        text: The text containing the fragment.
+        start: The offset of the start of the fragment.
+        end: The offset of the end of the fragment.
 
     Returns:
-        The normalized sentence fragment after detokenization and punctuation fixes.
+        The fragment, stripped, with runs of whitespace collapsed to one space.
 
     Notes:
-        1. Strips leading and trailing whitespace from the fragment.
-        2. Uses nltk.sent_tokenize to split the fragment into sentences, taking the first.
-        3. Fixes trailing punctuation by removing extra spaces before punctuation.
-        4. Fixes punctuation spacing after opening pairs (e.g., '(', '[', '{').
-        5. This function performs network access if NLTK data is not present, via nltk.download.
+        1. Collapses the whitespace in the fragment, which also strips it.
+        2. Removes spaces before closing punctuation.
+        3. Removes spaces after opening pairs (e.g., '(', '[', '{').
     """
-    _fragment = fragment.strip()
-    _raw_detokenize = sent_tokenize(_fragment)[0]
-    _fixed_trailing_punctuation = _punctuation_re.sub(r"\1", _raw_detokenize)
-    _fixed_punctuation = _open_pair_re.sub(r"\1", _fixed_trailing_punctuation)
-
-    return _fixed_punctuation
+    _fragment = " ".join(text[start:end].split())
+    _fixed_trailing_punctuation = _punctuation_re.sub(r"\1", _fragment)
+    return _open_pair_re.sub(r"\1", _fixed_trailing_punctuation)
 
 
 def skills_splitter(sentence: str, skills: list[str]) -> list[str]:
@@ -90,84 +150,35 @@ def skills_splitter(sentence: str, skills: list[str]) -> list[str]:
 
     Args:
         sentence: The input sentence to be split.
-        skills: A list of skill strings to search for in the sentence. Skills with more words
-                should be listed first for accurate matching.
+        skills: A list of skill strings to search for in the sentence. Longer skills
+                are preferred where skills overlap.
 
     Returns:
         A list of strings where each element is either a skill or a fragment of text between skills.
 
     Notes:
-        1. Ensures required NLTK data ('punkt', 'punkt_tab') are downloaded if missing.
-        2. Tokenizes the input sentence into individual words and punctuation.
-        3. Sorts the skills by length in descending order to prioritize longer, more specific skills.
-        4. Iterates through each token in the sentence, checking for matches with any skill.
-        5. When a skill is found, adds the current fragment (if any) and the skill to the result.
-        6. Skips over tokens that are part of the matched skill.
-        7. Continues until all tokens are processed.
-        8. Adds any remaining fragment to the result.
-        9. Normalizes each part of the result using nltk_normalize_fragment.
-        10. Returns the final list of normalized fragments and skills.
-        11. This function performs disk access if NLTK data is not present.
+        1. Finds the span of each word and punctuation token in the sentence.
+        2. Gets the compiled highlighter for the skills, which prefers longer, more specific skills.
+        3. Splits the sentence into skill and fragment spans in a single pass.
+        4. Normalizes the spacing of each span. Skills only have their whitespace collapsed.
+        5. Drops fragments which are empty after normalizing.
+        6. Returns the final list of normalized fragments and skills.
+        7. This function performs disk access the first time it is called, to load
+           the NLTK punkt model. It never performs network access.
     """
-    # make sure the nltk data is present
-    # TODO: move this to someplace that isn't called all the time
-    download_nltk_data()
+    _highlighter = compile_skills(tuple(skills))
 
-    # Tokenize the sentence into words and punctuation
-    _sentence_tokens = word_tokenize(sentence)
-
-    # Create a list to store the result
     _result = []
-    _current_fragment: list[str] = []
-
-    # sort the skills by length in reverse order
-    # this should result in more specific to less specific skills
-    _sorted_skills = sorted(skills, key=len, reverse=True)
-
-    _offset = 0
-    for i in range(len(_sentence_tokens)):
-        _ndx = _offset + i
-
-        if _ndx >= len(_sentence_tokens):
-            break
-
-        _match = False
-
-        # Check for multi-word keywords
-        for _skill in _sorted_skills:
-            _skill_tokens = _skill.split()
-            if _sentence_tokens[_ndx : _ndx + len(_skill_tokens)] == _skill_tokens:
-                # we have a match
-
-                # add the current fragment to the result
-                if _current_fragment:
-                    _result.append(" ".join(_current_fragment))
-
-                # add the skill to the result
-                _result.append(" ".join(_skill_tokens))
-
-                # skip any words included in the skill
-                # -1 to account for the first one
-                _offset = _offset + len(_skill_tokens) - 1
-
-                # reset the current fragment
-                _current_fragment = []
-
-                # prevent the sentence token from being added
-                _match = True
-
-                # stop checking skills
-                break
-
-        if not _match:
-            _current_fragment.append(_sentence_tokens[_ndx])
-
-    if _current_fragment:
-        _result.append(" ".join(_current_fragment))
-
-    _final_result = []
-    for _part in _result:
-        _normalized = nltk_normalize_fragment(_part)
-        _final_result.append(_normalized)
-
-    return _final_result
+    for _start, _end, _is_skill in _highlighter.fragment_spans(
+        sentence,
+        _word_spans(sentence),
+    ):
+        if _is_skill:
+            _result.append(" ".join(sentence[_start:_end].split()))
+            continue
+
+        _fragment = normalize_fragment_span(sentence, _start, _end)
+        if _fragment:
+            _result.append(_fragment)
+
+    return _result
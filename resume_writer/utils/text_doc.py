@@ -1,6 +1,6 @@
-import re
 from abc import ABC, abstractmethod
-from typing import Literal
+from collections.abc import Iterable
+from typing import Literal, TextIO
 
 
 class TextDoc(ABC):
@@ -9,10 +9,68 @@ class TextDoc(ABC):
     This abstract base class provides a common interface for different types of text documents.
     It defines the contract for adding text to a document through the `add_text` method.
 
+    Text is kept as a list of chunks. The full text is only joined when the `text`
+    property is read, and `stream_to` writes the chunks without joining them.
+
     Attributes:
-        None
+        text (str): The content of the document, joined from the chunks on access.
     """
 
+    def __init__(self):
+        """Initialize the document with no chunks."""
+        self._chunks: list[str] = []
+
+    def _append(self, text: str) -> None:
+        """Append a chunk of text to the document."""
+        if text:
+            self._chunks.append(text)
+
+    def add_chunks(self, chunks: Iterable[str]) -> None:
+        """Add text to the document as-is, one chunk at a time.
+
+        Args:
+            chunks (Iterable[str]): The chunks of text, e.g. from a Jinja template's `generate`.
+
+        Returns:
+            None
+
+        Notes:
+            1. Each chunk is appended as it is produced, without joining them first.
+        """
+        for _chunk in chunks:
+            self._append(_chunk)
+
+    @property
+    def text(self) -> str:
+        """Return the content of the document.
+
+        Returns:
+            str: The chunks of the document, joined.
+
+        Notes:
+            1. The chunks are joined and replaced by the result, so reading
+               `text` again without adding text does not join them again.
+        """
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def stream_to(self, fileobj: TextIO) -> None:
+        """Write the content of the document to a file object, chunk by chunk.
+
+        Args:
+            fileobj (TextIO): A text file object, or anything with a `write` method taking a string.
+
+        Returns:
+            None
+
+        Notes:
+            1. Each chunk is written in turn, without building the full text.
+            2. Performs whatever I/O fileobj does, typically disk access.
+        """
+        for _chunk in self._chunks:
+            fileobj.write(_chunk)
+
     @abstractmethod
     def add_text(self, text: str, **kwargs) -> None:  # noqa: ANN003
         """Provide abstract method for `add_text` interface.
@@ -46,9 +104,9 @@ class MarkdownDoc(TextDoc):
     def __init__(self):
         """Initialize Markdown document.
 
-        Initializes the text content to an empty string and sets flags to track the document state.
+        Initializes the text content to no chunks and sets flags to track the document state.
         """
-        self.text: str = ""
+        super().__init__()
         self.previous_line_was_header: bool = False
         self.first_line: bool = True
 
@@ -73,35 +131,30 @@ class MarkdownDoc(TextDoc):
 
         Notes:
             1. The input text is split into lines using `\n`.
-            2. Each line is stripped of newline characters.
-            3. If `line_breaks` is "strip" and the line is empty, it is skipped.
-            4. The processed line is appended with a newline.
-            5. If the previous line was a header, a blank line is added before the new text.
-            6. The `previous_line_was_header` flag is updated after processing.
-            7. The `first_line` flag is updated to False after the first addition.
-            8. The processed text is appended to the document's `text` attribute.
+            2. If `line_breaks` is "strip" and the line is empty, it is skipped.
+            3. The processed line is appended with a newline.
+            4. If the previous line was a header, a blank line is added before the new text.
+            5. The `previous_line_was_header` flag is updated after processing.
+            6. The `first_line` flag is updated to False after the first addition.
+            7. The processed text is appended to the document as a single chunk.
         """
         assert isinstance(text, str)
         assert isinstance(line_breaks, str)
         assert line_breaks in ("preserve", "strip")
 
         _lines = text.split("\n")
-        _all_text = ""
-
-        if self.previous_line_was_header:
-            _all_text += "\n"
+        if line_breaks == "strip":
+            _lines = [_line for _line in _lines if _line]
 
-        for _line in _lines:
-            _text = re.sub("\n", "", _line)
-            if not _text and line_breaks == "strip":
-                continue
+        _all_text = "".join(f"{_line}\n" for _line in _lines)
 
-            _all_text += _text + "\n"
+        if self.previous_line_was_header:
+            _all_text = "\n" + _all_text
 
         self.previous_line_was_header = False
         self.first_line = False
 
-        self.text += _all_text
+        self._append(_all_text)
 
     def add_header(self, header: str) -> None:
         """Add a markdown header.
@@ -135,9 +188,9 @@ class HtmlDoc(TextDoc):
     def __init__(self):
         """Initialize HTML document.
 
-        Initializes the text content to an empty string.
+        Initializes the text content to no chunks.
         """
-        self.text: str = ""
+        super().__init__()
 
     def add_text(self, text: str) -> None:
         """Add text to the HTML document.
@@ -151,8 +204,33 @@ class HtmlDoc(TextDoc):
             None: This method modifies the internal state of the object by appending the input text.
 
         Notes:
-            1. The input text is appended directly to the document's `text` attribute.
+            1. The input text is appended directly to the document as a chunk.
             2. No formatting, validation, or transformation is applied to the input.
             3. This method performs no disk, network, or database access.
         """
-        self.text += text
+        self._append(text)
+
+
+class HtmlStreamDoc(HtmlDoc):
+    """HTML document which writes text straight to a file object.
+
+    Nothing is kept in memory, so `text` is always empty. Text added with
+    `add_chunks` is written as each chunk is produced.
+
+    Attributes:
+        fileobj (TextIO): The file object, or socket file, the HTML is written to.
+    """
+
+    def __init__(self, fileobj: TextIO):
+        """Initialize the streaming HTML document.
+
+        Args:
+            fileobj (TextIO): A text file object, or anything with a `write` method taking a string.
+        """
+        super().__init__()
+        self.fileobj = fileobj
+
+    def _append(self, text: str) -> None:
+        """Write a chunk of text to the file object."""
+        if text:
+            self.fileobj.write(text)
@@ -0,0 +1,270 @@
+"""Re-render a resume as it is edited.
+
+`watch` polls the input file and the settings file. When the input changes,
+only its top-level sections (personal, experience, education and
+certifications) whose text changed are parsed again, and the formats are
+re-rendered only if the settings render one of those sections. When the
+settings change, every format is re-rendered from the resume already parsed.
+
+Everything stays loaded between saves, so an update costs one section parse
+and the renders.
+
+"""
+
+import copy
+import hashlib
+import logging
+import time
+from pathlib import Path
+
+from resume_writer.models.parsers import ParseContext
+from resume_writer.models.resume import Resume
+from resume_writer.rendering import load_render_settings, render_formats
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+
+log = logging.getLogger(__name__)
+
+# seconds between checks of the watched files
+DEFAULT_INTERVAL = 0.25
+
+
+def _text_hash(text: str) -> str:
+    """Return a hex SHA-256 digest of the text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _block_hash(block: ParseContext | None) -> str | None:
+    """Return a hash of a section's lines, or None if the section is missing."""
+    if block is None:
+        return None
+    return _text_hash("".join(block.lines))
+
+
+class IncrementalResume:
+    """A resume parsed one top-level section at a time, keeping unchanged sections.
+
+    Attributes:
+        resume (Resume | None): The resume as of the last update, or None before the first.
+
+    """
+
+    def __init__(self):
+        """Initialize with nothing parsed.
+
+        Returns:
+            None
+
+        """
+        self.resume: Resume | None = None
+        self._hashes: dict[str, str | None] = {}
+        self._sections: dict[str, object | None] = {}
+
+    def update(self, resume_text: str) -> set[str]:
+        """Parse the sections of the text which changed since the last update.
+
+        Args:
+            resume_text (str): The full text of the resume.
+
+        Returns:
+            set[str]: The names of the sections which were added, changed or removed.
+
+        Notes:
+            1. The text is split into its top-level sections, as Resume.parse splits it.
+            2. Each section's lines are hashed. A section whose hash differs from
+               the last update's is parsed with its block class; the others keep
+               the objects parsed before.
+            3. A new Resume is made from the sections, so renderers see a
+               consistent resume.
+            4. If a section fails to parse, the error is raised and nothing is
+               updated, so the next update tries that section again.
+
+        """
+        _parse_context = ParseContext(
+            lines=resume_text.splitlines(keepends=True),
+            doc_line_num=0,
+        )
+        _blocks = Resume.parse_blocks(_parse_context)
+        for _block in _blocks.keys() - Resume.expected_blocks().keys():
+            _msg = f"Unexpected block: {_block}"
+            log.error(_msg)
+
+        _hashes = {
+            _name: _block_hash(_blocks.get(_name)) for _name in Resume.block_classes()
+        }
+        _changed = {
+            _name
+            for _name, _hash in _hashes.items()
+            if self.resume is None or _hash != self._hashes[_name]
+        }
+        _sections = {
+            _name: self._parse_section(_name, _blocks.get(_name))
+            if _name in _changed
+            else self._sections[_name]
+            for _name in _hashes
+        }
+
+        self._hashes = _hashes
+        self._sections = _sections
+        self.resume = Resume(
+            parse_context=_parse_context,
+            **{
+                Resume.expected_blocks()[_name]: _section
+                for _name, _section in _sections.items()
+            },
+        )
+        return _changed
+
+    @staticmethod
+    def _parse_section(name: str, block: ParseContext | None) -> object | None:
+        """Parse a top-level section with its block class, or return None if it is missing."""
+        if block is None:
+            return None
+        _msg = f"Parsing the {name} section"
+        log.debug(_msg)
+        return Resume.block_classes()[name].parse(block)
+
+
+class ResumeWatcher:
+    """Re-render a resume's outputs when its input or settings file changes.
+
+    Attributes:
+        input_file (Path): The text resume.
+        settings_file (Path): The TOML settings file.
+        outputs (dict[str, Path]): The output file for each resume type.
+        settings (ResumeRenderSettings | None): The settings as of the last poll.
+
+    """
+
+    def __init__(
+        self,
+        input_file: Path,
+        settings_file: Path,
+        outputs: dict[str, Path],
+    ):
+        """Initialize the watcher. Nothing is read until the first poll.
+
+        Args:
+            input_file (Path): The text resume.
+            settings_file (Path): The TOML settings file.
+            outputs (dict[str, Path]): The output file for each resume type.
+
+        Returns:
+            None
+
+        """
+        self.input_file = input_file
+        self.settings_file = settings_file
+        self.outputs = outputs
+        self.settings: ResumeRenderSettings | None = None
+        self._incremental = IncrementalResume()
+        self._stats: dict[Path, tuple[int, int]] = {}
+        self._text_hashes: dict[Path, str] = {}
+        self._stale = False
+
+    def _changed_text(self, path: Path) -> str | None:
+        """Return the text of the file if its content changed since the last poll."""
+        _stat = path.stat()
+        _key = (_stat.st_mtime_ns, _stat.st_size)
+        if self._stats.get(path) == _key:
+            return None
+        self._stats[path] = _key
+
+        _text = path.read_text(encoding="utf-8")
+        _hash = _text_hash(_text)
+        if self._text_hashes.get(path) == _hash:
+            return None
+        self._text_hashes[path] = _hash
+        return _text
+
+    def _poll_settings(self) -> bool:
+        """Reload the settings if the file changed, returning whether they did."""
+        if self._changed_text(self.settings_file) is None:
+            return False
+
+        _settings = load_render_settings(str(self.settings_file), echo=False)
+        _changed = (
+            self.settings is None or _settings.to_dict() != self.settings.to_dict()
+        )
+        self.settings = _settings
+        return _changed
+
+    def _poll_input(self) -> set[str]:
+        """Parse the changed sections of the input, returning their names."""
+        _text = self._changed_text(self.input_file)
+        if _text is None:
+            return set()
+        return self._incremental.update(_text)
+
+    def poll(self) -> list[Path]:
+        """Check the watched files once, and re-render the outputs that changed.
+
+        Args:
+            None
+
+        Returns:
+            list[Path]: The output files written.
+
+        Notes:
+            1. A file is read only when its modification time or size changed,
+               and counts as changed only when its content did.
+            2. Changed settings are reloaded, and mark the outputs to re-render.
+            3. A changed input has its changed sections parsed again. The
+               outputs are marked to re-render if the settings render any of
+               those sections.
+            4. Each output is rendered with its own copy of the settings, as
+               renderers may change the settings they are given.
+            5. An error loading, parsing or rendering is raised. The outputs
+               stay marked, and are rendered once a watched file changes again.
+            6. Disk access: Reads the watched files, and writes the outputs.
+
+        """
+        _settings_changed = self._poll_settings()
+        self._stale = self._stale or _settings_changed
+        _sections = self._poll_input()
+        if self.settings is None or self._incremental.resume is None:
+            return []
+
+        self._stale = self._stale or bool(_sections & self.settings.rendered_sections())
+        if not self._stale or not (_settings_changed or _sections):
+            return []
+
+        _files = []
+        for _resume_type, _output_file in self.outputs.items():
+            _files += render_formats(
+                self._incremental.resume,
+                copy.deepcopy(self.settings),
+                {_resume_type: _output_file},
+            )
+        self._stale = False
+        return _files
+
+
+def watch(watcher: ResumeWatcher, interval: float = DEFAULT_INTERVAL) -> None:
+    """Poll the watched files until interrupted, reporting each update.
+
+    Args:
+        watcher (ResumeWatcher): The files and outputs to watch.
+        interval (float): The seconds between polls.
+
+    Returns:
+        None
+
+    Notes:
+        1. Each poll is timed, and the outputs it wrote are logged.
+        2. An error is logged, and watching carries on, so a half-edited
+           resume doesn't stop the watch.
+
+    """
+    while True:
+        _start = time.perf_counter()
+        try:
+            _files = watcher.poll()
+        except Exception as _e:  # noqa: BLE001 - keep watching until the file is fixed
+            _msg = f"Could not update the outputs: {type(_e).__name__}: {_e}"
+            log.error(_msg)
+        else:
+            if _files:
+                _names = ", ".join(str(_file) for _file in _files)
+                _msg = f"Updated {_names} in {time.perf_counter() - _start:.2f}s"
+                log.info(_msg)
+        time.sleep(interval)
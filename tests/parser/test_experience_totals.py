@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 from utils.resume_stats import DateStats
 
@@ -57,3 +57,41 @@ def test_overlapping_date_ranges():
 
     # 2 years + 1 month, with a February in there
     assert ds.days_of_experience == 730 + 29
+
+
+def test_fixed_as_of():
+    _as_of = datetime(2021, 3, 1)
+    ds = DateStats(as_of=_as_of)
+    ds.add_date_range(parse_date("03/2020"), None)
+
+    assert ds.days_of_experience == 365
+    assert ds.merge_date_ranges() == [(parse_date("03/2020"), _as_of)]
+
+
+def test_open_range_with_aware_dates():
+    _start = parse_date("03/2020").replace(tzinfo=timezone.utc)
+    ds = DateStats(as_of=datetime(2021, 3, 1, tzinfo=timezone.utc))
+    ds.add_date_range(_start, None)
+    ds.add_date_range(_start, parse_date("06/2020").replace(tzinfo=timezone.utc))
+
+    assert ds.days_of_experience == 365
+
+
+def test_merge_on_insert():
+    ds = DateStats()
+    ds.add_date_range(parse_date("01/2010"), parse_date("01/2011"))
+    ds.add_date_range(parse_date("01/2014"), parse_date("01/2015"))
+    ds.add_date_range(parse_date("01/2012"), parse_date("01/2013"))
+    assert len(ds.merge_date_ranges()) == 3
+
+    # bridges the last two ranges, and touches the first
+    ds.add_date_range(parse_date("01/2011"), parse_date("06/2014"))
+    assert ds.merge_date_ranges() == [(parse_date("01/2010"), parse_date("01/2015"))]
+    assert ds.days_of_experience == 1826
+    assert ds.span_of_experience == 5.0
+
+
+def test_no_date_ranges():
+    ds = DateStats()
+    assert ds.merge_date_ranges() == []
+    assert ds.days_of_experience == 0
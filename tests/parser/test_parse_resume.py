@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from resume_writer.models.resume import Resume
@@ -213,3 +215,59 @@ def test_parse_resume_complete(block_lines):
     _experience = resume.experience
     assert len(_experience.roles) == 2
     assert len(_experience.projects) == 2
+
+
+def test_parse_resume_needed(block_lines):
+    _ctx = ParseContext(lines=block_lines, doc_line_num=1)
+    resume = Resume.parse(
+        parse_context=_ctx,
+        needed={"personal": None, "experience": {"roles": None}},
+    )
+
+    # the other blocks are kept as their lines until they are used
+    assert "education" not in vars(resume)
+    assert "certifications" not in vars(resume)
+    assert "projects" not in vars(resume.experience)
+    assert len(resume.experience.roles) == 2
+
+    assert isinstance(resume.education, Education)
+    assert len(resume.education.degrees) == 2
+    assert resume.education is resume.education
+    assert len(resume.experience.projects) == 2
+
+    with pytest.raises(AttributeError):
+        resume.missing  # noqa: B018
+
+
+def test_parse_resume_needed_pickles(block_lines):
+    _ctx = ParseContext(lines=block_lines, doc_line_num=1)
+    resume = Resume.parse(parse_context=_ctx, needed={"personal": None})
+
+    _copy = pickle.loads(pickle.dumps(resume))
+    assert len(_copy.certifications) == 2
+    assert "certifications" not in vars(resume)
+
+
+def test_parse_resume_lazy_roles(block_lines):
+    _ctx = ParseContext(lines=block_lines, doc_line_num=1)
+    resume = Resume.parse(
+        parse_context=_ctx,
+        needed={
+            "experience": {
+                "roles": {},
+                "projects": {"overview": None, "description": None},
+            },
+        },
+    )
+
+    _role = resume.experience.roles[0]
+    assert "responsibilities" not in vars(_role)
+    assert "basics" not in vars(_role)
+    assert _role.basics.company is not None
+    assert "basics" in vars(_role)
+    assert _role.responsibilities is _role.responsibilities
+
+    _project = resume.experience.projects[0]
+    assert "overview" in vars(_project)
+    assert "skills" not in vars(_project)
+    assert _project.skills is not None
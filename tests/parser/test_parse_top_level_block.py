@@ -63,3 +63,13 @@ def test_top_level_blocks_empty_lines():
     _ctx = ParseContext(lines=lines, doc_line_num=1)
     dummy = DummyClass.parse_blocks(parse_context=_ctx)
     assert dummy == {}
+
+
+def test_parse_blocks_views_share_lines(block_lines):
+    _ctx = ParseContext(lines=block_lines, doc_line_num=1)
+    _blocks = DummyClass.parse_blocks(_ctx)
+    _section = _blocks["section 2"]
+    assert _section._buffer is block_lines
+    assert (_section.start, _section.stop, _section.depth) == (5, 8, 1)
+    assert len(_section) == 3
+    assert list(_section) == ["Line 3", "# Subheader", "Line 4"]
@@ -1,4 +1,10 @@
-from resume_writer.utils.skills_splitter import skills_splitter
+from nltk.tokenize.punkt import PunktSentenceTokenizer
+
+from resume_writer.utils.skills_splitter import (
+    NLTK_OFFLINE_ENV,
+    _sentence_tokenizer,
+    skills_splitter,
+)
 
 
 def test_single_skill():
@@ -86,3 +92,32 @@ def test_fragment_with_skill_and_parenthesis():
     expected = ["This tests (parenthesis) (", "Python", ") in sentences"]
     _split = skills_splitter(sentence, skills)
     assert _split == expected
+
+
+def test_contraction_is_kept():
+    sentence = "I don't avoid Java."
+    skills = ["Java"]
+    expected = ["I don't avoid", "Java", "."]
+    assert skills_splitter(sentence, skills) == expected
+
+
+def test_multiple_sentences():
+    sentence = "Used Python daily.  Taught Spring\nBoot to others."
+    skills = ["Python", "Spring Boot"]
+    expected = ["Used", "Python", "daily. Taught", "Spring Boot", "to others."]
+    assert skills_splitter(sentence, skills) == expected
+
+
+def test_offline_sentence_tokenizer(monkeypatch):
+    monkeypatch.setenv(NLTK_OFFLINE_ENV, "1")
+    _sentence_tokenizer.cache_clear()
+    try:
+        assert type(_sentence_tokenizer()) is PunktSentenceTokenizer
+        assert _sentence_tokenizer() is _sentence_tokenizer()
+        assert skills_splitter("I know Python.", ["Python"]) == [
+            "I know",
+            "Python",
+            ".",
+        ]
+    finally:
+        _sentence_tokenizer.cache_clear()
@@ -3,6 +3,7 @@ from datetime import datetime
 import pytest
 
 from unittest.mock import Mock, MagicMock, patch
+import docx
 import docx.document
 from docx.table import Table, _Rows, _Row
 
@@ -239,3 +240,37 @@ def test_render_skills_matrix_section_one_no_skills(
     )
 
     section.render()
+
+
+def test_add_skills_table(experience, settings):
+    _document = docx.Document()
+    section = RenderSkillsMatrixSection(
+        document=_document,
+        experience=experience,
+        settings=settings,
+        parse_context=Mock(spec=ParseContext),
+    )
+    _table = section.add_skills_table(
+        {
+            f"skill{_ndx}": {
+                "yoe": 1.0,
+                "first_used": datetime(2020, 1, 1),  # noqa: DTZ001
+                "last_used": None,
+            }
+            for _ndx in range(301)
+        },
+    )
+
+    assert len(_table.rows) == 152
+    assert [_cell.text for _cell in _table.rows[1].cells] == [
+        "skill0",
+        "1.0 (2020 - N/A)",
+        "skill1",
+        "1.0 (2020 - N/A)",
+    ]
+    assert [_cell.text for _cell in _table.rows[-1].cells] == [
+        "skill300",
+        "1.0 (2020 - N/A)",
+        "",
+        "",
+    ]
@@ -0,0 +1,80 @@
+import io
+import logging
+import time
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import docx
+import pytest
+
+from resume_writer.rendering import parse_text_resume, render_docx
+from resume_writer.resume_render.docx_package import (
+    ZIP_EPOCH,
+    normalize_zip,
+    pinned_timestamp,
+    save_docx,
+)
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+
+test_resume = Path(__file__).parent.parent / "test_resume.md"
+
+
+def test_pinned_timestamp(monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    assert pinned_timestamp() == ZIP_EPOCH
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    assert pinned_timestamp() == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+    assert pinned_timestamp() == ZIP_EPOCH
+
+
+def test_normalize_zip():
+    _buffer = io.BytesIO()
+    with zipfile.ZipFile(_buffer, "w") as _zip:
+        _zip.writestr("b.xml", "<b/>")
+        _zip.writestr("a.xml", "<a/>")
+
+    _package = normalize_zip(_buffer.getvalue(), ZIP_EPOCH)
+    with zipfile.ZipFile(io.BytesIO(_package)) as _zip:
+        assert [_info.filename for _info in _zip.infolist()] == ["b.xml", "a.xml"]
+        assert {_info.date_time for _info in _zip.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        assert _zip.read("a.xml") == b"<a/>"
+
+
+def test_save_docx_deterministic(monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+
+    _packages = []
+    for _ndx in range(2):
+        # zip entries are stamped with the time they are written
+        monkeypatch.setattr(time, "time", lambda _ndx=_ndx: 1700000000 + _ndx * 3600)
+        _document = docx.Document()
+        _document.add_paragraph("text")
+        _document.core_properties.revision = 7
+        _buffer = io.BytesIO()
+        save_docx(_document, _buffer, deterministic=True)
+        _packages.append(_buffer.getvalue())
+
+    assert _packages[0] == _packages[1]
+    _properties = docx.Document(io.BytesIO(_packages[0])).core_properties
+    assert _properties.revision == 1
+    assert _properties.modified == ZIP_EPOCH
+
+
+@pytest.mark.parametrize("resume_type", ["plain", "ats"])
+def test_render_docx_deterministic(
+    tmp_path: Path, caplog, monkeypatch, resume_type: str
+):
+    caplog.set_level(logging.WARNING)
+    _resume = parse_text_resume(str(test_resume))
+    _settings = ResumeRenderSettings()
+    _settings.deterministic_docx = True
+
+    _first = render_docx(resume_type, _resume, _settings, tmp_path / "first.docx")
+    monkeypatch.setattr(time, "time", lambda: 1700000000)
+    _second = render_docx(resume_type, _resume, _settings, tmp_path / "second.docx")
+
+    assert _first.read_bytes() == _second.read_bytes()
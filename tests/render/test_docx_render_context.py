@@ -0,0 +1,66 @@
+import gc
+import weakref
+from unittest.mock import patch
+
+import docx
+
+from resume_writer.resume_render.docx_context import (
+    DocxRenderContext,
+    docx_render_context,
+)
+from resume_writer.resume_render.resume_render_base import RenderBase
+
+
+def test_context_is_shared_per_document():
+    _document = docx.Document()
+    _context = docx_render_context(_document)
+
+    assert docx_render_context(_document) is _context
+    assert docx_render_context(docx.Document()) is not _context
+    assert RenderBase(_document).context is _context
+    assert _context.normal_style.font.name == "Calibri Light"
+    assert _context.font_size == 12
+
+
+def test_sections_do_not_reinitialize_styles():
+    _document = docx.Document()
+    RenderBase(_document)
+
+    with patch.object(DocxRenderContext, "__init__") as _init:
+        for _ndx in range(3):
+            assert RenderBase(_document).font_size == 12
+    _init.assert_not_called()
+
+
+def test_set_font_size():
+    _document = docx.Document()
+    _context = docx_render_context(_document)
+    _context.set_font_size(10)
+
+    assert _context.font_size == 10
+    assert RenderBase(_document).font_size == 10
+
+
+def test_hyperlinks_share_relationships():
+    _document = docx.Document()
+    _section = RenderBase(_document)
+
+    _paragraph = _document.add_paragraph()
+    _first = _section.add_hyperlink(_paragraph, "one", "https://example.com")
+    _second = _section.add_hyperlink(_paragraph, "two", "https://example.com")
+    _other = _section.add_hyperlink(_paragraph, "three", "https://example.org")
+
+    _r_id = docx.oxml.shared.qn("r:id")
+    assert _first.get(_r_id) == _second.get(_r_id)
+    assert _first.get(_r_id) != _other.get(_r_id)
+    assert len(_document.part.rels) == len(docx.Document().part.rels) + 2
+    assert "Hyperlink" in _document.styles
+
+
+def test_context_is_freed_with_document():
+    _document = docx.Document()
+    _context = weakref.ref(docx_render_context(_document))
+
+    del _document
+    gc.collect()
+    assert _context() is None
@@ -0,0 +1,113 @@
+import logging
+from pathlib import Path
+
+import docx
+
+from resume_writer.rendering import parse_text_resume
+from resume_writer.resume_render.docx_runs import add_runs, add_runs_fast, coalesce_runs
+from resume_writer.resume_render.plain.experience_section import _highlight_runs
+from resume_writer.resume_render.plain.resume_main import RenderResume
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+
+test_resume = Path(__file__).parent.parent / "test_resume.md"
+
+_runs = [
+    (["Built it with "], False),
+    ([" ", "Spring Boot", " "], True),
+    (["and"], False),
+    (["Java"], True),
+    ([""], False),
+    ([], False),
+]
+
+
+def test_add_runs_fast_matches_add_runs():
+    _document = docx.Document()
+    _slow = _document.add_paragraph("start")
+    add_runs(_slow, _runs)
+    _fast = _document.add_paragraph("start")
+    add_runs_fast(_fast, _runs)
+
+    assert _fast._p.xml == _slow._p.xml  # noqa: SLF001
+    assert _fast.text == "startBuilt it with  Spring Boot andJava"
+    assert [_run.bold for _run in _fast.runs] == [
+        None,
+        None,
+        True,
+        None,
+        True,
+        None,
+        None,
+    ]
+
+
+def test_highlight_runs():
+    _fragments = ["Used (", "Python", "), ", "Java", " and ", "Go", ""]
+    assert _highlight_runs(_fragments, ["Python", "Java", "Go"]) == [
+        (["Used ("], False),
+        (["Python"], True),
+        (["), "], False),
+        ([" ", "Java", " "], True),
+        ([" and "], False),
+        ([" ", "Go", " "], True),
+        ([""], False),
+    ]
+
+
+def test_fast_docx_renders_same_document(caplog):
+    caplog.set_level(logging.WARNING)
+    _resume = parse_text_resume(str(test_resume))
+
+    _documents = []
+    for _fast_docx in (False, True):
+        _settings = ResumeRenderSettings()
+        _settings.fast_docx = _fast_docx
+        _document = docx.Document()
+        RenderResume(_document, _resume, _settings).render()
+        _documents.append(_document.element.xml)
+
+    assert _documents[0] == _documents[1]
+    assert "Skill 1" in _documents[1]
+
+
+def test_coalesce_runs():
+    _document = docx.Document()
+    _paragraph = _document.add_paragraph()
+    add_runs(_paragraph, _runs)
+    _paragraph.add_run("\tend").add_break()
+    _paragraph.add_run()
+    _text = _paragraph.text
+
+    # the last four runs have no properties: "", no text, "\tend\n" and empty
+    assert coalesce_runs(_document) == 3
+    assert _paragraph.text == _text
+    assert [(_run.text, _run.bold) for _run in _paragraph.runs] == [
+        ("Built it with ", None),
+        (" Spring Boot ", True),
+        ("and", None),
+        ("Java", True),
+        ("\tend\n", None),
+    ]
+    _t = _paragraph.runs[1]._r.findall(docx.oxml.ns.qn("w:t"))  # noqa: SLF001
+    assert len(_t) == 1
+    assert _t[0].get(docx.oxml.ns.qn("xml:space")) == "preserve"
+
+    # nothing left to merge
+    assert coalesce_runs(_document) == 0
+
+
+def test_coalesce_runs_keeps_other_content():
+    _document = docx.Document()
+    _paragraph = _document.add_paragraph()
+    _paragraph.add_run("one ")
+    _paragraph._p.append(docx.oxml.OxmlElement("w:bookmarkStart"))  # noqa: SLF001
+    _paragraph.add_run("two ")
+    _paragraph.add_run("three").italic = True
+    _table = _document.add_table(rows=1, cols=1)
+    _cell_paragraph = _table.rows[0].cells[0].paragraphs[0]
+    _cell_paragraph.add_run("a")
+    _cell_paragraph.add_run("b")
+
+    assert coalesce_runs(_document) == 1
+    assert [_run.text for _run in _paragraph.runs] == ["one ", "two ", "three"]
+    assert [_run.text for _run in _cell_paragraph.runs] == ["ab"]
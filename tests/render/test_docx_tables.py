@@ -0,0 +1,28 @@
+import docx
+from docx.enum.table import WD_ALIGN_VERTICAL
+
+from resume_writer.resume_render.docx_tables import add_text_table
+
+
+def test_add_text_table():
+    _document = docx.Document()
+    _table = add_text_table(
+        _document,
+        ["Skill", "YOE", "Skill", "YOE"],
+        [["a", "1", "b", "2"], ["c", "3"]],
+        centered_columns=(0, 2),
+    )
+
+    assert [[_cell.text for _cell in _row.cells] for _row in _table.rows] == [
+        ["Skill", "YOE", "Skill", "YOE"],
+        ["a", "1", "b", "2"],
+        ["c", "3", "", ""],
+    ]
+    assert all(_run.bold for _run in _table.rows[0].cells[0].paragraphs[0].runs)
+    assert [_cell.vertical_alignment for _cell in _table.rows[2].cells] == [
+        WD_ALIGN_VERTICAL.CENTER,
+        None,
+        None,
+        None,
+    ]
+    assert _table.autofit
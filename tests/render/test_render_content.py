@@ -0,0 +1,50 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from resume_writer.rendering import parse_text_resume
+from resume_writer.resume_render.render_content import (
+    executive_summary,
+    recent_roles,
+    responsibility_lines,
+    skills_matrix,
+)
+
+test_resume = Path(__file__).parent.parent / "test_resume.md"
+
+
+@pytest.fixture
+def resume(caplog):
+    caplog.set_level(logging.WARNING)
+    return parse_text_resume(str(test_resume))
+
+
+def test_recent_roles(resume):
+    _roles = resume.experience.roles
+
+    assert recent_roles(_roles, 0) == list(_roles)
+    assert recent_roles(_roles, None) == list(_roles)
+    assert recent_roles(_roles, "0") is recent_roles(_roles, 0)
+
+    # every role in the test resume ended years ago, except a current one
+    _current = [_role for _role in _roles if _role.basics.end_date is None]
+    assert recent_roles(_roles, 1) == _current
+    assert recent_roles(_roles, 12 * 100) == list(_roles)
+
+
+def test_results_are_shared(resume):
+    _experience = resume.experience
+
+    _summary = executive_summary(_experience, ["Worker"])
+    assert executive_summary(_experience, ["Worker"]) is _summary
+    assert executive_summary(_experience, ["Other"]) is not _summary
+
+    _matrix = skills_matrix(_experience.roles, ["*all*"])
+    assert skills_matrix(_experience.roles, ["*all*"]) is _matrix
+    assert "Skill 1" in _matrix
+
+
+def test_responsibility_lines():
+    assert responsibility_lines("one\n\ntwo\nthree") == ["one", "two", "three"]
+    assert responsibility_lines("one") == ["one"]
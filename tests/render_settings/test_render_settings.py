@@ -310,3 +310,33 @@ def test_education_settings_render_at_end_false_from_dict():
     _education_settings.render_at_end = True  # Set to True first
     _education_settings.update_from_dict({"render_at_end": False})
     assert _education_settings.render_at_end is False
+
+
+def test_render_settings_to_dict():
+    """Test that to_dict covers the sections and their settings."""
+    _settings = ResumeRenderSettings()
+    _settings.update_from_dict({"education": False, "font_size": 10})
+    _dict = _settings.to_dict()
+    assert _dict["education"] is False
+    assert _dict["personal"] is True
+    assert _dict["font_size"] == 10
+    assert _dict["section"]["education"]["render_at_end"] is False
+
+
+def test_render_settings_parse_plan():
+    """Test that only the rendered sections are planned for parsing."""
+    _settings = ResumeRenderSettings()
+    assert _settings.parse_plan() == dict.fromkeys(
+        ["personal", "education", "certifications", "experience"],
+    )
+    _settings.update_from_dict({"education": False, "experience": False})
+    assert _settings.parse_plan() == {
+        "personal": None,
+        "certifications": None,
+        "experience": {"roles": None},
+    }
+    _settings.update_from_dict({"experience": True, "lazy_parse": True})
+    assert _settings.parse_plan()["experience"] == {
+        "roles": {},
+        "projects": {"overview": None, "description": None},
+    }
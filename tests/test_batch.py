@@ -0,0 +1,13 @@
+from pathlib import Path
+
+from resume_writer.batch import batch_inputs
+
+
+def test_batch_inputs(tmp_path: Path):
+    for _name in ("a.md", "b.md", "c.txt"):
+        (tmp_path / _name).write_text("")
+    _manifest = tmp_path / "manifest.txt"
+    _manifest.write_text("# inputs\nc.txt\n\na.md\n")
+
+    _inputs = batch_inputs((str(tmp_path / "*.md"), str(tmp_path / "none*")), _manifest)
+    assert _inputs == [tmp_path / "a.md", tmp_path / "b.md", tmp_path / "c.txt"]
@@ -0,0 +1,60 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from resume_writer.utils.date_parser import parse_date
+
+
+@pytest.fixture(autouse=True)
+def clear_date_cache():
+    parse_date.cache_clear()
+    yield
+    parse_date.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "date_string",
+    [
+        "01/2020",
+        "1/2020",
+        "January 2020",
+        "jan 2020",
+        "Jan. 2020",
+        "2020-01",
+        " 01/2020 ",
+    ],
+)
+def test_parse_date_common_formats(date_string):
+    with patch("resume_writer.utils.date_parser._fallback_parser") as mock_fallback:
+        assert parse_date(date_string) == datetime(2020, 1, 1)
+    mock_fallback.assert_not_called()
+
+
+def test_parse_date_sept():
+    assert parse_date("Sept 2021") == datetime(2021, 9, 1)
+
+
+def test_parse_date_falls_back_to_dateparser():
+    assert parse_date("2020-01-15") == datetime(2020, 1, 15)
+    assert parse_date("15 March 2019") == datetime(2019, 3, 15)
+
+
+def test_parse_date_invalid_month_falls_back():
+    with patch("resume_writer.utils.date_parser._fallback_parser") as mock_fallback:
+        mock_fallback.return_value.get_date_data.return_value.date_obj = None
+        assert parse_date("13/2020") is None
+        assert parse_date("Smarch 2020") is None
+    assert mock_fallback.call_count == 2
+
+
+def test_parse_date_not_a_date():
+    assert parse_date("not a date") is None
+
+
+def test_parse_date_is_cached():
+    parse_date("02/2020")
+    parse_date("02/2020")
+    _info = parse_date.cache_info()
+    assert _info.hits == 1
+    assert _info.misses == 1
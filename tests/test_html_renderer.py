@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from resume_writer.rendering import parse_text_resume
+from resume_writer.renderers.html_renderer import RenderResumeHtml, jinja_environment
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+
+test_resume = Path(__file__).parent / "test_resume.md"
+
+
+def test_jinja_environment_is_shared():
+    _resume = parse_text_resume(str(test_resume))
+    _first = RenderResumeHtml(resume=_resume, settings=ResumeRenderSettings())
+    _second = RenderResumeHtml(resume=_resume, settings=ResumeRenderSettings())
+
+    assert _first.jinja_env is _second.jinja_env
+    assert _first.jinja_env is jinja_environment()
+    assert not _first.jinja_env.auto_reload
+
+
+def test_jinja_templates_are_precompiled():
+    _env = jinja_environment()
+    _template = _env.get_template("roles.j2")
+    assert _env.get_template("roles.j2") is _template
+    assert len(_env.cache) == len(_env.list_templates(extensions=["j2"]))
+
+
+def test_jinja_bytecode_cache(tmp_path: Path):
+    _bytecode_dir = tmp_path / "jinja"
+    _resume = parse_text_resume(str(test_resume))
+    _renderer = RenderResumeHtml(
+        resume=_resume,
+        settings=ResumeRenderSettings(),
+        bytecode_cache_dir=_bytecode_dir,
+    )
+
+    assert _renderer.jinja_env is jinja_environment(_bytecode_dir)
+    assert _renderer.jinja_env is not jinja_environment()
+    assert len(list(_bytecode_dir.iterdir())) == len(
+        _renderer.jinja_env.list_templates(extensions=["j2"]),
+    )
+
+    _renderer.render()
+    assert "<" in _renderer.content()
+
+
+def test_stream_to_matches_render():
+    _resume = parse_text_resume(str(test_resume))
+    _renderer = RenderResumeHtml(resume=_resume, settings=ResumeRenderSettings())
+    _renderer.render()
+
+    _chunks = []
+
+    class _Writer:
+        def write(self, text: str) -> None:
+            _chunks.append(text)
+
+    _streaming = RenderResumeHtml(resume=_resume, settings=ResumeRenderSettings())
+    _streaming.stream_to(_Writer())
+
+    assert len(_chunks) > 1
+    assert "".join(_chunks) == _renderer.content()
+    assert not _streaming.rendered
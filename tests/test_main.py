@@ -0,0 +1,241 @@
+import io
+import json
+from pathlib import Path
+
+import docx
+import pytest
+from click.testing import CliRunner
+
+from resume_writer.main import main, render_outputs
+from resume_writer.renderers.html_renderer import RenderResumeHtml
+from resume_writer.renderers.markdown_renderer import RenderResumeMarkdown
+from resume_writer.rendering import (
+    DEFAULT_HTML_FILE,
+    output_paths,
+    parse_text_resume,
+    render_formats,
+    render_to_stream,
+)
+from resume_writer.resume_render.plain.resume_main import (
+    RenderResume as PlainRenderResume,
+)
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+
+test_resume = Path(__file__).parent / "test_resume.md"
+settings_file = (
+    Path(__file__).parent.parent / "setting_files" / "settings_full_resume.toml"
+)
+
+
+def test_output_paths(tmp_path: Path):
+    assert output_paths("in/resume.md", ["plain", "html", "markdown"], tmp_path) == {
+        "plain": tmp_path / "resume_plain.docx",
+        "html": tmp_path / "resume_html.html",
+        "markdown": tmp_path / "resume_markdown.md",
+    }
+
+
+def test_render_outputs_single_type(tmp_path: Path):
+    _output_file = str(tmp_path / "out.docx")
+    assert render_outputs("resume.md", _output_file, None, ["ats"]) == {
+        "ats": Path(_output_file),
+    }
+    assert render_outputs("resume.md", _output_file, None, ["html"]) == {
+        "html": DEFAULT_HTML_FILE,
+    }
+
+
+def test_render_outputs_several_types(tmp_path: Path):
+    _output_file = str(tmp_path / "docs" / "out.docx")
+    _outputs = render_outputs("resume.md", _output_file, None, ["ats", "html", "ats"])
+    assert _outputs == {
+        "ats": tmp_path / "docs" / "resume_ats.docx",
+        "html": tmp_path / "docs" / "resume_html.html",
+    }
+    assert (tmp_path / "docs").is_dir()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_render_formats(tmp_path: Path, jobs: int):
+    _resume = parse_text_resume(str(test_resume))
+    _outputs = output_paths(str(test_resume), ["plain", "html", "markdown"], tmp_path)
+
+    _files = render_formats(_resume, ResumeRenderSettings(), _outputs, jobs=jobs)
+
+    assert _files == list(_outputs.values())
+    assert all(_file.stat().st_size > 0 for _file in _files)
+
+
+def test_render_requires_resume_type(tmp_path: Path):
+    _result = CliRunner().invoke(
+        main,
+        [str(test_resume), "--settings-file", str(settings_file), "--no-cache"],
+    )
+    assert _result.exit_code != 0
+    assert "At least one --resume-type is required" in _result.output
+
+
+def test_render_several_types(tmp_path: Path):
+    _result = CliRunner().invoke(
+        main,
+        [
+            str(test_resume),
+            "--settings-file",
+            str(settings_file),
+            "--resume-type",
+            "html",
+            "--resume-type",
+            "markdown",
+            "--output-dir",
+            str(tmp_path),
+            "--jobs",
+            "2",
+            "--no-cache",
+        ],
+    )
+    assert _result.exit_code == 0, _result.output
+    assert sorted(_path.name for _path in tmp_path.iterdir()) == [
+        "test_resume_html.html",
+        "test_resume_markdown.md",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("resume_type", "start"),
+    [("plain", b"PK"), ("html", b"<"), ("markdown", b"Name: John Doe")],
+)
+def test_render_to_stdout(resume_type: str, start: bytes):
+    _result = CliRunner().invoke(
+        main,
+        [
+            str(test_resume),
+            "--settings-file",
+            str(settings_file),
+            "--resume-type",
+            resume_type,
+            "--output-file",
+            "-",
+            "--no-cache",
+        ],
+    )
+    assert _result.exit_code == 0, _result.output
+    assert _result.stdout_bytes.lstrip().startswith(start)
+
+
+def test_render_to_stdout_single_type():
+    _result = CliRunner().invoke(
+        main,
+        [
+            str(test_resume),
+            "--settings-file",
+            str(settings_file),
+            "--resume-type",
+            "plain",
+            "--resume-type",
+            "ats",
+            "--output-file",
+            "-",
+            "--no-cache",
+        ],
+    )
+    assert _result.exit_code != 0
+    assert "takes a single --resume-type" in _result.output
+
+
+def test_render_to_bytes():
+    _resume = parse_text_resume(str(test_resume))
+    _settings = ResumeRenderSettings()
+
+    _docx = PlainRenderResume(docx.Document(), _resume, _settings).render_to_bytes()
+    assert _docx.startswith(b"PK")
+    assert docx.Document(io.BytesIO(_docx)).paragraphs
+
+    _html = RenderResumeHtml(_resume, _settings).render_to_bytes().decode("utf-8")
+    assert "Skill 1" in _html
+    _markdown = RenderResumeMarkdown(_resume, _settings)
+    assert "Skill 1" in _markdown.render_to_bytes().decode("utf-8")
+
+
+def test_render_to_bytes_repeats():
+    _resume = parse_text_resume(str(test_resume))
+    _settings = ResumeRenderSettings()
+    _settings.deterministic_docx = True
+
+    _plain = PlainRenderResume(docx.Document(), _resume, _settings)
+    _docx = _plain.render_to_bytes()
+    assert _plain.render_to_bytes() == _docx
+    assert not _plain.document.paragraphs
+
+    _markdown = RenderResumeMarkdown(_resume, _settings)
+    _markdown.render()
+    _text = _markdown.render_to_bytes()
+    assert _markdown.render_to_bytes() == _text
+    assert _text.decode("utf-8") == _markdown.content()
+
+
+def test_render_to_bytes_matches_cli_settings():
+    _resume = parse_text_resume(str(test_resume))
+    _settings = ResumeRenderSettings()
+    _settings.update_from_dict({"coalesce_runs": True, "deterministic_docx": True})
+
+    _stream = io.BytesIO()
+    render_to_stream("plain", _resume, _settings, _stream)
+    _docx = PlainRenderResume(docx.Document(), _resume, _settings).render_to_bytes()
+    assert _docx == _stream.getvalue()
+
+
+bad_resume = """# Experience
+
+## Roles
+
+### Role
+
+#### Basics
+Company: Example Corp.
+Title: Engineer
+Start date: not a date
+"""
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_batch(tmp_path: Path, jobs: int):
+    _inputs = tmp_path / "inputs"
+    _inputs.mkdir()
+    (_inputs / "good.md").write_text(test_resume.read_text())
+    (_inputs / "bad.md").write_text(bad_resume)
+    (_inputs / "sub").mkdir()
+    (_inputs / "sub" / "good.md").write_text(test_resume.read_text())
+
+    _output_dir = tmp_path / "out"
+    _result = CliRunner().invoke(
+        main,
+        [
+            "batch",
+            str(_inputs / "**" / "*.md"),
+            "--settings-file",
+            str(settings_file),
+            "--resume-type",
+            "ats",
+            "--resume-type",
+            "markdown",
+            "--output-dir",
+            str(_output_dir),
+            "--jobs",
+            str(jobs),
+            "--no-cache",
+        ],
+    )
+    assert _result.exit_code == 1, _result.output
+    assert "Rendered 1 of 3 resumes, 2 failed" in _result.output
+
+    _lines = (_output_dir / "batch_report.jsonl").read_text().splitlines()
+    _records = {_record["input"]: _record for _record in map(json.loads, _lines)}
+    assert _records[str(_inputs / "good.md")]["status"] == "ok"
+    assert _records[str(_inputs / "good.md")]["outputs"] == [
+        str(_output_dir / "good_ats.docx"),
+        str(_output_dir / "good_markdown.md"),
+    ]
+    assert _records[str(_inputs / "bad.md")]["status"] == "error"
+    assert "would overwrite" in _records[str(_inputs / "sub" / "good.md")]["error"]
+    assert all("seconds" in _record for _record in _records.values())
+    assert (_output_dir / "good_ats.docx").stat().st_size > 0
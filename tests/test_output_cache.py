@@ -0,0 +1,148 @@
+import os
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from resume_writer.main import main
+from resume_writer.rendering import parse_text_resume, render_formats
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+from resume_writer.utils.output_cache import RenderedOutputCache
+
+test_resume = Path(__file__).parent / "test_resume.md"
+settings_file = (
+    Path(__file__).parent.parent / "setting_files" / "settings_full_resume.toml"
+)
+
+resume_text = "# Personal\n"
+
+
+def test_key_depends_on_inputs(monkeypatch):
+    _settings = ResumeRenderSettings()
+    _key = RenderedOutputCache.key(resume_text, _settings, "plain")
+
+    assert RenderedOutputCache.key(resume_text, ResumeRenderSettings(), "plain") == _key
+    assert RenderedOutputCache.key(resume_text + "\n", _settings, "plain") != _key
+    assert RenderedOutputCache.key(resume_text, _settings, "ats") != _key
+
+    _settings.font_size = 10
+    assert RenderedOutputCache.key(resume_text, _settings, "plain") != _key
+
+    monkeypatch.setattr(
+        "resume_writer.utils.output_cache.package_version",
+        lambda: "test",
+    )
+    assert RenderedOutputCache.key(resume_text, ResumeRenderSettings(), "plain") != _key
+
+
+def test_store_and_fetch(tmp_path: Path):
+    _cache = RenderedOutputCache(tmp_path / "cache")
+    _output = tmp_path / "out.docx"
+    assert not _cache.fetch("key", _output)
+
+    _output.write_bytes(b"rendered")
+    _cache.store("key", _output)
+    _output.unlink()
+
+    assert _cache.fetch("key", _output)
+    assert _output.read_bytes() == b"rendered"
+
+
+def test_fetch_hardlink(tmp_path: Path):
+    _cache = RenderedOutputCache(tmp_path / "cache", hardlink=True)
+    _output = tmp_path / "out.docx"
+    _output.write_bytes(b"rendered")
+    _cache.store("key", _output)
+
+    assert _cache.fetch("key", _output)
+    assert _output.stat().st_nlink == 2
+    assert _output.stat().st_mode & 0o222 == 0
+
+
+def test_render_replaces_hardlinked_outputs(tmp_path: Path):
+    _cache = RenderedOutputCache(tmp_path / "cache", hardlink=True)
+    _outputs = {"html": tmp_path / "resume.html", "plain": tmp_path / "resume.docx"}
+    for _resume_type, _output in _outputs.items():
+        _output.write_bytes(b"cached")
+        _cache.store(_resume_type, _output)
+        assert _cache.fetch(_resume_type, _output)
+
+    render_formats(
+        parse_text_resume(str(test_resume)),
+        ResumeRenderSettings(),
+        _outputs,
+    )
+
+    # the outputs were replaced, and the cache entries left alone
+    for _resume_type, _output in _outputs.items():
+        assert _output.stat().st_nlink == 1
+        assert _output.read_bytes() != b"cached"
+        assert (_cache.cache_dir / f"{_resume_type}.output").read_bytes() == b"cached"
+
+
+def test_store_unwritable_cache_dir(tmp_path: Path, caplog):
+    _blocker = tmp_path / "blocker"
+    _blocker.write_text("a file, not a directory")
+    _cache = RenderedOutputCache(_blocker / "cache")
+    _output = tmp_path / "out.docx"
+    _output.write_bytes(b"rendered")
+
+    _cache.store("key", _output)
+    assert "Could not write the rendered output cache" in caplog.text
+    assert not _cache.fetch("key", tmp_path / "other.docx")
+
+
+def test_disabled(tmp_path: Path):
+    _cache = RenderedOutputCache(tmp_path / "cache", max_size=0)
+    _output = tmp_path / "out.docx"
+    _output.write_bytes(b"rendered")
+    _cache.store("key", _output)
+
+    assert not _cache.fetch("key", _output)
+    assert not _cache.cache_dir.exists()
+
+
+def test_evicts_least_recently_used(tmp_path: Path):
+    _cache = RenderedOutputCache(tmp_path / "cache", max_size=35)
+    _output = tmp_path / "out"
+    for _ndx, _key in enumerate(["one", "two", "three"]):
+        _output.write_bytes(b"0123456789")
+        _cache.store(_key, _output)
+        os.utime(_cache.cache_dir / f"{_key}.output", (_ndx, _ndx))
+
+    # "one" is used, so "two" is the oldest
+    assert _cache.fetch("one", _output)
+    _cache.store("four", _output)
+
+    assert sorted(_path.stem for _path in _cache.cache_dir.iterdir()) == [
+        "four",
+        "one",
+        "three",
+    ]
+    assert _cache.clear() == 3
+
+
+def test_render_uses_output_cache(tmp_path: Path):
+    _args = [
+        str(test_resume),
+        "--settings-file",
+        str(settings_file),
+        "--resume-type",
+        "plain",
+        "--resume-type",
+        "html",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+    _result = CliRunner().invoke(main, _args)
+    assert _result.exit_code == 0, _result.output
+    _files = sorted((tmp_path / "out").iterdir())
+    _contents = [_file.read_bytes() for _file in _files]
+    assert len(list((tmp_path / "cache" / "rendered").iterdir())) == 2
+
+    for _file in _files:
+        _file.unlink()
+    _result = CliRunner().invoke(main, _args)
+    assert _result.exit_code == 0, _result.output
+    assert [_file.read_bytes() for _file in _files] == _contents
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import pytest
+
+from resume_writer.models.parsers import ParseContext
+from resume_writer.models.resume import Resume
+from resume_writer.utils.resume_cache import (
+    CACHE_DIR_ENV,
+    DEFAULT_CACHE_DIR,
+    ParsedResumeCache,
+    default_cache_dir,
+)
+
+resume_text = """# Personal
+
+## Contact Information
+Name: John Doe
+
+# Certifications
+
+## Certification
+Name: BigCorp Certified Widget Expert
+Issued: 03/2020
+"""
+
+
+@pytest.fixture
+def resume():
+    _ctx = ParseContext(lines=resume_text.splitlines(keepends=True), doc_line_num=0)
+    return Resume.parse(_ctx)
+
+
+def test_key_depends_on_text():
+    assert ParsedResumeCache.key(resume_text) == ParsedResumeCache.key(resume_text)
+    assert ParsedResumeCache.key(resume_text) != ParsedResumeCache.key(
+        resume_text + "\n"
+    )
+
+
+def test_key_depends_on_parser_version(monkeypatch):
+    _key = ParsedResumeCache.key(resume_text)
+    monkeypatch.setattr("resume_writer.utils.resume_cache.PARSER_VERSION", "test")
+    assert ParsedResumeCache.key(resume_text) != _key
+
+
+def test_load_miss(tmp_path):
+    _cache = ParsedResumeCache(cache_dir=tmp_path)
+    assert _cache.load(_cache.key(resume_text)) is None
+
+
+def test_store_and_load(tmp_path, resume):
+    _cache = ParsedResumeCache(cache_dir=tmp_path)
+    _key = _cache.key(resume_text)
+    _cache.store(_key, resume)
+
+    _cached = _cache.load(_key)
+    assert isinstance(_cached, Resume)
+    assert _cached.personal.contact_info.name == "John Doe"
+    assert [*_cached.certifications][0].issued == [*resume.certifications][0].issued
+    assert [*_cache.cache_dir.iterdir()] == [_cache.cache_dir / f"{_key}.pickle"]
+
+
+def test_load_discards_corrupt_entry(tmp_path):
+    _cache = ParsedResumeCache(cache_dir=tmp_path)
+    _key = _cache.key(resume_text)
+    _cache.cache_dir.mkdir(parents=True)
+    _entry = _cache.cache_dir / f"{_key}.pickle"
+    _entry.write_bytes(b"not a pickle")
+
+    assert _cache.load(_key) is None
+    assert not _entry.exists()
+
+
+def test_load_discards_non_resume_entry(tmp_path):
+    _cache = ParsedResumeCache(cache_dir=tmp_path)
+    _key = _cache.key(resume_text)
+    _cache.cache_dir.mkdir(parents=True)
+    _entry = _cache.cache_dir / f"{_key}.pickle"
+    _entry.write_bytes(b"\x80\x04K\x01.")  # pickled int
+
+    assert _cache.load(_key) is None
+    assert not _entry.exists()
+
+
+def test_store_unwritable_cache_dir(tmp_path, resume, caplog):
+    _blocker = tmp_path / "blocker"
+    _blocker.write_text("a file, not a directory")
+    _cache = ParsedResumeCache(cache_dir=_blocker / "cache")
+    _key = _cache.key(resume_text)
+
+    _cache.store(_key, resume)
+    assert "Could not write the parsed resume cache" in caplog.text
+    assert _cache.load(_key) is None
+
+
+def test_clear(tmp_path, resume):
+    _cache = ParsedResumeCache(cache_dir=tmp_path)
+    assert _cache.clear() == 0
+
+    _cache.store(_cache.key(resume_text), resume)
+    _cache.store(_cache.key("other"), resume)
+    assert _cache.clear() == 2
+    assert _cache.load(_cache.key(resume_text)) is None
+
+
+def test_default_cache_dir(monkeypatch):
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    assert default_cache_dir() == DEFAULT_CACHE_DIR
+    monkeypatch.setenv(CACHE_DIR_ENV, "/tmp/resume_cache")
+    assert default_cache_dir() == Path("/tmp/resume_cache")
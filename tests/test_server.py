@@ -0,0 +1,160 @@
+import asyncio
+import io
+import json
+from pathlib import Path
+
+import docx
+import pytest
+
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+from resume_writer.server import (
+    RenderServer,
+    RequestError,
+    WarmResumes,
+    load_profiles,
+    render_request_from_json,
+)
+
+test_resume = Path(__file__).parent / "test_resume.md"
+settings_file = (
+    Path(__file__).parent.parent / "setting_files" / "settings_full_resume.toml"
+)
+
+
+async def _send(reader, writer, request: bytes) -> tuple[int, bytes]:
+    writer.write(request)
+    await writer.drain()
+    writer.write_eof()
+    _response = await reader.read()
+    writer.close()
+    _head, _body = _response.split(b"\r\n\r\n", 1)
+    return int(_head.split()[1]), _body
+
+
+def _post(path: str, body: dict | bytes) -> bytes:
+    _body = body if isinstance(body, bytes) else json.dumps(body).encode()
+    _head = f"POST {path} HTTP/1.1\r\nContent-Length: {len(_body)}\r\n\r\n"
+    return _head.encode() + _body
+
+
+def test_load_profiles():
+    _profiles = load_profiles((str(settings_file), f"summary={settings_file}"))
+    assert list(_profiles) == ["settings_full_resume", "summary"]
+    assert all(isinstance(_p, ResumeRenderSettings) for _p in _profiles.values())
+
+
+def test_warm_resumes():
+    _resumes = WarmResumes(None, size=1)
+    _text = test_resume.read_text()
+    _resume = _resumes.resume(_text)
+    assert _resumes.resume(_text) is _resume
+    _resumes.resume(_text + "\n")
+    assert _resumes.resume(_text) is not _resume
+
+
+def test_render_request_settings():
+    _resume = test_resume.read_text()
+
+    def _request(settings: object) -> bytes:
+        return json.dumps(
+            {"resume": _resume, "resume_type": "html", "settings": settings},
+        ).encode()
+
+    _request_settings = render_request_from_json(
+        _request({"font_size": 10, "section": {"education": {"gpa": False}}}),
+        {},
+    ).settings
+    assert _request_settings.font_size == 10
+    assert _request_settings.education_settings.gpa is False
+
+    for _settings in (
+        ["font_size"],
+        {"personal_settings": "x"},
+        {"section": {"education": "x"}},
+        {"section": {"nothing": {}}},
+        {"font_size": [10]},
+    ):
+        with pytest.raises(RequestError):
+            render_request_from_json(_request(_settings), {})
+
+
+def test_serve_tcp():
+    _profiles = load_profiles((f"full={settings_file}",))
+    _resume = test_resume.read_text()
+
+    async def _run() -> list[tuple[int, bytes]]:
+        _server = RenderServer(_profiles, None, jobs=1)
+        _listener = await _server.start("127.0.0.1", 0)
+        _port = _listener.sockets[0].getsockname()[1]
+        _requests = [
+            b"GET /health HTTP/1.1\r\n\r\n",
+            _post(
+                "/render",
+                {"resume": _resume, "resume_type": "plain", "profile": "full"},
+            ),
+            _post("/render", {"resume": _resume, "resume_type": "markdown"}),
+            _post("/render", {"resume": _resume, "resume_type": "pdf"}),
+            _post("/render", {"resume": _resume, "resume_type": "ats", "profile": "x"}),
+            _post("/render", b"not json"),
+            b"GET /render HTTP/1.1\r\n\r\n",
+            b"GET /nothing HTTP/1.1\r\n\r\n",
+            b"POST /render HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+            b"POST /render HTTP/1.1\r\nContent-Length: -5\r\n\r\n",
+            b"POST /render HTTP/1.1\r\nContent-Length: 100\r\n\r\n{}",
+        ]
+        try:
+            return [
+                await _send(
+                    *await asyncio.open_connection("127.0.0.1", _port), _request
+                )
+                for _request in _requests
+            ]
+        finally:
+            _listener.close()
+            _server.close()
+
+    _responses = asyncio.run(_run())
+    assert [_status for _status, _body in _responses] == [
+        200,
+        200,
+        200,
+        400,
+        400,
+        400,
+        405,
+        404,
+        400,
+        400,
+        400,
+    ]
+    assert json.loads(_responses[0][1])["profiles"] == ["full"]
+    _document = docx.Document(io.BytesIO(_responses[1][1]))
+    assert "John Doe" in _document.paragraphs[0].text
+    assert b"John Doe" in _responses[2][1]
+    assert "unknown resume type" in json.loads(_responses[3][1])["error"]
+
+
+def test_serve_unix_socket(tmp_path: Path):
+    _socket = tmp_path / "render.sock"
+    _resume = test_resume.read_text()
+
+    async def _run() -> tuple[int, bytes]:
+        _server = RenderServer({}, tmp_path / "cache", jobs=1)
+        _listener = await _server.start("", 0, socket_path=_socket)
+        try:
+            _request = _post(
+                "/render",
+                {
+                    "resume": _resume,
+                    "resume_type": "html",
+                    "settings": {"skills_matrix": False},
+                },
+            )
+            return await _send(*await asyncio.open_unix_connection(_socket), _request)
+        finally:
+            _listener.close()
+            _server.close()
+
+    _status, _body = asyncio.run(_run())
+    assert _status == 200
+    assert b"John Doe" in _body
@@ -0,0 +1,56 @@
+from resume_writer.utils.skills_highlighter import SkillsHighlighter, compile_skills
+from resume_writer.utils.skills_splitter_revamped import (
+    skills_splitter as skills_splitter_revamped,
+)
+
+
+def test_match_tokens():
+    _highlighter = SkillsHighlighter(["Python", "Java"])
+    _tokens = ["I", "know", "Python", "and", "Java", "."]
+    assert _highlighter.match_tokens(_tokens) == [(2, 3), (4, 5)]
+    assert _highlighter.match_tokens([]) == []
+
+
+def test_match_tokens_prefers_longest_skill():
+    _highlighter = SkillsHighlighter(["Spring", "Spring Boot", "Boot"])
+    _tokens = ["Spring", "Boot", "and", "Spring", "."]
+    assert _highlighter.match_tokens(_tokens) == [(0, 2), (3, 4)]
+
+
+def test_match_tokens_overlapping_skills():
+    # the leftmost match wins, even if a longer skill starts inside it
+    _highlighter = SkillsHighlighter(["Google Cloud", "Cloud Storage Transfer"])
+    _tokens = ["Google", "Cloud", "Storage", "Transfer"]
+    assert _highlighter.match_tokens(_tokens) == [(0, 2)]
+
+    # a failed partial match still finds the skills inside it
+    _highlighter = SkillsHighlighter(["a b c", "b", "c d"])
+    assert _highlighter.match_tokens(["a", "b", "x", "c", "d"]) == [(1, 2), (3, 5)]
+
+
+def test_match_tokens_ignores_blank_skills():
+    _highlighter = SkillsHighlighter(["", " ", "Python"])
+    assert _highlighter.match_tokens(["Python", "3"]) == [(0, 1)]
+
+
+def test_fragment_spans():
+    _text = "Used Spring\nBoot (daily)"
+    _token_spans = [(0, 4), (5, 11), (12, 16), (17, 18), (18, 23), (23, 24)]
+    _highlighter = SkillsHighlighter(["Spring Boot", "daily"])
+    assert _highlighter.fragment_spans(_text, _token_spans) == [
+        (0, 5, False),
+        (5, 16, True),
+        (16, 18, False),
+        (18, 23, True),
+        (23, 24, False),
+    ]
+
+
+def test_compile_skills_is_cached():
+    assert compile_skills(("Python", "Java")) is compile_skills(("Python", "Java"))
+
+
+def test_skills_splitter_revamped():
+    _sentence = "Built it with Spring\r\nBoot and Java."
+    _result = skills_splitter_revamped(_sentence, ["Java", "Spring Boot"])
+    assert _result == ["Built it with ", "Spring\nBoot", " and ", "Java", "."]
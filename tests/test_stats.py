@@ -8,7 +8,8 @@ from resume_writer.models.experience import (
     Roles,
 )
 
-from resume_writer.utils.skills_matrix import SkillsMatrix
+from resume_writer.utils import skills_engine
+from resume_writer.utils.skills_matrix import SkillsMatrix, skill_index
 
 from resume_writer.models.parsers import ParseContext
 
@@ -124,3 +125,70 @@ def test_skills_matrix_matrix(roles: Roles):
             "last_used": datetime(2024, 1, 1, 0, 0).astimezone(pytz.utc),
         },
     }
+
+
+def test_skills_matrix_matrix_filters_skills(roles: Roles):
+    _skills_matrix = SkillsMatrix(roles)
+    _matrix = _skills_matrix.matrix(["Skill 3", "", "Skill 1", "Not a skill"])
+    assert list(_matrix) == ["Skill 1", "Skill 3"]
+    assert _skills_matrix.matrix(["Not a skill"]) == {}
+
+
+def test_skills_matrix_all_skills(roles: Roles):
+    _matrix = SkillsMatrix(roles).matrix(["*all*"])
+    assert list(_matrix) == ["Skill 1", "Skill 2", "Skill 4", "Skill 3"]
+
+
+def test_skills_matrix_find_skill_date_range(roles: Roles):
+    _skills_matrix = SkillsMatrix(roles)
+    assert _skills_matrix.find_skill_date_range("Not a skill") == (None, None)
+    assert _skills_matrix.skill_experience("Not a skill") == 0
+
+
+def test_skill_index_built_once_per_roles(roles: Roles):
+    _index = skill_index(roles)
+    assert SkillsMatrix(roles)._skill_index is _index
+    assert list(_index) == SkillsMatrix(roles).skills_list()
+
+
+def test_skills_matrix_without_numpy(roles: Roles, monkeypatch: pytest.MonkeyPatch):
+    _expected = SkillsMatrix(roles).matrix(["*all*"])
+
+    monkeypatch.setattr(skills_engine, "np", None)
+    assert not skills_engine.numpy_available()
+    _skills_matrix = SkillsMatrix(roles)
+    assert _skills_matrix.matrix(["*all*"]) == _expected
+    assert _skills_matrix._engine is None
+
+
+def test_skills_engine(roles: Roles):
+    pytest.importorskip("numpy")
+    _skills_matrix = SkillsMatrix(roles)
+    _engine = skills_engine.SkillsEngine(roles, as_of=_skills_matrix.as_of)
+
+    assert _engine.skills == _skills_matrix.skills_list()
+    assert _engine.skill_stats(["Skill 3", "Not a skill"]) == {
+        "Skill 3": (
+            1.0,
+            datetime(2023, 1, 1, tzinfo=pytz.utc),
+            datetime(2024, 1, 1, tzinfo=pytz.utc),
+        ),
+    }
+    assert _engine.skill_spans(["Skill 1", "Skill 4"]) == {
+        "Skill 1": 3.6,
+        "Skill 4": 2.0,
+    }
+    for _skill, (_yoe, _first_used, _last_used) in _engine.skill_stats().items():
+        assert _yoe == _skills_matrix._years_of_experience(
+            _skills_matrix._skill_index[_skill],
+        )
+        assert (_first_used, _last_used) == _skills_matrix.find_skill_date_range(_skill)
+
+
+def test_skills_matrix_open_role_has_no_last_used(roles: Roles):
+    _roles = list(roles)
+    _roles[0].basics.end_date = None
+
+    _matrix = SkillsMatrix(roles).matrix(["Skill 1", "Skill 4"])
+    assert _matrix["Skill 1"]["last_used"] is None
+    assert _matrix["Skill 4"]["last_used"] == datetime(2022, 6, 1, tzinfo=pytz.utc)
@@ -0,0 +1,74 @@
+import io
+
+from resume_writer.utils import html_doc, markdown_doc
+from resume_writer.utils.text_doc import HtmlDoc, HtmlStreamDoc, MarkdownDoc
+
+
+def test_markdown_doc_add_text():
+    _doc = MarkdownDoc()
+    assert _doc.text == ""
+
+    _doc.add_text("one\n\ntwo\n")
+    _doc.add_text("three\n\n", line_breaks="preserve")
+    assert _doc.text == "one\ntwo\nthree\n\n\n"
+
+
+def test_markdown_doc_after_header():
+    _doc = MarkdownDoc()
+    _doc.previous_line_was_header = True
+    _doc.add_text("\n")
+    assert _doc.text == "\n"
+    assert not _doc.previous_line_was_header
+
+
+def test_html_doc_text_is_joined_once():
+    _doc = HtmlDoc()
+    for _ndx in range(3):
+        _doc.add_text(f"<p>{_ndx}</p>")
+    _doc.add_text("")
+
+    assert _doc.text == "<p>0</p><p>1</p><p>2</p>"
+    assert _doc._chunks == ["<p>0</p><p>1</p><p>2</p>"]
+
+    _doc.add_text("<p>3</p>")
+    assert _doc.text == "<p>0</p><p>1</p><p>2</p><p>3</p>"
+
+
+def test_stream_to():
+    _doc = HtmlDoc()
+    _doc.add_text("<h1>")
+    _doc.add_text("Name")
+    _doc.add_text("</h1>")
+
+    _out = io.StringIO()
+    _doc.stream_to(_out)
+    assert _out.getvalue() == _doc.text
+
+
+def test_older_docs():
+    _markdown = markdown_doc.MarkdownDoc()
+    _markdown.add_text("\n# Header\n\n")
+    _markdown.add_text("text\n")
+    assert _markdown.text == "\n# Header\ntext"
+
+    _html = html_doc.HtmlDoc()
+    _html.add_text("<p>")
+    _html.add_text("</p>")
+    assert _html.text == "<p></p>"
+
+
+def test_add_chunks():
+    _doc = HtmlDoc()
+    _doc.add_chunks(iter(["<p>", "", "text", "</p>"]))
+    assert _doc._chunks == ["<p>", "text", "</p>"]
+    assert _doc.text == "<p>text</p>"
+
+
+def test_html_stream_doc():
+    _out = io.StringIO()
+    _doc = HtmlStreamDoc(_out)
+    _doc.add_text("<h1>Experience</h1>")
+    _doc.add_chunks(["<p>", "text", "</p>"])
+
+    assert _out.getvalue() == "<h1>Experience</h1><p>text</p>"
+    assert _doc.text == ""
@@ -0,0 +1,110 @@
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from resume_writer.resume_render.render_settings import ResumeRenderSettings
+from resume_writer.watch import IncrementalResume, ResumeWatcher
+
+test_resume = Path(__file__).parent / "test_resume.md"
+settings_file = (
+    Path(__file__).parent.parent / "setting_files" / "settings_full_resume.toml"
+)
+
+
+def _save(path: Path, text: str) -> None:
+    path.write_text(text)
+    # make sure the watcher sees a new modification time
+    _stat = path.stat()
+    os.utime(path, ns=(_stat.st_atime_ns, _stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_incremental_resume(caplog):
+    caplog.set_level(logging.WARNING)
+    _text = test_resume.read_text()
+    _incremental = IncrementalResume()
+
+    assert _incremental.update(_text) == {
+        "personal",
+        "education",
+        "experience",
+        "certifications",
+    }
+    _first = _incremental.resume
+    assert _incremental.update(_text) == set()
+
+    assert _incremental.update(_text.replace("University of Example", "Example U")) == {
+        "education",
+    }
+    _second = _incremental.resume
+    assert _second is not _first
+    assert _second.experience is _first.experience
+    assert _second.personal is _first.personal
+    assert _second.education.degrees[0].school == "Example U"
+
+    assert _incremental.update(_text.split("# Certifications")[0]) == {
+        "education",
+        "experience",
+        "certifications",
+    }
+    assert _incremental.resume.experience is None
+
+
+def test_rendered_sections():
+    _settings = ResumeRenderSettings()
+    assert _settings.rendered_sections() == {
+        "personal",
+        "education",
+        "experience",
+        "certifications",
+    }
+    _settings.update_from_dict({"education": False, "experience": False})
+    assert _settings.rendered_sections() == {"personal", "experience", "certifications"}
+    _settings.update_from_dict({"executive_summary": False, "skills_matrix": False})
+    assert _settings.rendered_sections() == {"personal", "certifications"}
+
+
+def test_resume_watcher(tmp_path: Path, caplog):
+    caplog.set_level(logging.WARNING)
+    _input = tmp_path / "resume.md"
+    _settings = tmp_path / "settings.toml"
+    _text = test_resume.read_text()
+    _save(_input, _text)
+    _save(_settings, settings_file.read_text())
+    _outputs = {
+        "ats": tmp_path / "resume_ats.docx",
+        "markdown": tmp_path / "resume_markdown.md",
+    }
+    _watcher = ResumeWatcher(_input, _settings, _outputs)
+
+    assert _watcher.poll() == list(_outputs.values())
+    assert "Another Company" in _outputs["markdown"].read_text()
+    assert _watcher.poll() == []
+
+    # the same content saved again
+    _save(_input, _text)
+    assert _watcher.poll() == []
+
+    _save(
+        _settings,
+        settings_file.read_text().replace("education = true", "education = false"),
+    )
+    assert _watcher.poll() == list(_outputs.values())
+
+    # education isn't rendered any more
+    _save(_input, _text.replace("University of Example", "Example U"))
+    assert _watcher.poll() == []
+
+    _save(_input, _text.replace("Another Company", "Changed Company"))
+    assert _watcher.poll() == list(_outputs.values())
+    assert "Changed Company" in _outputs["markdown"].read_text()
+
+    # a broken save is reported once, and rendered when fixed
+    _save(_input, _text.replace("Start date: 01/2023", "Start date: not a date"))
+    with pytest.raises(AttributeError):
+        _watcher.poll()
+    assert _watcher.poll() == []
+    _save(_input, _text)
+    assert _watcher.poll() == list(_outputs.values())
+    assert "Changed Company" not in _outputs["markdown"].read_text()